@@ -0,0 +1,4 @@
+__all__ = ['Cipher', 'Hash', 'Protocol', 'PublicKey', 'Util', 'Signature',
+           'IO', 'Math']
+
+version_info = (3, 4, 7)
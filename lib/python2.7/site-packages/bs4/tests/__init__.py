@@ -0,0 +1 @@
+"The beautifulsoup tests."
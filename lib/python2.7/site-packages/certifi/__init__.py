@@ -0,0 +1,3 @@
+from .core import where, old_where
+
+__version__ = "2017.04.17"
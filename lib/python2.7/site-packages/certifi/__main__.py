@@ -0,0 +1,2 @@
+from certifi import where
+print(where())
@@ -0,0 +1,5 @@
+import codecov
+
+
+if __name__ == '__main__':
+    codecov.main()
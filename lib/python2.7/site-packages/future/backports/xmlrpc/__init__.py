@@ -0,0 +1 @@
+# This directory is a Python package.
@@ -0,0 +1 @@
+# empty to make this a package
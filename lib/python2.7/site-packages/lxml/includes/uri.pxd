@@ -0,0 +1,5 @@
+cdef extern from "libxml/uri.h":
+    ctypedef struct xmlURI
+
+    cdef xmlURI* xmlParseURI(char* str)
+    cdef void xmlFreeURI(xmlURI* uri)
@@ -0,0 +1,22 @@
+# Natural Language Toolkit: Combinatory Categorial Grammar
+#
+# Copyright (C) 2001-2015 NLTK Project
+# Author: Graeme Gange <ggange@csse.unimelb.edu.au>
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Combinatory Categorial Grammar.
+
+For more information see nltk/doc/contrib/ccg/ccg.pdf
+"""
+
+from nltk.ccg.combinator import (UndirectedBinaryCombinator, DirectedBinaryCombinator,
+                                 ForwardCombinator, BackwardCombinator,
+                                 UndirectedFunctionApplication, ForwardApplication,
+                                 BackwardApplication, UndirectedComposition,
+                                 ForwardComposition, BackwardComposition,
+                                 BackwardBx, UndirectedSubstitution, ForwardSubstitution,
+                                 BackwardSx, UndirectedTypeRaise, ForwardT, BackwardT)
+from nltk.ccg.chart import CCGEdge, CCGLeafEdge, CCGChartParser, CCGChart
+from nltk.ccg.lexicon import CCGLexicon
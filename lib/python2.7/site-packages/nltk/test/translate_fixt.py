@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+from nltk.corpus import teardown_module
\ No newline at end of file
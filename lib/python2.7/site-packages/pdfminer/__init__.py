@@ -0,0 +1,6 @@
+
+# -*- coding: utf-8 -*-
+__version__ = '20170720'
+
+if __name__ == '__main__':
+    print (__version__)
@@ -0,0 +1 @@
+""" python inspection/code generation API """
@@ -0,0 +1 @@
+""" input/output helping """
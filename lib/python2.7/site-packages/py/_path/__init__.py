@@ -0,0 +1 @@
+""" unified file system api """
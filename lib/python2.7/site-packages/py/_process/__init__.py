@@ -0,0 +1 @@
+""" high-level sub-process handling """
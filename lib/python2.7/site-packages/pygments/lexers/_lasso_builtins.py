@@ -0,0 +1,5182 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.lexers._lasso_builtins
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Built-in Lasso types, traits, methods, and members.
+
+    :copyright: Copyright 2006-2014 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+BUILTINS = {
+    'Types': (
+        'null',
+        'void',
+        'tag',
+        'trait',
+        'integer',
+        'decimal',
+        'boolean',
+        'capture',
+        'string',
+        'bytes',
+        'keyword',
+        'custom',
+        'staticarray',
+        'signature',
+        'memberstream',
+        'dsinfo',
+        'sourcefile',
+        'array',
+        'pair',
+        'opaque',
+        'filedesc',
+        'dirdesc',
+        'locale',
+        'ucal',
+        'xml_domimplementation',
+        'xml_node',
+        'xml_characterdata',
+        'xml_document',
+        'xml_element',
+        'xml_attr',
+        'xml_text',
+        'xml_cdatasection',
+        'xml_entityreference',
+        'xml_entity',
+        'xml_processinginstruction',
+        'xml_comment',
+        'xml_documenttype',
+        'xml_documentfragment',
+        'xml_notation',
+        'xml_nodelist',
+        'xml_namednodemap',
+        'xml_namednodemap_ht',
+        'xml_namednodemap_attr',
+        'xmlstream',
+        'sqlite3',
+        'sqlite3_stmt',
+        'mime_reader',
+        'curltoken',
+        'regexp',
+        'zip_impl',
+        'zip_file_impl',
+        'library_thread_loader',
+        'generateforeachunkeyed',
+        'generateforeachkeyed',
+        'eacher',
+        'queriable_where',
+        'queriable_select',
+        'queriable_selectmany',
+        'queriable_groupby',
+        'queriable_join',
+        'queriable_groupjoin',
+        'queriable_orderby',
+        'queriable_orderbydescending',
+        'queriable_thenby',
+        'queriable_thenbydescending',
+        'queriable_skip',
+        'queriable_take',
+        'queriable_grouping',
+        'generateseries',
+        'tie',
+        'pairup',
+        'delve',
+        'repeat',
+        'pair_compare',
+        'serialization_object_identity_compare',
+        'serialization_element',
+        'serialization_writer_standin',
+        'serialization_writer_ref',
+        'serialization_writer',
+        'serialization_reader',
+        'tree_nullnode',
+        'tree_node',
+        'tree_base',
+        'map_node',
+        'map',
+        'file',
+        'date',
+        'dir',
+        'magick_image',
+        'ldap',
+        'os_process',
+        'java_jnienv',
+        'jobject',
+        'jmethodid',
+        'jfieldid',
+        'database_registry',
+        'sqlite_db',
+        'sqlite_results',
+        'sqlite_currentrow',
+        'sqlite_table',
+        'sqlite_column',
+        'curl',
+        'debugging_stack',
+        'dbgp_server',
+        'dbgp_packet',
+        'duration',
+        'inline_type',
+        'json_literal',
+        'json_object',
+        'list_node',
+        'list',
+        'jchar',
+        'jchararray',
+        'jbyte',
+        'jbytearray',
+        'jfloat',
+        'jint',
+        'jshort',
+        'currency',
+        'scientific',
+        'percent',
+        'dateandtime',
+        'timeonly',
+        'net_tcp',
+        'net_tcpssl',
+        'net_tcp_ssl',
+        'net_named_pipe',
+        'net_udppacket',
+        'net_udp_packet',
+        'net_udp',
+        'pdf_typebase',
+        'pdf_doc',
+        'pdf_color',
+        'pdf_barcode',
+        'pdf_font',
+        'pdf_image',
+        'pdf_list',
+        'pdf_read',
+        'pdf_table',
+        'pdf_text',
+        'pdf_hyphenator',
+        'pdf_chunk',
+        'pdf_phrase',
+        'pdf_paragraph',
+        'queue',
+        'set',
+        'sys_process',
+        'worker_pool',
+        'zip_file',
+        'zip',
+        'cache_server_element',
+        'cache_server',
+        'dns_response',
+        'component_render_state',
+        'component',
+        'component_container',
+        'document_base',
+        'document_body',
+        'document_header',
+        'text_document',
+        'data_document',
+        'email_compose',
+        'email_pop',
+        'email_parse',
+        'email_queue_impl_base',
+        'email_stage_impl_base',
+        'fcgi_record',
+        'web_request_impl',
+        'fcgi_request',
+        'include_cache',
+        'atbegin',
+        'fastcgi_each_fcgi_param',
+        'fastcgi_server',
+        'filemaker_datasource',
+        'http_document',
+        'http_document_header',
+        'http_header_field',
+        'html_document_head',
+        'html_document_body',
+        'raw_document_body',
+        'bytes_document_body',
+        'html_attr',
+        'html_atomic_element',
+        'html_container_element',
+        'http_error',
+        'html_script',
+        'html_text',
+        'html_raw',
+        'html_binary',
+        'html_json',
+        'html_cdata',
+        'html_eol',
+        'html_div',
+        'html_span',
+        'html_br',
+        'html_hr',
+        'html_h1',
+        'html_h2',
+        'html_h3',
+        'html_h4',
+        'html_h5',
+        'html_h6',
+        'html_meta',
+        'html_link',
+        'html_object',
+        'html_style',
+        'html_base',
+        'html_table',
+        'html_tr',
+        'html_td',
+        'html_th',
+        'html_img',
+        'html_form',
+        'html_fieldset',
+        'html_legend',
+        'html_input',
+        'html_label',
+        'html_option',
+        'html_select',
+        'http_server_web_connection',
+        'http_server',
+        'http_server_connection_handler',
+        'image',
+        'lassoapp_installer',
+        'lassoapp_content_rep_halt',
+        'lassoapp_dirsrc_fileresource',
+        'lassoapp_dirsrc_appsource',
+        'lassoapp_livesrc_fileresource',
+        'lassoapp_livesrc_appsource',
+        'lassoapp_long_expiring_bytes',
+        'lassoapp_zip_file_server',
+        'lassoapp_zipsrc_fileresource',
+        'lassoapp_zipsrc_appsource',
+        'lassoapp_compiledsrc_fileresource',
+        'lassoapp_compiledsrc_appsource',
+        'lassoapp_manualsrc_appsource',
+        'log_impl_base',
+        'portal_impl',
+        'security_registry',
+        'memory_session_driver_impl_entry',
+        'memory_session_driver_impl',
+        'sqlite_session_driver_impl_entry',
+        'sqlite_session_driver_impl',
+        'mysql_session_driver_impl',
+        'odbc_session_driver_impl',
+        'session_delete_expired_thread',
+        'email_smtp',
+        'client_address',
+        'client_ip',
+        'web_node_base',
+        'web_node_root',
+        'web_node_content_representation_xhr_container',
+        'web_node_content_representation_html_specialized',
+        'web_node_content_representation_css_specialized',
+        'web_node_content_representation_js_specialized',
+        'web_node_echo',
+        'web_error_atend',
+        'web_response_impl',
+        'web_router'
+    ),
+    'Traits': (
+        'trait_asstring',
+        'any',
+        'trait_generator',
+        'trait_decompose_assignment',
+        'trait_foreach',
+        'trait_generatorcentric',
+        'trait_foreachtextelement',
+        'trait_finite',
+        'trait_finiteforeach',
+        'trait_keyed',
+        'trait_keyedfinite',
+        'trait_keyedforeach',
+        'trait_frontended',
+        'trait_backended',
+        'trait_doubleended',
+        'trait_positionallykeyed',
+        'trait_expandable',
+        'trait_frontexpandable',
+        'trait_backexpandable',
+        'trait_contractible',
+        'trait_frontcontractible',
+        'trait_backcontractible',
+        'trait_fullymutable',
+        'trait_keyedmutable',
+        'trait_endedfullymutable',
+        'trait_setoperations',
+        'trait_searchable',
+        'trait_positionallysearchable',
+        'trait_pathcomponents',
+        'trait_readbytes',
+        'trait_writebytes',
+        'trait_setencoding',
+        'trait_readstring',
+        'trait_writestring',
+        'trait_hashable',
+        'trait_each_sub',
+        'trait_stack',
+        'trait_list',
+        'trait_array',
+        'trait_map',
+        'trait_close',
+        'trait_file',
+        'trait_scalar',
+        'trait_queriablelambda',
+        'trait_queriable',
+        'queriable_asstring',
+        'trait_serializable',
+        'trait_treenode',
+        'trait_json_serialize',
+        'formattingbase',
+        'trait_net',
+        'trait_xml_elementcompat',
+        'trait_xml_nodecompat',
+        'web_connection',
+        'html_element_coreattrs',
+        'html_element_i18nattrs',
+        'html_element_eventsattrs',
+        'html_attributed',
+        'lassoapp_resource',
+        'lassoapp_source',
+        'lassoapp_capabilities',
+        'session_driver',
+        'web_node_content_json_specialized',
+        'web_node',
+        'web_node_container',
+        'web_node_content_representation',
+        'web_node_content',
+        'web_node_content_document',
+        'web_node_postable',
+        'web_node_content_html_specialized',
+        'web_node_content_css_specialized',
+        'web_node_content_js_specialized'
+    ),
+    'Unbound Methods': (
+        'fail_now',
+        'register',
+        'register_thread',
+        'escape_tag',
+        'handle',
+        'handle_failure',
+        'protect_now',
+        'threadvar_get',
+        'threadvar_set',
+        'threadvar_set_asrt',
+        'threadvar_find',
+        'abort_now',
+        'abort_clear',
+        'failure_clear',
+        'var_keys',
+        'var_values',
+        'staticarray_join',
+        'suspend',
+        'main_thread_only',
+        'split_thread',
+        'capture_nearestloopcount',
+        'capture_nearestloopcontinue',
+        'capture_nearestloopabort',
+        'io_file_o_rdonly',
+        'io_file_o_wronly',
+        'io_file_o_rdwr',
+        'io_file_o_nonblock',
+        'io_file_o_sync',
+        'io_file_o_shlock',
+        'io_file_o_exlock',
+        'io_file_o_async',
+        'io_file_o_fsync',
+        'io_file_o_nofollow',
+        'io_file_s_irwxu',
+        'io_file_s_irusr',
+        'io_file_s_iwusr',
+        'io_file_s_ixusr',
+        'io_file_s_irwxg',
+        'io_file_s_irgrp',
+        'io_file_s_iwgrp',
+        'io_file_s_ixgrp',
+        'io_file_s_irwxo',
+        'io_file_s_iroth',
+        'io_file_s_iwoth',
+        'io_file_s_ixoth',
+        'io_file_s_isuid',
+        'io_file_s_isgid',
+        'io_file_s_isvtx',
+        'io_file_s_ifmt',
+        'io_file_s_ifchr',
+        'io_file_s_ifdir',
+        'io_file_s_ifreg',
+        'io_file_o_append',
+        'io_file_o_creat',
+        'io_file_o_trunc',
+        'io_file_o_excl',
+        'io_file_seek_set',
+        'io_file_seek_cur',
+        'io_file_seek_end',
+        'io_file_s_ififo',
+        'io_file_s_ifblk',
+        'io_file_s_iflnk',
+        'io_file_s_ifsock',
+        'io_net_shut_rd',
+        'io_net_shut_wr',
+        'io_net_shut_rdwr',
+        'io_net_sock_stream',
+        'io_net_sock_dgram',
+        'io_net_sock_raw',
+        'io_net_sock_rdm',
+        'io_net_sock_seqpacket',
+        'io_net_so_debug',
+        'io_net_so_acceptconn',
+        'io_net_so_reuseaddr',
+        'io_net_so_keepalive',
+        'io_net_so_dontroute',
+        'io_net_so_broadcast',
+        'io_net_so_useloopback',
+        'io_net_so_linger',
+        'io_net_so_oobinline',
+        'io_net_so_timestamp',
+        'io_net_so_sndbuf',
+        'io_net_so_rcvbuf',
+        'io_net_so_sndlowat',
+        'io_net_so_rcvlowat',
+        'io_net_so_sndtimeo',
+        'io_net_so_rcvtimeo',
+        'io_net_so_error',
+        'io_net_so_type',
+        'io_net_sol_socket',
+        'io_net_af_unix',
+        'io_net_af_inet',
+        'io_net_af_inet6',
+        'io_net_ipproto_ip',
+        'io_net_ipproto_udp',
+        'io_net_msg_peek',
+        'io_net_msg_oob',
+        'io_net_msg_waitall',
+        'io_file_fioclex',
+        'io_file_fionclex',
+        'io_file_fionread',
+        'io_file_fionbio',
+        'io_file_fioasync',
+        'io_file_fiosetown',
+        'io_file_fiogetown',
+        'io_file_fiodtype',
+        'io_file_f_dupfd',
+        'io_file_f_getfd',
+        'io_file_f_setfd',
+        'io_file_f_getfl',
+        'io_file_f_setfl',
+        'io_file_f_getlk',
+        'io_file_f_setlk',
+        'io_file_f_setlkw',
+        'io_file_fd_cloexec',
+        'io_file_f_rdlck',
+        'io_file_f_unlck',
+        'io_file_f_wrlck',
+        'io_dir_dt_unknown',
+        'io_dir_dt_fifo',
+        'io_dir_dt_chr',
+        'io_dir_dt_blk',
+        'io_dir_dt_reg',
+        'io_dir_dt_sock',
+        'io_dir_dt_wht',
+        'io_dir_dt_lnk',
+        'io_dir_dt_dir',
+        'io_file_access',
+        'io_file_chdir',
+        'io_file_getcwd',
+        'io_file_chown',
+        'io_file_lchown',
+        'io_file_truncate',
+        'io_file_link',
+        'io_file_pipe',
+        'io_file_rmdir',
+        'io_file_symlink',
+        'io_file_unlink',
+        'io_file_remove',
+        'io_file_rename',
+        'io_file_tempnam',
+        'io_file_mkstemp',
+        'io_file_dirname',
+        'io_file_realpath',
+        'io_file_chmod',
+        'io_file_mkdir',
+        'io_file_mkfifo',
+        'io_file_umask',
+        'io_net_socket',
+        'io_net_bind',
+        'io_net_connect',
+        'io_net_listen',
+        'io_net_recv',
+        'io_net_recvfrom',
+        'io_net_accept',
+        'io_net_send',
+        'io_net_sendto',
+        'io_net_shutdown',
+        'io_net_getpeername',
+        'io_net_getsockname',
+        'io_net_ssl_begin',
+        'io_net_ssl_end',
+        'io_net_ssl_shutdown',
+        'io_net_ssl_setverifylocations',
+        'io_net_ssl_usecertificatechainfile',
+        'io_net_ssl_useprivatekeyfile',
+        'io_net_ssl_connect',
+        'io_net_ssl_accept',
+        'io_net_ssl_error',
+        'io_net_ssl_errorstring',
+        'io_net_ssl_liberrorstring',
+        'io_net_ssl_funcerrorstring',
+        'io_net_ssl_reasonerrorstring',
+        'io_net_ssl_setconnectstate',
+        'io_net_ssl_setacceptstate',
+        'io_net_ssl_read',
+        'io_net_ssl_write',
+        'io_file_stat_size',
+        'io_file_stat_mode',
+        'io_file_stat_mtime',
+        'io_file_stat_atime',
+        'io_file_lstat_size',
+        'io_file_lstat_mode',
+        'io_file_lstat_mtime',
+        'io_file_lstat_atime',
+        'io_file_readlink',
+        'io_file_lockf',
+        'io_file_f_ulock',
+        'io_file_f_tlock',
+        'io_file_f_test',
+        'io_file_stdin',
+        'io_file_stdout',
+        'io_file_stderr',
+        'uchar_alphabetic',
+        'uchar_ascii_hex_digit',
+        'uchar_bidi_control',
+        'uchar_bidi_mirrored',
+        'uchar_dash',
+        'uchar_default_ignorable_code_point',
+        'uchar_deprecated',
+        'uchar_diacritic',
+        'uchar_extender',
+        'uchar_full_composition_exclusion',
+        'uchar_grapheme_base',
+        'uchar_grapheme_extend',
+        'uchar_grapheme_link',
+        'uchar_hex_digit',
+        'uchar_hyphen',
+        'uchar_id_continue',
+        'uchar_ideographic',
+        'uchar_ids_binary_operator',
+        'uchar_ids_trinary_operator',
+        'uchar_join_control',
+        'uchar_logical_order_exception',
+        'uchar_lowercase',
+        'uchar_math',
+        'uchar_noncharacter_code_point',
+        'uchar_quotation_mark',
+        'uchar_radical',
+        'uchar_soft_dotted',
+        'uchar_terminal_punctuation',
+        'uchar_unified_ideograph',
+        'uchar_uppercase',
+        'uchar_white_space',
+        'uchar_xid_continue',
+        'uchar_case_sensitive',
+        'uchar_s_term',
+        'uchar_variation_selector',
+        'uchar_nfd_inert',
+        'uchar_nfkd_inert',
+        'uchar_nfc_inert',
+        'uchar_nfkc_inert',
+        'uchar_segment_starter',
+        'uchar_pattern_syntax',
+        'uchar_pattern_white_space',
+        'uchar_posix_alnum',
+        'uchar_posix_blank',
+        'uchar_posix_graph',
+        'uchar_posix_print',
+        'uchar_posix_xdigit',
+        'uchar_bidi_class',
+        'uchar_block',
+        'uchar_canonical_combining_class',
+        'uchar_decomposition_type',
+        'uchar_east_asian_width',
+        'uchar_general_category',
+        'uchar_joining_group',
+        'uchar_joining_type',
+        'uchar_line_break',
+        'uchar_numeric_type',
+        'uchar_script',
+        'uchar_hangul_syllable_type',
+        'uchar_nfd_quick_check',
+        'uchar_nfkd_quick_check',
+        'uchar_nfc_quick_check',
+        'uchar_nfkc_quick_check',
+        'uchar_lead_canonical_combining_class',
+        'uchar_trail_canonical_combining_class',
+        'uchar_grapheme_cluster_break',
+        'uchar_sentence_break',
+        'uchar_word_break',
+        'uchar_general_category_mask',
+        'uchar_numeric_value',
+        'uchar_age',
+        'uchar_bidi_mirroring_glyph',
+        'uchar_case_folding',
+        'uchar_iso_comment',
+        'uchar_lowercase_mapping',
+        'uchar_name',
+        'uchar_simple_case_folding',
+        'uchar_simple_lowercase_mapping',
+        'uchar_simple_titlecase_mapping',
+        'uchar_simple_uppercase_mapping',
+        'uchar_titlecase_mapping',
+        'uchar_unicode_1_name',
+        'uchar_uppercase_mapping',
+        'u_wb_other',
+        'u_wb_aletter',
+        'u_wb_format',
+        'u_wb_katakana',
+        'u_wb_midletter',
+        'u_wb_midnum',
+        'u_wb_numeric',
+        'u_wb_extendnumlet',
+        'u_sb_other',
+        'u_sb_aterm',
+        'u_sb_close',
+        'u_sb_format',
+        'u_sb_lower',
+        'u_sb_numeric',
+        'u_sb_oletter',
+        'u_sb_sep',
+        'u_sb_sp',
+        'u_sb_sterm',
+        'u_sb_upper',
+        'u_lb_unknown',
+        'u_lb_ambiguous',
+        'u_lb_alphabetic',
+        'u_lb_break_both',
+        'u_lb_break_after',
+        'u_lb_break_before',
+        'u_lb_mandatory_break',
+        'u_lb_contingent_break',
+        'u_lb_close_punctuation',
+        'u_lb_combining_mark',
+        'u_lb_carriage_return',
+        'u_lb_exclamation',
+        'u_lb_glue',
+        'u_lb_hyphen',
+        'u_lb_ideographic',
+        'u_lb_inseparable',
+        'u_lb_infix_numeric',
+        'u_lb_line_feed',
+        'u_lb_nonstarter',
+        'u_lb_numeric',
+        'u_lb_open_punctuation',
+        'u_lb_postfix_numeric',
+        'u_lb_prefix_numeric',
+        'u_lb_quotation',
+        'u_lb_complex_context',
+        'u_lb_surrogate',
+        'u_lb_space',
+        'u_lb_break_symbols',
+        'u_lb_zwspace',
+        'u_lb_next_line',
+        'u_lb_word_joiner',
+        'u_lb_h2',
+        'u_lb_h3',
+        'u_lb_jl',
+        'u_lb_jt',
+        'u_lb_jv',
+        'u_nt_none',
+        'u_nt_decimal',
+        'u_nt_digit',
+        'u_nt_numeric',
+        'locale_english',
+        'locale_french',
+        'locale_german',
+        'locale_italian',
+        'locale_japanese',
+        'locale_korean',
+        'locale_chinese',
+        'locale_simplifiedchinese',
+        'locale_traditionalchinese',
+        'locale_france',
+        'locale_germany',
+        'locale_italy',
+        'locale_japan',
+        'locale_korea',
+        'locale_china',
+        'locale_prc',
+        'locale_taiwan',
+        'locale_uk',
+        'locale_us',
+        'locale_canada',
+        'locale_canadafrench',
+        'locale_default',
+        'locale_setdefault',
+        'locale_isocountries',
+        'locale_isolanguages',
+        'locale_availablelocales',
+        'ucal_listtimezones',
+        'ucal_era',
+        'ucal_year',
+        'ucal_month',
+        'ucal_weekofyear',
+        'ucal_weekofmonth',
+        'ucal_dayofmonth',
+        'ucal_dayofyear',
+        'ucal_dayofweek',
+        'ucal_dayofweekinmonth',
+        'ucal_ampm',
+        'ucal_hour',
+        'ucal_hourofday',
+        'ucal_minute',
+        'ucal_second',
+        'ucal_millisecond',
+        'ucal_zoneoffset',
+        'ucal_dstoffset',
+        'ucal_yearwoy',
+        'ucal_dowlocal',
+        'ucal_extendedyear',
+        'ucal_julianday',
+        'ucal_millisecondsinday',
+        'ucal_lenient',
+        'ucal_firstdayofweek',
+        'ucal_daysinfirstweek',
+        'sys_sigalrm',
+        'sys_sighup',
+        'sys_sigkill',
+        'sys_sigpipe',
+        'sys_sigquit',
+        'sys_sigusr1',
+        'sys_sigusr2',
+        'sys_sigchld',
+        'sys_sigcont',
+        'sys_sigstop',
+        'sys_sigtstp',
+        'sys_sigttin',
+        'sys_sigttou',
+        'sys_sigbus',
+        'sys_sigprof',
+        'sys_sigsys',
+        'sys_sigtrap',
+        'sys_sigurg',
+        'sys_sigvtalrm',
+        'sys_sigxcpu',
+        'sys_sigxfsz',
+        'sys_wcontinued',
+        'sys_wnohang',
+        'sys_wuntraced',
+        'sys_sigabrt',
+        'sys_sigfpe',
+        'sys_sigill',
+        'sys_sigint',
+        'sys_sigsegv',
+        'sys_sigterm',
+        'sys_exit',
+        'sys_fork',
+        'sys_kill',
+        'sys_waitpid',
+        'sys_getegid',
+        'sys_geteuid',
+        'sys_getgid',
+        'sys_getlogin',
+        'sys_getpid',
+        'sys_getppid',
+        'sys_getuid',
+        'sys_setuid',
+        'sys_setgid',
+        'sys_setsid',
+        'sys_errno',
+        'sys_strerror',
+        'sys_time',
+        'sys_difftime',
+        'sys_getpwuid',
+        'sys_getpwnam',
+        'sys_getgrnam',
+        'sys_drand48',
+        'sys_erand48',
+        'sys_jrand48',
+        'sys_lcong48',
+        'sys_lrand48',
+        'sys_mrand48',
+        'sys_nrand48',
+        'sys_srand48',
+        'sys_random',
+        'sys_srandom',
+        'sys_seed48',
+        'sys_rand',
+        'sys_srand',
+        'sys_environ',
+        'sys_getenv',
+        'sys_setenv',
+        'sys_unsetenv',
+        'sys_uname',
+        'uuid_compare',
+        'uuid_copy',
+        'uuid_generate',
+        'uuid_generate_random',
+        'uuid_generate_time',
+        'uuid_is_null',
+        'uuid_parse',
+        'uuid_unparse',
+        'uuid_unparse_lower',
+        'uuid_unparse_upper',
+        'sys_credits',
+        'sleep',
+        'sys_dll_ext',
+        'sys_listtypes',
+        'sys_listtraits',
+        'sys_listunboundmethods',
+        'sys_getthreadcount',
+        'sys_growheapby',
+        'sys_getheapsize',
+        'sys_getheapfreebytes',
+        'sys_getbytessincegc',
+        'sys_garbagecollect',
+        'sys_clock',
+        'sys_getstartclock',
+        'sys_clockspersec',
+        'sys_pointersize',
+        'sys_loadlibrary',
+        'sys_getchar',
+        'sys_chroot',
+        'sys_exec',
+        'sys_kill_exec',
+        'sys_wait_exec',
+        'sys_test_exec',
+        'sys_detach_exec',
+        'sys_pid_exec',
+        'wifexited',
+        'wexitstatus',
+        'wifsignaled',
+        'wtermsig',
+        'wifstopped',
+        'wstopsig',
+        'wifcontinued',
+        'sys_eol',
+        'sys_iswindows',
+        'sys_is_windows',
+        'sys_isfullpath',
+        'sys_is_full_path',
+        'lcapi_loadmodule',
+        'lcapi_listdatasources',
+        'encrypt_blowfish',
+        'decrypt_blowfish',
+        'cipher_digest',
+        'cipher_encrypt',
+        'cipher_decrypt',
+        'cipher_list',
+        'cipher_keylength',
+        'cipher_hmac',
+        'cipher_seal',
+        'cipher_open',
+        'cipher_sign',
+        'cipher_verify',
+        'cipher_decrypt_private',
+        'cipher_decrypt_public',
+        'cipher_encrypt_private',
+        'cipher_encrypt_public',
+        'cipher_generate_key',
+        'tag_exists',
+        'curl_easy_init',
+        'curl_easy_duphandle',
+        'curl_easy_cleanup',
+        'curl_easy_getinfo',
+        'curl_multi_perform',
+        'curl_multi_result',
+        'curl_easy_reset',
+        'curl_easy_setopt',
+        'curl_easy_strerror',
+        'curl_getdate',
+        'curl_version',
+        'curl_version_info',
+        'curlinfo_effective_url',
+        'curlinfo_content_type',
+        'curlinfo_response_code',
+        'curlinfo_header_size',
+        'curlinfo_request_size',
+        'curlinfo_ssl_verifyresult',
+        'curlinfo_filetime',
+        'curlinfo_redirect_count',
+        'curlinfo_http_connectcode',
+        'curlinfo_httpauth_avail',
+        'curlinfo_proxyauth_avail',
+        'curlinfo_os_errno',
+        'curlinfo_num_connects',
+        'curlinfo_total_time',
+        'curlinfo_namelookup_time',
+        'curlinfo_connect_time',
+        'curlinfo_pretransfer_time',
+        'curlinfo_size_upload',
+        'curlinfo_size_download',
+        'curlinfo_speed_download',
+        'curlinfo_speed_upload',
+        'curlinfo_content_length_download',
+        'curlinfo_content_length_upload',
+        'curlinfo_starttransfer_time',
+        'curlinfo_redirect_time',
+        'curlinfo_ssl_engines',
+        'curlopt_url',
+        'curlopt_postfields',
+        'curlopt_cainfo',
+        'curlopt_capath',
+        'curlopt_cookie',
+        'curlopt_cookiefile',
+        'curlopt_cookiejar',
+        'curlopt_customrequest',
+        'curlopt_egdsocket',
+        'curlopt_encoding',
+        'curlopt_ftp_account',
+        'curlopt_ftpport',
+        'curlopt_interface',
+        'curlopt_krb4level',
+        'curlopt_netrc_file',
+        'curlopt_proxy',
+        'curlopt_proxyuserpwd',
+        'curlopt_random_file',
+        'curlopt_range',
+        'curlopt_readdata',
+        'curlopt_referer',
+        'curlopt_ssl_cipher_list',
+        'curlopt_sslcert',
+        'curlopt_sslcerttype',
+        'curlopt_sslengine',
+        'curlopt_sslkey',
+        'curlopt_sslkeypasswd',
+        'curlopt_sslkeytype',
+        'curlopt_useragent',
+        'curlopt_userpwd',
+        'curlopt_postfieldsize',
+        'curlopt_autoreferer',
+        'curlopt_buffersize',
+        'curlopt_connecttimeout',
+        'curlopt_cookiesession',
+        'curlopt_crlf',
+        'curlopt_dns_use_global_cache',
+        'curlopt_failonerror',
+        'curlopt_filetime',
+        'curlopt_followlocation',
+        'curlopt_forbid_reuse',
+        'curlopt_fresh_connect',
+        'curlopt_ftp_create_missing_dirs',
+        'curlopt_ftp_response_timeout',
+        'curlopt_ftp_ssl',
+        'curlopt_use_ssl',
+        'curlopt_ftp_use_eprt',
+        'curlopt_ftp_use_epsv',
+        'curlopt_ftpappend',
+        'curlopt_ftplistonly',
+        'curlopt_ftpsslauth',
+        'curlopt_header',
+        'curlopt_http_version',
+        'curlopt_httpauth',
+        'curlopt_httpget',
+        'curlopt_httpproxytunnel',
+        'curlopt_infilesize',
+        'curlopt_ipresolve',
+        'curlopt_low_speed_limit',
+        'curlopt_low_speed_time',
+        'curlopt_maxconnects',
+        'curlopt_maxfilesize',
+        'curlopt_maxredirs',
+        'curlopt_netrc',
+        'curlopt_nobody',
+        'curlopt_noprogress',
+        'curlopt_port',
+        'curlopt_post',
+        'curlopt_proxyauth',
+        'curlopt_proxyport',
+        'curlopt_proxytype',
+        'curlopt_put',
+        'curlopt_resume_from',
+        'curlopt_ssl_verifyhost',
+        'curlopt_ssl_verifypeer',
+        'curlopt_sslengine_default',
+        'curlopt_sslversion',
+        'curlopt_tcp_nodelay',
+        'curlopt_timecondition',
+        'curlopt_timeout',
+        'curlopt_timevalue',
+        'curlopt_transfertext',
+        'curlopt_unrestricted_auth',
+        'curlopt_upload',
+        'curlopt_verbose',
+        'curlopt_infilesize_large',
+        'curlopt_maxfilesize_large',
+        'curlopt_postfieldsize_large',
+        'curlopt_resume_from_large',
+        'curlopt_http200aliases',
+        'curlopt_httpheader',
+        'curlopt_postquote',
+        'curlopt_prequote',
+        'curlopt_quote',
+        'curlopt_httppost',
+        'curlopt_writedata',
+        'curl_version_ipv6',
+        'curl_version_kerberos4',
+        'curl_version_ssl',
+        'curl_version_libz',
+        'curl_version_ntlm',
+        'curl_version_gssnegotiate',
+        'curl_version_debug',
+        'curl_version_asynchdns',
+        'curl_version_spnego',
+        'curl_version_largefile',
+        'curl_version_idn',
+        'curl_netrc_ignored',
+        'curl_netrc_optional',
+        'curl_netrc_required',
+        'curl_http_version_none',
+        'curl_http_version_1_0',
+        'curl_http_version_1_1',
+        'curl_ipresolve_whatever',
+        'curl_ipresolve_v4',
+        'curl_ipresolve_v6',
+        'curlftpssl_none',
+        'curlftpssl_try',
+        'curlftpssl_control',
+        'curlftpssl_all',
+        'curlftpssl_last',
+        'curlftpauth_default',
+        'curlftpauth_ssl',
+        'curlftpauth_tls',
+        'curlauth_none',
+        'curlauth_basic',
+        'curlauth_digest',
+        'curlauth_gssnegotiate',
+        'curlauth_ntlm',
+        'curlauth_any',
+        'curlauth_anysafe',
+        'curlproxy_http',
+        'curlproxy_socks4',
+        'curlproxy_socks5',
+        'curle_ok',
+        'curle_unsupported_protocol',
+        'curle_failed_init',
+        'curle_url_malformat',
+        'curle_url_malformat_user',
+        'curle_couldnt_resolve_proxy',
+        'curle_couldnt_resolve_host',
+        'curle_couldnt_connect',
+        'curle_ftp_weird_server_reply',
+        'curle_ftp_access_denied',
+        'curle_ftp_user_password_incorrect',
+        'curle_ftp_weird_pass_reply',
+        'curle_ftp_weird_user_reply',
+        'curle_ftp_weird_pasv_reply',
+        'curle_ftp_weird_227_format',
+        'curle_ftp_cant_get_host',
+        'curle_ftp_cant_reconnect',
+        'curle_ftp_couldnt_set_binary',
+        'curle_partial_file',
+        'curle_ftp_couldnt_retr_file',
+        'curle_ftp_write_error',
+        'curle_ftp_quote_error',
+        'curle_http_returned_error',
+        'curle_write_error',
+        'curle_malformat_user',
+        'curle_read_error',
+        'curle_out_of_memory',
+        'curle_operation_timeouted',
+        'curle_ftp_couldnt_set_ascii',
+        'curle_ftp_port_failed',
+        'curle_ftp_couldnt_use_rest',
+        'curle_ftp_couldnt_get_size',
+        'curle_http_range_error',
+        'curle_http_post_error',
+        'curle_ssl_connect_error',
+        'curle_bad_download_resume',
+        'curle_file_couldnt_read_file',
+        'curle_ldap_cannot_bind',
+        'curle_ldap_search_failed',
+        'curle_library_not_found',
+        'curle_function_not_found',
+        'curle_aborted_by_callback',
+        'curle_bad_function_argument',
+        'curle_bad_calling_order',
+        'curle_interface_failed',
+        'curle_bad_password_entered',
+        'curle_too_many_redirects',
+        'curle_unknown_telnet_option',
+        'curle_telnet_option_syntax',
+        'curle_obsolete',
+        'curle_ssl_peer_certificate',
+        'curle_got_nothing',
+        'curle_ssl_engine_notfound',
+        'curle_ssl_engine_setfailed',
+        'curle_send_error',
+        'curle_recv_error',
+        'curle_share_in_use',
+        'curle_ssl_certproblem',
+        'curle_ssl_cipher',
+        'curle_ssl_cacert',
+        'curle_bad_content_encoding',
+        'curle_ldap_invalid_url',
+        'curle_filesize_exceeded',
+        'curle_ftp_ssl_failed',
+        'curle_send_fail_rewind',
+        'curle_ssl_engine_initfailed',
+        'curle_login_denied',
+        'curlmsg_done',
+        'zip_open',
+        'zip_name_locate',
+        'zip_fopen',
+        'zip_fopen_index',
+        'zip_fread',
+        'zip_fclose',
+        'zip_close',
+        'zip_stat',
+        'zip_stat_index',
+        'zip_get_archive_comment',
+        'zip_get_file_comment',
+        'zip_get_name',
+        'zip_get_num_files',
+        'zip_add',
+        'zip_replace',
+        'zip_add_dir',
+        'zip_set_file_comment',
+        'zip_rename',
+        'zip_delete',
+        'zip_unchange',
+        'zip_unchange_all',
+        'zip_unchange_archive',
+        'zip_set_archive_comment',
+        'zip_error_to_str',
+        'zip_file_strerror',
+        'zip_strerror',
+        'zip_error_get',
+        'zip_file_error_get',
+        'zip_error_get_sys_type',
+        'zlib_version',
+        'fastcgi_initiate_request',
+        'debugging_enabled',
+        'debugging_stop',
+        'evdns_resolve_ipv4',
+        'evdns_resolve_ipv6',
+        'evdns_resolve_reverse',
+        'evdns_resolve_reverse_ipv6',
+        'stdout',
+        'stdoutnl',
+        'fail',
+        'fail_if',
+        'fail_ifnot',
+        'error_code',
+        'error_msg',
+        'error_obj',
+        'error_stack',
+        'error_push',
+        'error_pop',
+        'error_reset',
+        'error_msg_invalidparameter',
+        'error_code_invalidparameter',
+        'error_msg_networkerror',
+        'error_code_networkerror',
+        'error_msg_runtimeassertion',
+        'error_code_runtimeassertion',
+        'error_msg_methodnotfound',
+        'error_code_methodnotfound',
+        'error_msg_resnotfound',
+        'error_code_resnotfound',
+        'error_msg_filenotfound',
+        'error_code_filenotfound',
+        'error_msg_aborted',
+        'error_code_aborted',
+        'error_msg_dividebyzero',
+        'error_code_dividebyzero',
+        'error_msg_noerror',
+        'error_code_noerror',
+        'abort',
+        'protect',
+        'generateforeach',
+        'method_name',
+        'queriable_do',
+        'queriable_sum',
+        'queriable_average',
+        'queriable_min',
+        'queriable_max',
+        'queriable_internal_combinebindings',
+        'queriable_defaultcompare',
+        'queriable_reversecompare',
+        'queriable_qsort',
+        'timer',
+        'thread_var_push',
+        'thread_var_pop',
+        'thread_var_get',
+        'loop_value',
+        'loop_value_push',
+        'loop_value_pop',
+        'loop_key',
+        'loop_key_push',
+        'loop_key_pop',
+        'loop_push',
+        'loop_pop',
+        'loop_count',
+        'loop_continue',
+        'loop_abort',
+        'loop',
+        'sys_while',
+        'sys_iterate',
+        'string_validcharset',
+        'eol',
+        'encoding_utf8',
+        'encoding_iso88591',
+        'integer_random',
+        'integer_bitor',
+        'millis',
+        'micros',
+        'max',
+        'min',
+        'range',
+        'median',
+        'decimal_random',
+        'pi',
+        'lcapi_datasourceinit',
+        'lcapi_datasourceterm',
+        'lcapi_datasourcenames',
+        'lcapi_datasourcetablenames',
+        'lcapi_datasourcesearch',
+        'lcapi_datasourceadd',
+        'lcapi_datasourceupdate',
+        'lcapi_datasourcedelete',
+        'lcapi_datasourceinfo',
+        'lcapi_datasourceexecsql',
+        'lcapi_datasourcerandom',
+        'lcapi_datasourceschemanames',
+        'lcapi_datasourcecloseconnection',
+        'lcapi_datasourcetickle',
+        'lcapi_datasourceduplicate',
+        'lcapi_datasourcescripts',
+        'lcapi_datasourceimage',
+        'lcapi_datasourcefindall',
+        'lcapi_datasourcematchesname',
+        'lcapi_datasourcepreparesql',
+        'lcapi_datasourceunpreparesql',
+        'lcapi_datasourcenothing',
+        'lcapi_fourchartointeger',
+        'lcapi_datasourcetypestring',
+        'lcapi_datasourcetypeinteger',
+        'lcapi_datasourcetypeboolean',
+        'lcapi_datasourcetypeblob',
+        'lcapi_datasourcetypedecimal',
+        'lcapi_datasourcetypedate',
+        'lcapi_datasourceprotectionnone',
+        'lcapi_datasourceprotectionreadonly',
+        'lcapi_datasourceopgt',
+        'lcapi_datasourceopgteq',
+        'lcapi_datasourceopeq',
+        'lcapi_datasourceopneq',
+        'lcapi_datasourceoplt',
+        'lcapi_datasourceoplteq',
+        'lcapi_datasourceopbw',
+        'lcapi_datasourceopew',
+        'lcapi_datasourceopct',
+        'lcapi_datasourceopnct',
+        'lcapi_datasourceopnbw',
+        'lcapi_datasourceopnew',
+        'lcapi_datasourceopand',
+        'lcapi_datasourceopor',
+        'lcapi_datasourceopnot',
+        'lcapi_datasourceopno',
+        'lcapi_datasourceopany',
+        'lcapi_datasourceopin',
+        'lcapi_datasourceopnin',
+        'lcapi_datasourceopft',
+        'lcapi_datasourceoprx',
+        'lcapi_datasourceopnrx',
+        'lcapi_datasourcesortascending',
+        'lcapi_datasourcesortdescending',
+        'lcapi_datasourcesortcustom',
+        'lcapi_updatedatasourceslist',
+        'lcapi_loadmodules',
+        'lasso_version',
+        'lasso_uniqueid',
+        'usage',
+        'file_defaultencoding',
+        'file_copybuffersize',
+        'file_modeline',
+        'file_modechar',
+        'file_forceroot',
+        'file_tempfile',
+        'file_stdin',
+        'file_stdout',
+        'file_stderr',
+        'lasso_tagexists',
+        'lasso_methodexists',
+        'output',
+        'if_empty',
+        'if_null',
+        'if_true',
+        'if_false',
+        'process',
+        'treemap',
+        'locale_format',
+        'compress',
+        'uncompress',
+        'decompress',
+        'tag_name',
+        'series',
+        'nslookup',
+        'all',
+        'bw',
+        'cn',
+        'eq',
+        'ew',
+        'ft',
+        'gt',
+        'gte',
+        'lt',
+        'lte',
+        'neq',
+        'nrx',
+        'rx',
+        'none',
+        'minimal',
+        'full',
+        'output_none',
+        'lasso_executiontimelimit',
+        'namespace_global',
+        'namespace_using',
+        'namespace_import',
+        'site_id',
+        'site_name',
+        'sys_homepath',
+        'sys_masterhomepath',
+        'sys_supportpath',
+        'sys_librariespath',
+        'sys_databasespath',
+        'sys_usercapimodulepath',
+        'sys_appspath',
+        'sys_userstartuppath',
+        'ldap_scope_base',
+        'ldap_scope_onelevel',
+        'ldap_scope_subtree',
+        'mysqlds',
+        'odbc',
+        'sqliteconnector',
+        'sqlite_createdb',
+        'sqlite_setsleepmillis',
+        'sqlite_setsleeptries',
+        'java_jvm_getenv',
+        'java_jvm_create',
+        'java_jdbc_load',
+        'database_database',
+        'database_table_datasources',
+        'database_table_datasource_hosts',
+        'database_table_datasource_databases',
+        'database_table_database_tables',
+        'database_table_table_fields',
+        'database_qs',
+        'database_initialize',
+        'database_util_cleanpath',
+        'database_adddefaultsqlitehost',
+        'sqlite_ok',
+        'sqlite_error',
+        'sqlite_internal',
+        'sqlite_perm',
+        'sqlite_abort',
+        'sqlite_busy',
+        'sqlite_locked',
+        'sqlite_nomem',
+        'sqlite_readonly',
+        'sqlite_interrupt',
+        'sqlite_ioerr',
+        'sqlite_corrupt',
+        'sqlite_notfound',
+        'sqlite_full',
+        'sqlite_cantopen',
+        'sqlite_protocol',
+        'sqlite_empty',
+        'sqlite_schema',
+        'sqlite_toobig',
+        'sqlite_constraint',
+        'sqlite_mismatch',
+        'sqlite_misuse',
+        'sqlite_nolfs',
+        'sqlite_auth',
+        'sqlite_format',
+        'sqlite_range',
+        'sqlite_notadb',
+        'sqlite_row',
+        'sqlite_done',
+        'sqlite_integer',
+        'sqlite_float',
+        'sqlite_blob',
+        'sqlite_null',
+        'sqlite_text',
+        'bom_utf16be',
+        'bom_utf16le',
+        'bom_utf32be',
+        'bom_utf32le',
+        'bom_utf8',
+        'include_url',
+        'ftp_getdata',
+        'ftp_getfile',
+        'ftp_getlisting',
+        'ftp_putdata',
+        'ftp_putfile',
+        'ftp_deletefile',
+        'debugging_step_in',
+        'debugging_get_stack',
+        'debugging_get_context',
+        'debugging_detach',
+        'debugging_step_over',
+        'debugging_step_out',
+        'debugging_run',
+        'debugging_break',
+        'debugging_breakpoint_set',
+        'debugging_breakpoint_get',
+        'debugging_breakpoint_remove',
+        'debugging_breakpoint_list',
+        'debugging_breakpoint_update',
+        'debugging_terminate',
+        'debugging_context_locals',
+        'debugging_context_vars',
+        'debugging_context_self',
+        'dbgp_stop_stack_name',
+        'encrypt_md5',
+        'inline_columninfo_pos',
+        'inline_resultrows_pos',
+        'inline_foundcount_pos',
+        'inline_colinfo_name_pos',
+        'inline_colinfo_valuelist_pos',
+        'inline_scopeget',
+        'inline_scopepush',
+        'inline_scopepop',
+        'inline_namedget',
+        'inline_namedput',
+        'inline',
+        'resultset_count',
+        'resultset',
+        'resultsets',
+        'rows',
+        'rows_impl',
+        'records',
+        'column',
+        'field',
+        'column_names',
+        'field_names',
+        'column_name',
+        'field_name',
+        'found_count',
+        'shown_count',
+        'shown_first',
+        'shown_last',
+        'action_statement',
+        'lasso_currentaction',
+        'maxrecords_value',
+        'skiprecords_value',
+        'action_param',
+        'action_params',
+        'admin_authorization',
+        'admin_currentgroups',
+        'admin_currentuserid',
+        'admin_currentusername',
+        'database_name',
+        'table_name',
+        'layout_name',
+        'schema_name',
+        'keycolumn_name',
+        'keyfield_name',
+        'keycolumn_value',
+        'keyfield_value',
+        'inline_colinfo_type_pos',
+        'column_type',
+        'rows_array',
+        'records_array',
+        'records_map',
+        'json_serialize',
+        'json_consume_string',
+        'json_consume_token',
+        'json_consume_array',
+        'json_consume_object',
+        'json_deserialize',
+        'json_rpccall',
+        'ljapi_initialize',
+        'locale_format_style_full',
+        'locale_format_style_long',
+        'locale_format_style_medium',
+        'locale_format_style_short',
+        'locale_format_style_default',
+        'locale_format_style_none',
+        'locale_format_style_date_time',
+        'net_connectinprogress',
+        'net_connectok',
+        'net_typessl',
+        'net_typessltcp',
+        'net_typessludp',
+        'net_typetcp',
+        'net_typeudp',
+        'net_waitread',
+        'net_waittimeout',
+        'net_waitwrite',
+        'admin_initialize',
+        'admin_getpref',
+        'admin_setpref',
+        'admin_removepref',
+        'admin_userexists',
+        'admin_lassoservicepath',
+        'pdf_package',
+        'pdf_rectangle',
+        'pdf_serve',
+        'random_seed',
+        'xml',
+        'xml_transform',
+        'zip_create',
+        'zip_excl',
+        'zip_checkcons',
+        'zip_fl_nocase',
+        'zip_fl_nodir',
+        'zip_fl_compressed',
+        'zip_fl_unchanged',
+        'zip_er_ok',
+        'zip_er_multidisk',
+        'zip_er_rename',
+        'zip_er_close',
+        'zip_er_seek',
+        'zip_er_read',
+        'zip_er_write',
+        'zip_er_crc',
+        'zip_er_zipclosed',
+        'zip_er_noent',
+        'zip_er_exists',
+        'zip_er_open',
+        'zip_er_tmpopen',
+        'zip_er_zlib',
+        'zip_er_memory',
+        'zip_er_changed',
+        'zip_er_compnotsupp',
+        'zip_er_eof',
+        'zip_er_inval',
+        'zip_er_nozip',
+        'zip_er_internal',
+        'zip_er_incons',
+        'zip_er_remove',
+        'zip_er_deleted',
+        'zip_et_none',
+        'zip_et_sys',
+        'zip_et_zlib',
+        'zip_cm_default',
+        'zip_cm_store',
+        'zip_cm_shrink',
+        'zip_cm_reduce_1',
+        'zip_cm_reduce_2',
+        'zip_cm_reduce_3',
+        'zip_cm_reduce_4',
+        'zip_cm_implode',
+        'zip_cm_deflate',
+        'zip_cm_deflate64',
+        'zip_cm_pkware_implode',
+        'zip_cm_bzip2',
+        'zip_em_none',
+        'zip_em_trad_pkware',
+        'zip_em_des',
+        'zip_em_rc2_old',
+        'zip_em_3des_168',
+        'zip_em_3des_112',
+        'zip_em_aes_128',
+        'zip_em_aes_192',
+        'zip_em_aes_256',
+        'zip_em_rc2',
+        'zip_em_rc4',
+        'zip_em_unknown',
+        'dns_lookup',
+        'dns_default',
+        'string_charfromname',
+        'string_concatenate',
+        'string_endswith',
+        'string_extract',
+        'string_findposition',
+        'string_findregexp',
+        'string_getunicodeversion',
+        'string_insert',
+        'string_isalpha',
+        'string_isalphanumeric',
+        'string_isdigit',
+        'string_ishexdigit',
+        'string_islower',
+        'string_isnumeric',
+        'string_ispunctuation',
+        'string_isspace',
+        'string_isupper',
+        'string_length',
+        'string_remove',
+        'string_removeleading',
+        'string_removetrailing',
+        'string_replace',
+        'string_replaceregexp',
+        'string_todecimal',
+        'string_tointeger',
+        'string_uppercase',
+        'string_lowercase',
+        'document',
+        'email_attachment_mime_type',
+        'email_translatebreakstocrlf',
+        'email_findemails',
+        'email_fix_address',
+        'email_fix_address_list',
+        'encode_qheader',
+        'email_send',
+        'email_queue',
+        'email_immediate',
+        'email_result',
+        'email_status',
+        'email_token',
+        'email_merge',
+        'email_batch',
+        'email_safeemail',
+        'email_extract',
+        'email_pop_priv_substring',
+        'email_pop_priv_extract',
+        'email_digestchallenge',
+        'email_pop_priv_quote',
+        'email_digestresponse',
+        'encrypt_hmac',
+        'encrypt_crammd5',
+        'email_fs_error_clean',
+        'email_initialize',
+        'email_mxlookup',
+        'lasso_errorreporting',
+        'fcgi_version_1',
+        'fcgi_null_request_id',
+        'fcgi_begin_request',
+        'fcgi_abort_request',
+        'fcgi_end_request',
+        'fcgi_params',
+        'fcgi_stdin',
+        'fcgi_stdout',
+        'fcgi_stderr',
+        'fcgi_data',
+        'fcgi_get_values',
+        'fcgi_get_values_result',
+        'fcgi_unknown_type',
+        'fcgi_keep_conn',
+        'fcgi_responder',
+        'fcgi_authorize',
+        'fcgi_filter',
+        'fcgi_request_complete',
+        'fcgi_cant_mpx_conn',
+        'fcgi_overloaded',
+        'fcgi_unknown_role',
+        'fcgi_max_conns',
+        'fcgi_max_reqs',
+        'fcgi_mpxs_conns',
+        'fcgi_read_timeout_seconds',
+        'fcgi_makeendrequestbody',
+        'fcgi_bodychunksize',
+        'fcgi_makestdoutbody',
+        'fcgi_readparam',
+        'web_request',
+        'include_cache_compare',
+        'fastcgi_initialize',
+        'fastcgi_handlecon',
+        'fastcgi_handlereq',
+        'fastcgi_createfcgirequest',
+        'web_handlefcgirequest',
+        'filemakerds_initialize',
+        'filemakerds',
+        'value_listitem',
+        'valuelistitem',
+        'selected',
+        'checked',
+        'value_list',
+        'http_char_space',
+        'http_char_htab',
+        'http_char_cr',
+        'http_char_lf',
+        'http_char_question',
+        'http_char_colon',
+        'http_read_timeout_secs',
+        'http_default_files',
+        'http_server_apps_path',
+        'jdbc_initialize',
+        'lassoapp_settingsdb',
+        'lassoapp_format_mod_date',
+        'lassoapp_include_current',
+        'lassoapp_include',
+        'lassoapp_find_missing_file',
+        'lassoapp_get_capabilities_name',
+        'lassoapp_exists',
+        'lassoapp_path_to_method_name',
+        'lassoapp_invoke_resource',
+        'lassoapp_initialize_db',
+        'lassoapp_initialize',
+        'lassoapp_issourcefileextension',
+        'lassoapp_current_include',
+        'lassoapp_current_app',
+        'lassoapp_do_with_include',
+        'lassoapp_link',
+        'lassoapp_load_module',
+        'lassoapp_mime_type_html',
+        'lassoapp_mime_type_lasso',
+        'lassoapp_mime_type_xml',
+        'lassoapp_mime_type_ppt',
+        'lassoapp_mime_type_js',
+        'lassoapp_mime_type_txt',
+        'lassoapp_mime_type_jpg',
+        'lassoapp_mime_type_png',
+        'lassoapp_mime_type_gif',
+        'lassoapp_mime_type_css',
+        'lassoapp_mime_type_csv',
+        'lassoapp_mime_type_tif',
+        'lassoapp_mime_type_ico',
+        'lassoapp_mime_type_rss',
+        'lassoapp_mime_type_xhr',
+        'lassoapp_mime_type_pdf',
+        'lassoapp_mime_type_docx',
+        'lassoapp_mime_type_doc',
+        'lassoapp_mime_type_zip',
+        'lassoapp_mime_type_svg',
+        'lassoapp_mime_type_ttf',
+        'lassoapp_mime_type_woff',
+        'lassoapp_mime_type_swf',
+        'lassoapp_mime_get',
+        'log_level_critical',
+        'log_level_warning',
+        'log_level_detail',
+        'log_level_sql',
+        'log_level_deprecated',
+        'log_destination_console',
+        'log_destination_file',
+        'log_destination_database',
+        'log',
+        'log_setdestination',
+        'log_always',
+        'log_critical',
+        'log_warning',
+        'log_detail',
+        'log_sql',
+        'log_deprecated',
+        'log_max_file_size',
+        'log_trim_file_size',
+        'log_initialize',
+        'portal',
+        'security_database',
+        'security_table_groups',
+        'security_table_users',
+        'security_table_ug_map',
+        'security_default_realm',
+        'security_initialize',
+        'session_initialize',
+        'session_getdefaultdriver',
+        'session_setdefaultdriver',
+        'session_start',
+        'session_addvar',
+        'session_removevar',
+        'session_end',
+        'session_id',
+        'session_abort',
+        'session_result',
+        'session_deleteexpired',
+        'odbc_session_driver_mssql',
+        'session_decorate',
+        'auth_admin',
+        'auth_check',
+        'auth_custom',
+        'auth_group',
+        'auth_prompt',
+        'auth_user',
+        'client_addr',
+        'client_authorization',
+        'client_browser',
+        'client_contentlength',
+        'client_contenttype',
+        'client_cookielist',
+        'client_cookies',
+        'client_encoding',
+        'client_formmethod',
+        'client_getargs',
+        'client_getparams',
+        'client_getparam',
+        'client_headers',
+        'client_integertoip',
+        'client_iptointeger',
+        'client_password',
+        'client_postargs',
+        'client_postparams',
+        'client_postparam',
+        'client_type',
+        'client_username',
+        'client_url',
+        'referer_url',
+        'referrer_url',
+        'content_type',
+        'content_encoding',
+        'cookie',
+        'cookie_set',
+        'include',
+        'include_currentpath',
+        'include_filepath',
+        'include_localpath',
+        'include_once',
+        'include_path',
+        'include_raw',
+        'includes',
+        'library',
+        'library_once',
+        'response_filepath',
+        'response_localpath',
+        'response_path',
+        'response_realm',
+        'response_root',
+        'redirect_url',
+        'server_admin',
+        'server_name',
+        'server_ip',
+        'server_port',
+        'server_protocol',
+        'server_signature',
+        'server_software',
+        'server_push',
+        'token_value',
+        'wap_isenabled',
+        'wap_maxbuttons',
+        'wap_maxhorzpixels',
+        'wap_maxvertpixels',
+        'wap_maxcolumns',
+        'wap_maxrows',
+        'define_atbegin',
+        'define_atend',
+        'content_header',
+        'content_addheader',
+        'content_replaceheader',
+        'content_body',
+        'html_comment',
+        'web_node_forpath',
+        'web_nodes_requesthandler',
+        'web_nodes_normalizeextension',
+        'web_nodes_processcontentnode',
+        'web_nodes_initialize',
+        'web_node_content_representation_xhr',
+        'web_node_content_representation_html',
+        'web_node_content_representation_css',
+        'web_node_content_representation_js',
+        'web_response_nodesentry',
+        'web_response',
+        'web_router_database',
+        'web_router_initialize'
+    ),
+    'Lasso 8 Tags': (
+        '__char',
+        '__sync_timestamp__',
+        '_admin_addgroup',
+        '_admin_adduser',
+        '_admin_defaultconnector',
+        '_admin_defaultconnectornames',
+        '_admin_defaultdatabase',
+        '_admin_defaultfield',
+        '_admin_defaultgroup',
+        '_admin_defaulthost',
+        '_admin_defaulttable',
+        '_admin_defaultuser',
+        '_admin_deleteconnector',
+        '_admin_deletedatabase',
+        '_admin_deletefield',
+        '_admin_deletegroup',
+        '_admin_deletehost',
+        '_admin_deletetable',
+        '_admin_deleteuser',
+        '_admin_duplicategroup',
+        '_admin_internaldatabase',
+        '_admin_listconnectors',
+        '_admin_listdatabases',
+        '_admin_listfields',
+        '_admin_listgroups',
+        '_admin_listhosts',
+        '_admin_listtables',
+        '_admin_listusers',
+        '_admin_refreshconnector',
+        '_admin_refreshsecurity',
+        '_admin_servicepath',
+        '_admin_updateconnector',
+        '_admin_updatedatabase',
+        '_admin_updatefield',
+        '_admin_updategroup',
+        '_admin_updatehost',
+        '_admin_updatetable',
+        '_admin_updateuser',
+        '_chartfx_activation_string',
+        '_chartfx_getchallengestring',
+        '_chop_args',
+        '_chop_mimes',
+        '_client_addr_old',
+        '_client_address_old',
+        '_client_ip_old',
+        '_database_names',
+        '_datasource_reload',
+        '_date_current',
+        '_date_format',
+        '_date_msec',
+        '_date_parse',
+        '_execution_timelimit',
+        '_file_chmod',
+        '_initialize',
+        '_jdbc_acceptsurl',
+        '_jdbc_debug',
+        '_jdbc_deletehost',
+        '_jdbc_driverclasses',
+        '_jdbc_driverinfo',
+        '_jdbc_metainfo',
+        '_jdbc_propertyinfo',
+        '_jdbc_setdriver',
+        '_lasso_param',
+        '_log_helper',
+        '_proc_noparam',
+        '_proc_withparam',
+        '_recursion_limit',
+        '_request_param',
+        '_security_binaryexpiration',
+        '_security_flushcaches',
+        '_security_isserialized',
+        '_security_serialexpiration',
+        '_srand',
+        '_strict_literals',
+        '_substring',
+        '_xmlrpc_exconverter',
+        '_xmlrpc_inconverter',
+        '_xmlrpc_xmlinconverter',
+        'abort',
+        'action_addinfo',
+        'action_addrecord',
+        'action_param',
+        'action_params',
+        'action_setfoundcount',
+        'action_setrecordid',
+        'action_settotalcount',
+        'action_statement',
+        'admin_allowedfileroots',
+        'admin_changeuser',
+        'admin_createuser',
+        'admin_currentgroups',
+        'admin_currentuserid',
+        'admin_currentusername',
+        'admin_getpref',
+        'admin_groupassignuser',
+        'admin_grouplistusers',
+        'admin_groupremoveuser',
+        'admin_lassoservicepath',
+        'admin_listgroups',
+        'admin_refreshlicensing',
+        'admin_refreshsecurity',
+        'admin_reloaddatasource',
+        'admin_removepref',
+        'admin_setpref',
+        'admin_userexists',
+        'admin_userlistgroups',
+        'all',
+        'and',
+        'array',
+        'array_iterator',
+        'auth',
+        'auth_admin',
+        'auth_auth',
+        'auth_custom',
+        'auth_group',
+        'auth_prompt',
+        'auth_user',
+        'base64',
+        'bean',
+        'bigint',
+        'bom_utf16be',
+        'bom_utf16le',
+        'bom_utf32be',
+        'bom_utf32le',
+        'bom_utf8',
+        'boolean',
+        'bw',
+        'bytes',
+        'cache',
+        'cache_delete',
+        'cache_empty',
+        'cache_exists',
+        'cache_fetch',
+        'cache_internal',
+        'cache_maintenance',
+        'cache_object',
+        'cache_preferences',
+        'cache_store',
+        'case',
+        'chartfx',
+        'chartfx_records',
+        'chartfx_serve',
+        'checked',
+        'choice_list',
+        'choice_listitem',
+        'choicelistitem',
+        'cipher_decrypt',
+        'cipher_digest',
+        'cipher_encrypt',
+        'cipher_hmac',
+        'cipher_keylength',
+        'cipher_list',
+        'click_text',
+        'client_addr',
+        'client_address',
+        'client_authorization',
+        'client_browser',
+        'client_contentlength',
+        'client_contenttype',
+        'client_cookielist',
+        'client_cookies',
+        'client_encoding',
+        'client_formmethod',
+        'client_getargs',
+        'client_getparams',
+        'client_headers',
+        'client_ip',
+        'client_ipfrominteger',
+        'client_iptointeger',
+        'client_password',
+        'client_postargs',
+        'client_postparams',
+        'client_type',
+        'client_url',
+        'client_username',
+        'cn',
+        'column',
+        'column_name',
+        'column_names',
+        'compare_beginswith',
+        'compare_contains',
+        'compare_endswith',
+        'compare_equalto',
+        'compare_greaterthan',
+        'compare_greaterthanorequals',
+        'compare_greaterthanorequls',
+        'compare_lessthan',
+        'compare_lessthanorequals',
+        'compare_notbeginswith',
+        'compare_notcontains',
+        'compare_notendswith',
+        'compare_notequalto',
+        'compare_notregexp',
+        'compare_regexp',
+        'compare_strictequalto',
+        'compare_strictnotequalto',
+        'compiler_removecacheddoc',
+        'compiler_setdefaultparserflags',
+        'compress',
+        'content_body',
+        'content_encoding',
+        'content_header',
+        'content_type',
+        'cookie',
+        'cookie_set',
+        'curl_ftp_getfile',
+        'curl_ftp_getlisting',
+        'curl_ftp_putfile',
+        'curl_include_url',
+        'currency',
+        'database_changecolumn',
+        'database_changefield',
+        'database_createcolumn',
+        'database_createfield',
+        'database_createtable',
+        'database_fmcontainer',
+        'database_hostinfo',
+        'database_inline',
+        'database_name',
+        'database_nameitem',
+        'database_names',
+        'database_realname',
+        'database_removecolumn',
+        'database_removefield',
+        'database_removetable',
+        'database_repeating',
+        'database_repeating_valueitem',
+        'database_repeatingvalueitem',
+        'database_schemanameitem',
+        'database_schemanames',
+        'database_tablecolumn',
+        'database_tablenameitem',
+        'database_tablenames',
+        'datasource_name',
+        'datasource_register',
+        'date',
+        'date__date_current',
+        'date__date_format',
+        'date__date_msec',
+        'date__date_parse',
+        'date_add',
+        'date_date',
+        'date_difference',
+        'date_duration',
+        'date_format',
+        'date_getcurrentdate',
+        'date_getday',
+        'date_getdayofweek',
+        'date_gethour',
+        'date_getlocaltimezone',
+        'date_getminute',
+        'date_getmonth',
+        'date_getsecond',
+        'date_gettime',
+        'date_getyear',
+        'date_gmttolocal',
+        'date_localtogmt',
+        'date_maximum',
+        'date_minimum',
+        'date_msec',
+        'date_setformat',
+        'date_subtract',
+        'db_layoutnameitem',
+        'db_layoutnames',
+        'db_nameitem',
+        'db_names',
+        'db_tablenameitem',
+        'db_tablenames',
+        'dbi_column_names',
+        'dbi_field_names',
+        'decimal',
+        'decimal_setglobaldefaultprecision',
+        'decode_base64',
+        'decode_bheader',
+        'decode_hex',
+        'decode_html',
+        'decode_json',
+        'decode_qheader',
+        'decode_quotedprintable',
+        'decode_quotedprintablebytes',
+        'decode_url',
+        'decode_xml',
+        'decompress',
+        'decrypt_blowfish',
+        'decrypt_blowfish2',
+        'default',
+        'define_atbegin',
+        'define_atend',
+        'define_constant',
+        'define_prototype',
+        'define_tag',
+        'define_tagp',
+        'define_type',
+        'define_typep',
+        'deserialize',
+        'directory_directorynameitem',
+        'directory_lister',
+        'directory_nameitem',
+        'directorynameitem',
+        'dns_default',
+        'dns_lookup',
+        'dns_response',
+        'duration',
+        'else',
+        'email_batch',
+        'email_compose',
+        'email_digestchallenge',
+        'email_digestresponse',
+        'email_extract',
+        'email_findemails',
+        'email_immediate',
+        'email_merge',
+        'email_mxerror',
+        'email_mxlookup',
+        'email_parse',
+        'email_pop',
+        'email_queue',
+        'email_result',
+        'email_safeemail',
+        'email_send',
+        'email_smtp',
+        'email_status',
+        'email_token',
+        'email_translatebreakstocrlf',
+        'encode_base64',
+        'encode_bheader',
+        'encode_break',
+        'encode_breaks',
+        'encode_crc32',
+        'encode_hex',
+        'encode_html',
+        'encode_htmltoxml',
+        'encode_json',
+        'encode_qheader',
+        'encode_quotedprintable',
+        'encode_quotedprintablebytes',
+        'encode_set',
+        'encode_smart',
+        'encode_sql',
+        'encode_sql92',
+        'encode_stricturl',
+        'encode_url',
+        'encode_xml',
+        'encrypt_blowfish',
+        'encrypt_blowfish2',
+        'encrypt_crammd5',
+        'encrypt_hmac',
+        'encrypt_md5',
+        'eq',
+        'error_adderror',
+        'error_code',
+        'error_code_aborted',
+        'error_code_assert',
+        'error_code_bof',
+        'error_code_connectioninvalid',
+        'error_code_couldnotclosefile',
+        'error_code_couldnotcreateoropenfile',
+        'error_code_couldnotdeletefile',
+        'error_code_couldnotdisposememory',
+        'error_code_couldnotlockmemory',
+        'error_code_couldnotreadfromfile',
+        'error_code_couldnotunlockmemory',
+        'error_code_couldnotwritetofile',
+        'error_code_criterianotmet',
+        'error_code_datasourceerror',
+        'error_code_directoryfull',
+        'error_code_diskfull',
+        'error_code_dividebyzero',
+        'error_code_eof',
+        'error_code_failure',
+        'error_code_fieldrestriction',
+        'error_code_file',
+        'error_code_filealreadyexists',
+        'error_code_filecorrupt',
+        'error_code_fileinvalid',
+        'error_code_fileinvalidaccessmode',
+        'error_code_fileisclosed',
+        'error_code_fileisopen',
+        'error_code_filelocked',
+        'error_code_filenotfound',
+        'error_code_fileunlocked',
+        'error_code_httpfilenotfound',
+        'error_code_illegalinstruction',
+        'error_code_illegaluseoffrozeninstance',
+        'error_code_invaliddatabase',
+        'error_code_invalidfilename',
+        'error_code_invalidmemoryobject',
+        'error_code_invalidparameter',
+        'error_code_invalidpassword',
+        'error_code_invalidpathname',
+        'error_code_invalidusername',
+        'error_code_ioerror',
+        'error_code_loopaborted',
+        'error_code_memory',
+        'error_code_network',
+        'error_code_nilpointer',
+        'error_code_noerr',
+        'error_code_nopermission',
+        'error_code_outofmemory',
+        'error_code_outofstackspace',
+        'error_code_overflow',
+        'error_code_postconditionfailed',
+        'error_code_preconditionfailed',
+        'error_code_resnotfound',
+        'error_code_resource',
+        'error_code_streamreaderror',
+        'error_code_streamwriteerror',
+        'error_code_syntaxerror',
+        'error_code_tagnotfound',
+        'error_code_unknownerror',
+        'error_code_varnotfound',
+        'error_code_volumedoesnotexist',
+        'error_code_webactionnotsupported',
+        'error_code_webadderror',
+        'error_code_webdeleteerror',
+        'error_code_webmodulenotfound',
+        'error_code_webnosuchobject',
+        'error_code_webrepeatingrelatedfield',
+        'error_code_webrequiredfieldmissing',
+        'error_code_webtimeout',
+        'error_code_webupdateerror',
+        'error_columnrestriction',
+        'error_currenterror',
+        'error_databaseconnectionunavailable',
+        'error_databasetimeout',
+        'error_deleteerror',
+        'error_fieldrestriction',
+        'error_filenotfound',
+        'error_invaliddatabase',
+        'error_invalidpassword',
+        'error_invalidusername',
+        'error_modulenotfound',
+        'error_msg',
+        'error_msg_aborted',
+        'error_msg_assert',
+        'error_msg_bof',
+        'error_msg_connectioninvalid',
+        'error_msg_couldnotclosefile',
+        'error_msg_couldnotcreateoropenfile',
+        'error_msg_couldnotdeletefile',
+        'error_msg_couldnotdisposememory',
+        'error_msg_couldnotlockmemory',
+        'error_msg_couldnotreadfromfile',
+        'error_msg_couldnotunlockmemory',
+        'error_msg_couldnotwritetofile',
+        'error_msg_criterianotmet',
+        'error_msg_datasourceerror',
+        'error_msg_directoryfull',
+        'error_msg_diskfull',
+        'error_msg_dividebyzero',
+        'error_msg_eof',
+        'error_msg_failure',
+        'error_msg_fieldrestriction',
+        'error_msg_file',
+        'error_msg_filealreadyexists',
+        'error_msg_filecorrupt',
+        'error_msg_fileinvalid',
+        'error_msg_fileinvalidaccessmode',
+        'error_msg_fileisclosed',
+        'error_msg_fileisopen',
+        'error_msg_filelocked',
+        'error_msg_filenotfound',
+        'error_msg_fileunlocked',
+        'error_msg_httpfilenotfound',
+        'error_msg_illegalinstruction',
+        'error_msg_illegaluseoffrozeninstance',
+        'error_msg_invaliddatabase',
+        'error_msg_invalidfilename',
+        'error_msg_invalidmemoryobject',
+        'error_msg_invalidparameter',
+        'error_msg_invalidpassword',
+        'error_msg_invalidpathname',
+        'error_msg_invalidusername',
+        'error_msg_ioerror',
+        'error_msg_loopaborted',
+        'error_msg_memory',
+        'error_msg_network',
+        'error_msg_nilpointer',
+        'error_msg_noerr',
+        'error_msg_nopermission',
+        'error_msg_outofmemory',
+        'error_msg_outofstackspace',
+        'error_msg_overflow',
+        'error_msg_postconditionfailed',
+        'error_msg_preconditionfailed',
+        'error_msg_resnotfound',
+        'error_msg_resource',
+        'error_msg_streamreaderror',
+        'error_msg_streamwriteerror',
+        'error_msg_syntaxerror',
+        'error_msg_tagnotfound',
+        'error_msg_unknownerror',
+        'error_msg_varnotfound',
+        'error_msg_volumedoesnotexist',
+        'error_msg_webactionnotsupported',
+        'error_msg_webadderror',
+        'error_msg_webdeleteerror',
+        'error_msg_webmodulenotfound',
+        'error_msg_webnosuchobject',
+        'error_msg_webrepeatingrelatedfield',
+        'error_msg_webrequiredfieldmissing',
+        'error_msg_webtimeout',
+        'error_msg_webupdateerror',
+        'error_noerror',
+        'error_nopermission',
+        'error_norecordsfound',
+        'error_outofmemory',
+        'error_pop',
+        'error_push',
+        'error_reqcolumnmissing',
+        'error_reqfieldmissing',
+        'error_requiredcolumnmissing',
+        'error_requiredfieldmissing',
+        'error_reset',
+        'error_seterrorcode',
+        'error_seterrormessage',
+        'error_updateerror',
+        'euro',
+        'event_schedule',
+        'ew',
+        'fail',
+        'fail_if',
+        'false',
+        'field',
+        'field_name',
+        'field_names',
+        'file',
+        'file_autoresolvefullpaths',
+        'file_chmod',
+        'file_control',
+        'file_copy',
+        'file_create',
+        'file_creationdate',
+        'file_currenterror',
+        'file_delete',
+        'file_exists',
+        'file_getlinecount',
+        'file_getsize',
+        'file_isdirectory',
+        'file_listdirectory',
+        'file_moddate',
+        'file_modechar',
+        'file_modeline',
+        'file_move',
+        'file_openread',
+        'file_openreadwrite',
+        'file_openwrite',
+        'file_openwriteappend',
+        'file_openwritetruncate',
+        'file_probeeol',
+        'file_processuploads',
+        'file_read',
+        'file_readline',
+        'file_rename',
+        'file_serve',
+        'file_setsize',
+        'file_stream',
+        'file_streamcopy',
+        'file_uploads',
+        'file_waitread',
+        'file_waittimeout',
+        'file_waitwrite',
+        'file_write',
+        'find_soap_ops',
+        'form_param',
+        'found_count',
+        'ft',
+        'ftp_getfile',
+        'ftp_getlisting',
+        'ftp_putfile',
+        'full',
+        'global',
+        'global_defined',
+        'global_remove',
+        'global_reset',
+        'globals',
+        'gt',
+        'gte',
+        'handle',
+        'handle_error',
+        'header',
+        'html_comment',
+        'http_getfile',
+        'ical_alarm',
+        'ical_attribute',
+        'ical_calendar',
+        'ical_daylight',
+        'ical_event',
+        'ical_freebusy',
+        'ical_item',
+        'ical_journal',
+        'ical_parse',
+        'ical_standard',
+        'ical_timezone',
+        'ical_todo',
+        'if',
+        'if_empty',
+        'if_false',
+        'if_null',
+        'if_true',
+        'image',
+        'image_url',
+        'img',
+        'include',
+        'include_cgi',
+        'include_currentpath',
+        'include_once',
+        'include_raw',
+        'include_url',
+        'inline',
+        'integer',
+        'iterate',
+        'iterator',
+        'java',
+        'java_bean',
+        'json_records',
+        'json_rpccall',
+        'keycolumn_name',
+        'keycolumn_value',
+        'keyfield_name',
+        'keyfield_value',
+        'lasso_comment',
+        'lasso_currentaction',
+        'lasso_datasourceis',
+        'lasso_datasourceis4d',
+        'lasso_datasourceisfilemaker',
+        'lasso_datasourceisfilemaker7',
+        'lasso_datasourceisfilemaker9',
+        'lasso_datasourceisfilemakersa',
+        'lasso_datasourceisjdbc',
+        'lasso_datasourceislassomysql',
+        'lasso_datasourceismysql',
+        'lasso_datasourceisodbc',
+        'lasso_datasourceisopenbase',
+        'lasso_datasourceisoracle',
+        'lasso_datasourceispostgresql',
+        'lasso_datasourceisspotlight',
+        'lasso_datasourceissqlite',
+        'lasso_datasourceissqlserver',
+        'lasso_datasourcemodulename',
+        'lasso_datatype',
+        'lasso_disableondemand',
+        'lasso_errorreporting',
+        'lasso_executiontimelimit',
+        'lasso_parser',
+        'lasso_process',
+        'lasso_sessionid',
+        'lasso_siteid',
+        'lasso_siteisrunning',
+        'lasso_sitename',
+        'lasso_siterestart',
+        'lasso_sitestart',
+        'lasso_sitestop',
+        'lasso_tagexists',
+        'lasso_tagmodulename',
+        'lasso_uniqueid',
+        'lasso_updatecheck',
+        'lasso_uptime',
+        'lasso_version',
+        'lassoapp_create',
+        'lassoapp_dump',
+        'lassoapp_flattendir',
+        'lassoapp_getappdata',
+        'lassoapp_link',
+        'lassoapp_list',
+        'lassoapp_process',
+        'lassoapp_unitize',
+        'layout_name',
+        'ldap',
+        'ldap_scope_base',
+        'ldap_scope_onelevel',
+        'ldap_scope_subtree',
+        'ldml',
+        'ldml_ldml',
+        'library',
+        'library_once',
+        'link',
+        'link_currentaction',
+        'link_currentactionparams',
+        'link_currentactionurl',
+        'link_currentgroup',
+        'link_currentgroupparams',
+        'link_currentgroupurl',
+        'link_currentrecord',
+        'link_currentrecordparams',
+        'link_currentrecordurl',
+        'link_currentsearch',
+        'link_currentsearchparams',
+        'link_currentsearchurl',
+        'link_detail',
+        'link_detailparams',
+        'link_detailurl',
+        'link_firstgroup',
+        'link_firstgroupparams',
+        'link_firstgroupurl',
+        'link_firstrecord',
+        'link_firstrecordparams',
+        'link_firstrecordurl',
+        'link_lastgroup',
+        'link_lastgroupparams',
+        'link_lastgroupurl',
+        'link_lastrecord',
+        'link_lastrecordparams',
+        'link_lastrecordurl',
+        'link_nextgroup',
+        'link_nextgroupparams',
+        'link_nextgroupurl',
+        'link_nextrecord',
+        'link_nextrecordparams',
+        'link_nextrecordurl',
+        'link_params',
+        'link_prevgroup',
+        'link_prevgroupparams',
+        'link_prevgroupurl',
+        'link_prevrecord',
+        'link_prevrecordparams',
+        'link_prevrecordurl',
+        'link_setformat',
+        'link_url',
+        'list',
+        'list_additem',
+        'list_fromlist',
+        'list_fromstring',
+        'list_getitem',
+        'list_itemcount',
+        'list_iterator',
+        'list_removeitem',
+        'list_replaceitem',
+        'list_reverseiterator',
+        'list_tostring',
+        'literal',
+        'ljax_end',
+        'ljax_hastarget',
+        'ljax_include',
+        'ljax_start',
+        'ljax_target',
+        'local',
+        'local_defined',
+        'local_remove',
+        'local_reset',
+        'locale_format',
+        'locals',
+        'log',
+        'log_always',
+        'log_critical',
+        'log_deprecated',
+        'log_destination_console',
+        'log_destination_database',
+        'log_destination_file',
+        'log_detail',
+        'log_level_critical',
+        'log_level_deprecated',
+        'log_level_detail',
+        'log_level_sql',
+        'log_level_warning',
+        'log_setdestination',
+        'log_sql',
+        'log_warning',
+        'logicalop_value',
+        'logicaloperator_value',
+        'loop',
+        'loop_abort',
+        'loop_continue',
+        'loop_count',
+        'lt',
+        'lte',
+        'magick_image',
+        'map',
+        'map_iterator',
+        'match_comparator',
+        'match_notrange',
+        'match_notregexp',
+        'match_range',
+        'match_regexp',
+        'math_abs',
+        'math_acos',
+        'math_add',
+        'math_asin',
+        'math_atan',
+        'math_atan2',
+        'math_ceil',
+        'math_converteuro',
+        'math_cos',
+        'math_div',
+        'math_exp',
+        'math_floor',
+        'math_internal_rand',
+        'math_internal_randmax',
+        'math_internal_srand',
+        'math_ln',
+        'math_log',
+        'math_log10',
+        'math_max',
+        'math_min',
+        'math_mod',
+        'math_mult',
+        'math_pow',
+        'math_random',
+        'math_range',
+        'math_rint',
+        'math_roman',
+        'math_round',
+        'math_sin',
+        'math_sqrt',
+        'math_sub',
+        'math_tan',
+        'maxrecords_value',
+        'memory_session_driver',
+        'mime_type',
+        'minimal',
+        'misc__srand',
+        'misc_randomnumber',
+        'misc_roman',
+        'misc_valid_creditcard',
+        'mysql_session_driver',
+        'named_param',
+        'namespace_current',
+        'namespace_delimiter',
+        'namespace_exists',
+        'namespace_file_fullpathexists',
+        'namespace_global',
+        'namespace_import',
+        'namespace_load',
+        'namespace_page',
+        'namespace_unload',
+        'namespace_using',
+        'neq',
+        'net',
+        'net_connectinprogress',
+        'net_connectok',
+        'net_typessl',
+        'net_typessltcp',
+        'net_typessludp',
+        'net_typetcp',
+        'net_typeudp',
+        'net_waitread',
+        'net_waittimeout',
+        'net_waitwrite',
+        'no_default_output',
+        'none',
+        'noprocess',
+        'not',
+        'nrx',
+        'nslookup',
+        'null',
+        'object',
+        'once',
+        'oneoff',
+        'op_logicalvalue',
+        'operator_logicalvalue',
+        'option',
+        'or',
+        'os_process',
+        'output',
+        'output_none',
+        'pair',
+        'params_up',
+        'pdf_barcode',
+        'pdf_color',
+        'pdf_doc',
+        'pdf_font',
+        'pdf_image',
+        'pdf_list',
+        'pdf_read',
+        'pdf_serve',
+        'pdf_table',
+        'pdf_text',
+        'percent',
+        'portal',
+        'postcondition',
+        'precondition',
+        'prettyprintingnsmap',
+        'prettyprintingtypemap',
+        'priorityqueue',
+        'private',
+        'proc_convert',
+        'proc_convertbody',
+        'proc_convertone',
+        'proc_extract',
+        'proc_extractone',
+        'proc_find',
+        'proc_first',
+        'proc_foreach',
+        'proc_get',
+        'proc_join',
+        'proc_lasso',
+        'proc_last',
+        'proc_map_entry',
+        'proc_null',
+        'proc_regexp',
+        'proc_xml',
+        'proc_xslt',
+        'process',
+        'protect',
+        'queue',
+        'rand',
+        'randomnumber',
+        'raw',
+        'recid_value',
+        'record_count',
+        'recordcount',
+        'recordid_value',
+        'records',
+        'records_array',
+        'records_map',
+        'redirect_url',
+        'reference',
+        'referer',
+        'referer_url',
+        'referrer',
+        'referrer_url',
+        'regexp',
+        'repeating',
+        'repeating_valueitem',
+        'repeatingvalueitem',
+        'repetition',
+        'req_column',
+        'req_field',
+        'required_column',
+        'required_field',
+        'response_fileexists',
+        'response_filepath',
+        'response_localpath',
+        'response_path',
+        'response_realm',
+        'resultset',
+        'resultset_count',
+        'return',
+        'return_value',
+        'reverseiterator',
+        'roman',
+        'row_count',
+        'rows',
+        'rows_array',
+        'run_children',
+        'rx',
+        'schema_name',
+        'scientific',
+        'search_args',
+        'search_arguments',
+        'search_columnitem',
+        'search_fielditem',
+        'search_operatoritem',
+        'search_opitem',
+        'search_valueitem',
+        'searchfielditem',
+        'searchoperatoritem',
+        'searchopitem',
+        'searchvalueitem',
+        'select',
+        'selected',
+        'self',
+        'serialize',
+        'series',
+        'server_date',
+        'server_day',
+        'server_ip',
+        'server_name',
+        'server_port',
+        'server_push',
+        'server_siteisrunning',
+        'server_sitestart',
+        'server_sitestop',
+        'server_time',
+        'session_abort',
+        'session_addoutputfilter',
+        'session_addvar',
+        'session_addvariable',
+        'session_deleteexpired',
+        'session_driver',
+        'session_end',
+        'session_id',
+        'session_removevar',
+        'session_removevariable',
+        'session_result',
+        'session_setdriver',
+        'session_start',
+        'set',
+        'set_iterator',
+        'set_reverseiterator',
+        'shown_count',
+        'shown_first',
+        'shown_last',
+        'site_atbegin',
+        'site_id',
+        'site_name',
+        'site_restart',
+        'skiprecords_value',
+        'sleep',
+        'soap_convertpartstopairs',
+        'soap_definetag',
+        'soap_info',
+        'soap_lastrequest',
+        'soap_lastresponse',
+        'soap_stub',
+        'sort_args',
+        'sort_arguments',
+        'sort_columnitem',
+        'sort_fielditem',
+        'sort_orderitem',
+        'sortcolumnitem',
+        'sortfielditem',
+        'sortorderitem',
+        'sqlite_createdb',
+        'sqlite_session_driver',
+        'sqlite_setsleepmillis',
+        'sqlite_setsleeptries',
+        'srand',
+        'stack',
+        'stock_quote',
+        'string',
+        'string_charfromname',
+        'string_concatenate',
+        'string_countfields',
+        'string_endswith',
+        'string_extract',
+        'string_findposition',
+        'string_findregexp',
+        'string_fordigit',
+        'string_getfield',
+        'string_getunicodeversion',
+        'string_insert',
+        'string_isalpha',
+        'string_isalphanumeric',
+        'string_isdigit',
+        'string_ishexdigit',
+        'string_islower',
+        'string_isnumeric',
+        'string_ispunctuation',
+        'string_isspace',
+        'string_isupper',
+        'string_length',
+        'string_lowercase',
+        'string_remove',
+        'string_removeleading',
+        'string_removetrailing',
+        'string_replace',
+        'string_replaceregexp',
+        'string_todecimal',
+        'string_tointeger',
+        'string_uppercase',
+        'string_validcharset',
+        'table_name',
+        'table_realname',
+        'tag',
+        'tag_name',
+        'tags',
+        'tags_find',
+        'tags_list',
+        'tcp_close',
+        'tcp_open',
+        'tcp_send',
+        'tcp_tcp_close',
+        'tcp_tcp_open',
+        'tcp_tcp_send',
+        'thread_abort',
+        'thread_atomic',
+        'thread_event',
+        'thread_exists',
+        'thread_getcurrentid',
+        'thread_getpriority',
+        'thread_info',
+        'thread_list',
+        'thread_lock',
+        'thread_pipe',
+        'thread_priority_default',
+        'thread_priority_high',
+        'thread_priority_low',
+        'thread_rwlock',
+        'thread_semaphore',
+        'thread_setpriority',
+        'token_value',
+        'total_records',
+        'treemap',
+        'treemap_iterator',
+        'true',
+        'url_rewrite',
+        'valid_creditcard',
+        'valid_date',
+        'valid_email',
+        'valid_url',
+        'value_list',
+        'value_listitem',
+        'valuelistitem',
+        'var',
+        'var_defined',
+        'var_remove',
+        'var_reset',
+        'var_set',
+        'variable',
+        'variable_defined',
+        'variable_set',
+        'variables',
+        'variant_count',
+        'vars',
+        'wap_isenabled',
+        'wap_maxbuttons',
+        'wap_maxcolumns',
+        'wap_maxhorzpixels',
+        'wap_maxrows',
+        'wap_maxvertpixels',
+        'while',
+        'wsdl_extract',
+        'wsdl_getbinding',
+        'wsdl_getbindingforoperation',
+        'wsdl_getbindingoperations',
+        'wsdl_getmessagenamed',
+        'wsdl_getmessageparts',
+        'wsdl_getmessagetriofromporttype',
+        'wsdl_getopbodystyle',
+        'wsdl_getopbodyuse',
+        'wsdl_getoperation',
+        'wsdl_getoplocation',
+        'wsdl_getopmessagetypes',
+        'wsdl_getopsoapaction',
+        'wsdl_getportaddress',
+        'wsdl_getportsforservice',
+        'wsdl_getporttype',
+        'wsdl_getporttypeoperation',
+        'wsdl_getservicedocumentation',
+        'wsdl_getservices',
+        'wsdl_gettargetnamespace',
+        'wsdl_issoapoperation',
+        'wsdl_listoperations',
+        'wsdl_maketest',
+        'xml',
+        'xml_extract',
+        'xml_rpc',
+        'xml_rpccall',
+        'xml_rw',
+        'xml_serve',
+        'xml_transform',
+        'xml_xml',
+        'xml_xmlstream',
+        'xmlstream',
+        'xsd_attribute',
+        'xsd_blankarraybase',
+        'xsd_blankbase',
+        'xsd_buildtype',
+        'xsd_cache',
+        'xsd_checkcardinality',
+        'xsd_continueall',
+        'xsd_continueannotation',
+        'xsd_continueany',
+        'xsd_continueanyattribute',
+        'xsd_continueattribute',
+        'xsd_continueattributegroup',
+        'xsd_continuechoice',
+        'xsd_continuecomplexcontent',
+        'xsd_continuecomplextype',
+        'xsd_continuedocumentation',
+        'xsd_continueextension',
+        'xsd_continuegroup',
+        'xsd_continuekey',
+        'xsd_continuelist',
+        'xsd_continuerestriction',
+        'xsd_continuesequence',
+        'xsd_continuesimplecontent',
+        'xsd_continuesimpletype',
+        'xsd_continueunion',
+        'xsd_deserialize',
+        'xsd_fullyqualifyname',
+        'xsd_generate',
+        'xsd_generateblankfromtype',
+        'xsd_generateblanksimpletype',
+        'xsd_generatetype',
+        'xsd_getschematype',
+        'xsd_issimpletype',
+        'xsd_loadschema',
+        'xsd_lookupnamespaceuri',
+        'xsd_lookuptype',
+        'xsd_processany',
+        'xsd_processattribute',
+        'xsd_processattributegroup',
+        'xsd_processcomplextype',
+        'xsd_processelement',
+        'xsd_processgroup',
+        'xsd_processimport',
+        'xsd_processinclude',
+        'xsd_processschema',
+        'xsd_processsimpletype',
+        'xsd_ref',
+        'xsd_type'
+    )
+}
+MEMBERS = {
+    'Member Methods': (
+        'escape_member',
+        'oncompare',
+        'sameas',
+        'isa',
+        'ascopy',
+        'asstring',
+        'ascopydeep',
+        'type',
+        'trait',
+        'parent',
+        'settrait',
+        'oncreate',
+        'listmethods',
+        'hasmethod',
+        'invoke',
+        'addtrait',
+        'isnota',
+        'isallof',
+        'isanyof',
+        'size',
+        'gettype',
+        'istype',
+        'doccomment',
+        'requires',
+        'provides',
+        'name',
+        'subtraits',
+        'description',
+        'hash',
+        'hosttonet16',
+        'hosttonet32',
+        'nettohost16',
+        'nettohost32',
+        'nettohost64',
+        'hosttonet64',
+        'bitset',
+        'bittest',
+        'bitflip',
+        'bitclear',
+        'bitor',
+        'bitand',
+        'bitxor',
+        'bitnot',
+        'bitshiftleft',
+        'bitshiftright',
+        'bytes',
+        'abs',
+        'div',
+        'dereferencepointer',
+        'asdecimal',
+        'serializationelements',
+        'acceptdeserializedelement',
+        'serialize',
+        'deg2rad',
+        'asstringhex',
+        'asstringoct',
+        'acos',
+        'asin',
+        'atan',
+        'atan2',
+        'ceil',
+        'cos',
+        'cosh',
+        'exp',
+        'fabs',
+        'floor',
+        'frexp',
+        'ldexp',
+        'log',
+        'log10',
+        'modf',
+        'pow',
+        'sin',
+        'sinh',
+        'sqrt',
+        'tan',
+        'tanh',
+        'erf',
+        'erfc',
+        'gamma',
+        'hypot',
+        'j0',
+        'j1',
+        'jn',
+        'lgamma',
+        'y0',
+        'y1',
+        'yn',
+        'isnan',
+        'acosh',
+        'asinh',
+        'atanh',
+        'cbrt',
+        'expm1',
+        'nextafter',
+        'scalb',
+        'ilogb',
+        'log1p',
+        'logb',
+        'remainder',
+        'rint',
+        'asinteger',
+        'self',
+        'detach',
+        'restart',
+        'resume',
+        'continuation',
+        'home',
+        'callsite_file',
+        'callsite_line',
+        'callsite_col',
+        'callstack',
+        'splitthread',
+        'threadreaddesc',
+        'givenblock',
+        'autocollectbuffer',
+        'calledname',
+        'methodname',
+        'invokeuntil',
+        'invokewhile',
+        'invokeautocollect',
+        'asasync',
+        'append',
+        'appendchar',
+        'private_find',
+        'private_findlast',
+        'length',
+        'chardigitvalue',
+        'private_compare',
+        'remove',
+        'charname',
+        'chartype',
+        'decompose',
+        'normalize',
+        'digit',
+        'foldcase',
+        'sub',
+        'integer',
+        'private_merge',
+        'unescape',
+        'trim',
+        'titlecase',
+        'reverse',
+        'getisocomment',
+        'getnumericvalue',
+        'totitle',
+        'toupper',
+        'tolower',
+        'lowercase',
+        'uppercase',
+        'isalnum',
+        'isalpha',
+        'isbase',
+        'iscntrl',
+        'isdigit',
+        'isxdigit',
+        'islower',
+        'isprint',
+        'isspace',
+        'istitle',
+        'ispunct',
+        'isgraph',
+        'isblank',
+        'isualphabetic',
+        'isulowercase',
+        'isupper',
+        'isuuppercase',
+        'isuwhitespace',
+        'iswhitespace',
+        'encodehtml',
+        'decodehtml',
+        'encodexml',
+        'decodexml',
+        'encodehtmltoxml',
+        'getpropertyvalue',
+        'hasbinaryproperty',
+        'asbytes',
+        'find',
+        'findlast',
+        'contains',
+        'get',
+        'equals',
+        'compare',
+        'comparecodepointorder',
+        'padleading',
+        'padtrailing',
+        'merge',
+        'split',
+        'removeleading',
+        'removetrailing',
+        'beginswith',
+        'endswith',
+        'replace',
+        'values',
+        'foreachcharacter',
+        'foreachlinebreak',
+        'foreachwordbreak',
+        'eachwordbreak',
+        'eachcharacter',
+        'foreachmatch',
+        'eachmatch',
+        'encodesql92',
+        'encodesql',
+        'keys',
+        'decomposeassignment',
+        'firstcomponent',
+        'ifempty',
+        'eachsub',
+        'stripfirstcomponent',
+        'isnotempty',
+        'first',
+        'lastcomponent',
+        'foreachpathcomponent',
+        'isfullpath',
+        'back',
+        'second',
+        'componentdelimiter',
+        'isempty',
+        'foreachsub',
+        'front',
+        'striplastcomponent',
+        'eachcomponent',
+        'eachline',
+        'splitextension',
+        'hastrailingcomponent',
+        'last',
+        'ifnotempty',
+        'extensiondelimiter',
+        'eachword',
+        'substring',
+        'setsize',
+        'reserve',
+        'getrange',
+        'private_setrange',
+        'importas',
+        'import8bits',
+        'import32bits',
+        'import64bits',
+        'import16bits',
+        'importbytes',
+        'importpointer',
+        'export8bits',
+        'export16bits',
+        'export32bits',
+        'export64bits',
+        'exportbytes',
+        'exportsigned8bits',
+        'exportsigned16bits',
+        'exportsigned32bits',
+        'exportsigned64bits',
+        'marker',
+        'swapbytes',
+        'encodeurl',
+        'decodeurl',
+        'encodebase64',
+        'decodebase64',
+        'encodeqp',
+        'decodeqp',
+        'encodemd5',
+        'encodehex',
+        'decodehex',
+        'uncompress',
+        'compress',
+        'detectcharset',
+        'bestcharset',
+        'crc',
+        'importstring',
+        'setrange',
+        'exportas',
+        'exportstring',
+        'exportpointerbits',
+        'foreachbyte',
+        'eachbyte',
+        'setposition',
+        'position',
+        'value',
+        'join',
+        'asstaticarray',
+        'foreach',
+        'findposition',
+        'min',
+        'groupjoin',
+        'orderbydescending',
+        'average',
+        'take',
+        'do',
+        'selectmany',
+        'skip',
+        'select',
+        'sum',
+        'max',
+        'asarray',
+        'thenbydescending',
+        'aslist',
+        'orderby',
+        'thenby',
+        'where',
+        'groupby',
+        'asgenerator',
+        'typename',
+        'returntype',
+        'restname',
+        'paramdescs',
+        'action',
+        'statement',
+        'inputcolumns',
+        'keycolumns',
+        'returncolumns',
+        'sortcolumns',
+        'skiprows',
+        'maxrows',
+        'rowsfound',
+        'statementonly',
+        'lop',
+        'databasename',
+        'tablename',
+        'schemaname',
+        'hostid',
+        'hostdatasource',
+        'hostname',
+        'hostport',
+        'hostusername',
+        'hostpassword',
+        'hostschema',
+        'hosttableencoding',
+        'hostextra',
+        'hostisdynamic',
+        'refobj',
+        'connection',
+        'prepared',
+        'getset',
+        'addset',
+        'numsets',
+        'addrow',
+        'addcolumninfo',
+        'forcedrowid',
+        'makeinheritedcopy',
+        'filename',
+        'expose',
+        'recover',
+        'insert',
+        'removeall',
+        'count',
+        'exchange',
+        'findindex',
+        'foreachpair',
+        'foreachkey',
+        'sort',
+        'insertfirst',
+        'difference',
+        'removeback',
+        'insertback',
+        'removelast',
+        'removefront',
+        'insertfrom',
+        'intersection',
+        'top',
+        'insertlast',
+        'push',
+        'union',
+        'removefirst',
+        'insertfront',
+        'pop',
+        'fd',
+        'family',
+        'isvalid',
+        'isssl',
+        'open',
+        'close',
+        'read',
+        'write',
+        'ioctl',
+        'seek',
+        'mode',
+        'mtime',
+        'atime',
+        'dup',
+        'dup2',
+        'fchdir',
+        'fchown',
+        'fsync',
+        'ftruncate',
+        'fchmod',
+        'sendfd',
+        'receivefd',
+        'readobject',
+        'tryreadobject',
+        'writeobject',
+        'leaveopen',
+        'rewind',
+        'tell',
+        'language',
+        'script',
+        'country',
+        'variant',
+        'displaylanguage',
+        'displayscript',
+        'displaycountry',
+        'displayvariant',
+        'displayname',
+        'basename',
+        'keywords',
+        'iso3language',
+        'iso3country',
+        'formatas',
+        'formatnumber',
+        'parsenumber',
+        'parseas',
+        'format',
+        'parse',
+        'add',
+        'roll',
+        'set',
+        'getattr',
+        'setattr',
+        'clear',
+        'isset',
+        'settimezone',
+        'timezone',
+        'time',
+        'indaylighttime',
+        'createdocument',
+        'parsedocument',
+        'hasfeature',
+        'createdocumenttype',
+        'nodename',
+        'nodevalue',
+        'nodetype',
+        'parentnode',
+        'childnodes',
+        'firstchild',
+        'lastchild',
+        'previoussibling',
+        'nextsibling',
+        'attributes',
+        'ownerdocument',
+        'namespaceuri',
+        'prefix',
+        'localname',
+        'insertbefore',
+        'replacechild',
+        'removechild',
+        'appendchild',
+        'haschildnodes',
+        'clonenode',
+        'issupported',
+        'hasattributes',
+        'extract',
+        'extractone',
+        'extractfast',
+        'transform',
+        'foreachchild',
+        'eachchild',
+        'extractfastone',
+        'data',
+        'substringdata',
+        'appenddata',
+        'insertdata',
+        'deletedata',
+        'replacedata',
+        'doctype',
+        'implementation',
+        'documentelement',
+        'createelement',
+        'createdocumentfragment',
+        'createtextnode',
+        'createcomment',
+        'createcdatasection',
+        'createprocessinginstruction',
+        'createattribute',
+        'createentityreference',
+        'getelementsbytagname',
+        'importnode',
+        'createelementns',
+        'createattributens',
+        'getelementsbytagnamens',
+        'getelementbyid',
+        'tagname',
+        'getattribute',
+        'setattribute',
+        'removeattribute',
+        'getattributenode',
+        'setattributenode',
+        'removeattributenode',
+        'getattributens',
+        'setattributens',
+        'removeattributens',
+        'getattributenodens',
+        'setattributenodens',
+        'hasattribute',
+        'hasattributens',
+        'setname',
+        'contents',
+        'specified',
+        'ownerelement',
+        'splittext',
+        'notationname',
+        'publicid',
+        'systemid',
+        'target',
+        'entities',
+        'notations',
+        'internalsubset',
+        'item',
+        'getnameditem',
+        'getnameditemns',
+        'setnameditem',
+        'setnameditemns',
+        'removenameditem',
+        'removenameditemns',
+        'askeyedgenerator',
+        'eachpair',
+        'eachkey',
+        'next',
+        'readstring',
+        'readattributevalue',
+        'attributecount',
+        'baseuri',
+        'depth',
+        'hasvalue',
+        'isemptyelement',
+        'xmllang',
+        'getattributenamespace',
+        'lookupnamespace',
+        'movetoattribute',
+        'movetoattributenamespace',
+        'movetofirstattribute',
+        'movetonextattribute',
+        'movetoelement',
+        'prepare',
+        'last_insert_rowid',
+        'total_changes',
+        'interrupt',
+        'errcode',
+        'errmsg',
+        'addmathfunctions',
+        'finalize',
+        'step',
+        'bind_blob',
+        'bind_double',
+        'bind_int',
+        'bind_null',
+        'bind_text',
+        'bind_parameter_index',
+        'reset',
+        'column_count',
+        'column_name',
+        'column_decltype',
+        'column_blob',
+        'column_double',
+        'column_int64',
+        'column_text',
+        'column_type',
+        'ismultipart',
+        'gotfileupload',
+        'setmaxfilesize',
+        'getparts',
+        'trackingid',
+        'currentfile',
+        'addtobuffer',
+        'input',
+        'replacepattern',
+        'findpattern',
+        'ignorecase',
+        'setinput',
+        'setreplacepattern',
+        'setfindpattern',
+        'setignorecase',
+        'output',
+        'appendreplacement',
+        'matches',
+        'private_replaceall',
+        'appendtail',
+        'groupcount',
+        'matchposition',
+        'matchesstart',
+        'private_replacefirst',
+        'private_split',
+        'matchstring',
+        'replaceall',
+        'replacefirst',
+        'findall',
+        'findcount',
+        'findfirst',
+        'findsymbols',
+        'loadlibrary',
+        'getlibrary',
+        'atend',
+        'f',
+        'r',
+        'form',
+        'gen',
+        'callfirst',
+        'key',
+        'by',
+        'from',
+        'init',
+        'to',
+        'd',
+        't',
+        'object',
+        'inneroncompare',
+        'members',
+        'writeid',
+        'addmember',
+        'refid',
+        'index',
+        'objects',
+        'tabs',
+        'trunk',
+        'trace',
+        'asxml',
+        'tabstr',
+        'toxmlstring',
+        'document',
+        'idmap',
+        'readidobjects',
+        'left',
+        'right',
+        'up',
+        'red',
+        'root',
+        'getnode',
+        'firstnode',
+        'lastnode',
+        'nextnode',
+        'private_rebalanceforremove',
+        'private_rotateleft',
+        'private_rotateright',
+        'private_rebalanceforinsert',
+        'eachnode',
+        'foreachnode',
+        'encoding',
+        'resolvelinks',
+        'readbytesfully',
+        'dowithclose',
+        'readsomebytes',
+        'readbytes',
+        'writestring',
+        'parentdir',
+        'aslazystring',
+        'path',
+        'openread',
+        'openwrite',
+        'openwriteonly',
+        'openappend',
+        'opentruncate',
+        'writebytes',
+        'exists',
+        'modificationtime',
+        'lastaccesstime',
+        'modificationdate',
+        'lastaccessdate',
+        'delete',
+        'moveto',
+        'copyto',
+        'linkto',
+        'flush',
+        'chmod',
+        'chown',
+        'isopen',
+        'setmarker',
+        'setmode',
+        'foreachline',
+        'lock',
+        'unlock',
+        'trylock',
+        'testlock',
+        'perms',
+        'islink',
+        'isdir',
+        'realpath',
+        'openwith',
+        'asraw',
+        'rawdiff',
+        'getformat',
+        'setformat',
+        'subtract',
+        'gmt',
+        'dst',
+        'era',
+        'year',
+        'month',
+        'week',
+        'weekofyear',
+        'weekofmonth',
+        'day',
+        'dayofmonth',
+        'dayofyear',
+        'dayofweek',
+        'dayofweekinmonth',
+        'ampm',
+        'am',
+        'pm',
+        'hour',
+        'hourofday',
+        'hourofampm',
+        'minute',
+        'millisecond',
+        'zoneoffset',
+        'dstoffset',
+        'yearwoy',
+        'dowlocal',
+        'extendedyear',
+        'julianday',
+        'millisecondsinday',
+        'firstdayofweek',
+        'fixformat',
+        'minutesbetween',
+        'hoursbetween',
+        'secondsbetween',
+        'daysbetween',
+        'businessdaysbetween',
+        'pdifference',
+        'getfield',
+        'create',
+        'setcwd',
+        'foreachentry',
+        'eachpath',
+        'eachfilepath',
+        'eachdirpath',
+        'each',
+        'eachfile',
+        'eachdir',
+        'eachpathrecursive',
+        'eachfilepathrecursive',
+        'eachdirpathrecursive',
+        'eachentry',
+        'makefullpath',
+        'annotate',
+        'blur',
+        'command',
+        'composite',
+        'contrast',
+        'convert',
+        'crop',
+        'execute',
+        'enhance',
+        'flipv',
+        'fliph',
+        'modulate',
+        'rotate',
+        'save',
+        'scale',
+        'sharpen',
+        'addcomment',
+        'comments',
+        'describe',
+        'file',
+        'height',
+        'pixel',
+        'resolutionv',
+        'resolutionh',
+        'width',
+        'setcolorspace',
+        'colorspace',
+        'debug',
+        'histogram',
+        'imgptr',
+        'appendimagetolist',
+        'fx',
+        'applyheatcolors',
+        'authenticate',
+        'search',
+        'searchurl',
+        'readerror',
+        'readline',
+        'setencoding',
+        'closewrite',
+        'exitcode',
+        'getversion',
+        'findclass',
+        'throw',
+        'thrownew',
+        'exceptionoccurred',
+        'exceptiondescribe',
+        'exceptionclear',
+        'fatalerror',
+        'newglobalref',
+        'deleteglobalref',
+        'deletelocalref',
+        'issameobject',
+        'allocobject',
+        'newobject',
+        'getobjectclass',
+        'isinstanceof',
+        'getmethodid',
+        'callobjectmethod',
+        'callbooleanmethod',
+        'callbytemethod',
+        'callcharmethod',
+        'callshortmethod',
+        'callintmethod',
+        'calllongmethod',
+        'callfloatmethod',
+        'calldoublemethod',
+        'callvoidmethod',
+        'callnonvirtualobjectmethod',
+        'callnonvirtualbooleanmethod',
+        'callnonvirtualbytemethod',
+        'callnonvirtualcharmethod',
+        'callnonvirtualshortmethod',
+        'callnonvirtualintmethod',
+        'callnonvirtuallongmethod',
+        'callnonvirtualfloatmethod',
+        'callnonvirtualdoublemethod',
+        'callnonvirtualvoidmethod',
+        'getfieldid',
+        'getobjectfield',
+        'getbooleanfield',
+        'getbytefield',
+        'getcharfield',
+        'getshortfield',
+        'getintfield',
+        'getlongfield',
+        'getfloatfield',
+        'getdoublefield',
+        'setobjectfield',
+        'setbooleanfield',
+        'setbytefield',
+        'setcharfield',
+        'setshortfield',
+        'setintfield',
+        'setlongfield',
+        'setfloatfield',
+        'setdoublefield',
+        'getstaticmethodid',
+        'callstaticobjectmethod',
+        'callstaticbooleanmethod',
+        'callstaticbytemethod',
+        'callstaticcharmethod',
+        'callstaticshortmethod',
+        'callstaticintmethod',
+        'callstaticlongmethod',
+        'callstaticfloatmethod',
+        'callstaticdoublemethod',
+        'callstaticvoidmethod',
+        'getstaticfieldid',
+        'getstaticobjectfield',
+        'getstaticbooleanfield',
+        'getstaticbytefield',
+        'getstaticcharfield',
+        'getstaticshortfield',
+        'getstaticintfield',
+        'getstaticlongfield',
+        'getstaticfloatfield',
+        'getstaticdoublefield',
+        'setstaticobjectfield',
+        'setstaticbooleanfield',
+        'setstaticbytefield',
+        'setstaticcharfield',
+        'setstaticshortfield',
+        'setstaticintfield',
+        'setstaticlongfield',
+        'setstaticfloatfield',
+        'setstaticdoublefield',
+        'newstring',
+        'getstringlength',
+        'getstringchars',
+        'getarraylength',
+        'newobjectarray',
+        'getobjectarrayelement',
+        'setobjectarrayelement',
+        'newbooleanarray',
+        'newbytearray',
+        'newchararray',
+        'newshortarray',
+        'newintarray',
+        'newlongarray',
+        'newfloatarray',
+        'newdoublearray',
+        'getbooleanarrayelements',
+        'getbytearrayelements',
+        'getchararrayelements',
+        'getshortarrayelements',
+        'getintarrayelements',
+        'getlongarrayelements',
+        'getfloatarrayelements',
+        'getdoublearrayelements',
+        'getbooleanarrayregion',
+        'getbytearrayregion',
+        'getchararrayregion',
+        'getshortarrayregion',
+        'getintarrayregion',
+        'getlongarrayregion',
+        'getfloatarrayregion',
+        'getdoublearrayregion',
+        'setbooleanarrayregion',
+        'setbytearrayregion',
+        'setchararrayregion',
+        'setshortarrayregion',
+        'setintarrayregion',
+        'setlongarrayregion',
+        'setfloatarrayregion',
+        'setdoublearrayregion',
+        'monitorenter',
+        'monitorexit',
+        'fromreflectedmethod',
+        'fromreflectedfield',
+        'toreflectedmethod',
+        'toreflectedfield',
+        'exceptioncheck',
+        'dbtablestable',
+        'dstable',
+        'dsdbtable',
+        'dshoststable',
+        'fieldstable',
+        'sql',
+        'adddatasource',
+        'loaddatasourceinfo',
+        'loaddatasourcehostinfo',
+        'getdatasource',
+        'getdatasourceid',
+        'getdatasourcename',
+        'listdatasources',
+        'listactivedatasources',
+        'removedatasource',
+        'listdatasourcehosts',
+        'listhosts',
+        'adddatasourcehost',
+        'getdatasourcehost',
+        'removedatasourcehost',
+        'getdatabasehost',
+        'gethostdatabase',
+        'listalldatabases',
+        'listdatasourcedatabases',
+        'listhostdatabases',
+        'getdatasourcedatabase',
+        'getdatasourcedatabasebyid',
+        'getdatabasebyname',
+        'getdatabasebyid',
+        'getdatabasebyalias',
+        'adddatasourcedatabase',
+        'removedatasourcedatabase',
+        'listalltables',
+        'listdatabasetables',
+        'getdatabasetable',
+        'getdatabasetablebyalias',
+        'getdatabasetablebyid',
+        'gettablebyid',
+        'adddatabasetable',
+        'removedatabasetable',
+        'removefield',
+        'maybevalue',
+        'getuniquealiasname',
+        'makecolumnlist',
+        'makecolumnmap',
+        'datasourcecolumns',
+        'datasourcemap',
+        'hostcolumns',
+        'hostmap',
+        'hostcolumns2',
+        'hostmap2',
+        'databasecolumns',
+        'databasemap',
+        'tablecolumns',
+        'tablemap',
+        'databasecolumnnames',
+        'hostcolumnnames',
+        'hostcolumnnames2',
+        'datasourcecolumnnames',
+        'tablecolumnnames',
+        'bindcount',
+        'sqlite3',
+        'db',
+        'tables',
+        'hastable',
+        'tablehascolumn',
+        'eachrow',
+        'bindparam',
+        'foreachrow',
+        'executelazy',
+        'executenow',
+        'lastinsertid',
+        'table',
+        'bindone',
+        'src',
+        'stat',
+        'colmap',
+        'getcolumn',
+        'locals',
+        'getcolumns',
+        'bodybytes',
+        'headerbytes',
+        'ready',
+        'token',
+        'url',
+        'done',
+        'header',
+        'result',
+        'statuscode',
+        'raw',
+        'version',
+        'download',
+        'upload',
+        'ftpdeletefile',
+        'ftpgetlisting',
+        'perform',
+        'performonce',
+        's',
+        'linediffers',
+        'sourcefile',
+        'sourceline',
+        'sourcecolumn',
+        'continuationpacket',
+        'continuationpoint',
+        'continuationstack',
+        'features',
+        'lastpoint',
+        'net',
+        'running',
+        'source',
+        'run',
+        'pathtouri',
+        'sendpacket',
+        'readpacket',
+        'handlefeatureset',
+        'handlefeatureget',
+        'handlestdin',
+        'handlestdout',
+        'handlestderr',
+        'isfirststep',
+        'handlecontinuation',
+        'ensurestopped',
+        'handlestackget',
+        'handlecontextnames',
+        'formatcontextelements',
+        'formatcontextelement',
+        'bptypetostr',
+        'bptoxml',
+        'handlebreakpointlist',
+        'handlebreakpointget',
+        'handlebreakpointremove',
+        'condtoint',
+        'inttocond',
+        'handlebreakpointupdate',
+        'handlebreakpointset',
+        'handlecontextget',
+        'handlesource',
+        'error',
+        'setstatus',
+        'getstatus',
+        'stoprunning',
+        'pollide',
+        'polldbg',
+        'runonce',
+        'arguments',
+        'id',
+        'argumentvalue',
+        'end',
+        'start',
+        'days',
+        'foreachday',
+        'padzero',
+        'actionparams',
+        'capi',
+        'doclose',
+        'dsinfo',
+        'isnothing',
+        'named',
+        'workinginputcolumns',
+        'workingkeycolumns',
+        'workingreturncolumns',
+        'workingsortcolumns',
+        'workingkeyfield_name',
+        'scanfordatasource',
+        'configureds',
+        'configuredskeys',
+        'scrubkeywords',
+        'closeprepared',
+        'filterinputcolumn',
+        'prev',
+        'head',
+        'removenode',
+        'listnode',
+        'bind',
+        'listen',
+        'remoteaddress',
+        'shutdownrdwr',
+        'shutdownwr',
+        'shutdownrd',
+        'localaddress',
+        'accept',
+        'connect',
+        'foreachaccept',
+        'writeobjecttcp',
+        'readobjecttcp',
+        'beginssl',
+        'endssl',
+        'begintls',
+        'endtls',
+        'acceptnossl',
+        'loadcerts',
+        'sslerrfail',
+        'fromname',
+        'fromport',
+        'env',
+        'checked',
+        'getclass',
+        'jobjectisa',
+        'new',
+        'callvoid',
+        'callint',
+        'callfloat',
+        'callboolean',
+        'callobject',
+        'callstring',
+        'callstaticobject',
+        'callstaticstring',
+        'callstaticint',
+        'callstaticboolean',
+        'chk',
+        'makecolor',
+        'realdoc',
+        'addbarcode',
+        'addchapter',
+        'addcheckbox',
+        'addcombobox',
+        'addhiddenfield',
+        'addimage',
+        'addlist',
+        'addpage',
+        'addparagraph',
+        'addpasswordfield',
+        'addphrase',
+        'addradiobutton',
+        'addradiogroup',
+        'addresetbutton',
+        'addsection',
+        'addselectlist',
+        'addsubmitbutton',
+        'addtable',
+        'addtextarea',
+        'addtextfield',
+        'addtext',
+        'arc',
+        'circle',
+        'closepath',
+        'curveto',
+        'drawtext',
+        'getcolor',
+        'getheader',
+        'getheaders',
+        'getmargins',
+        'getpagenumber',
+        'getsize',
+        'insertpage',
+        'line',
+        'rect',
+        'setcolor',
+        'setfont',
+        'setlinewidth',
+        'setpagenumber',
+        'conventionaltop',
+        'lowagiefont',
+        'jcolor',
+        'jbarcode',
+        'generatechecksum',
+        'getbarheight',
+        'getbarmultiplier',
+        'getbarwidth',
+        'getbaseline',
+        'getcode',
+        'getfont',
+        'gettextalignment',
+        'gettextsize',
+        'setbarheight',
+        'setbarmultiplier',
+        'setbarwidth',
+        'setbaseline',
+        'setcode',
+        'setgeneratechecksum',
+        'setshowchecksum',
+        'settextalignment',
+        'settextsize',
+        'showchecksum',
+        'showcode39startstop',
+        'showeanguardbars',
+        'jfont',
+        'getencoding',
+        'getface',
+        'getfullfontname',
+        'getpsfontname',
+        'getsupportedencodings',
+        'istruetype',
+        'getstyle',
+        'getbold',
+        'getitalic',
+        'getunderline',
+        'setface',
+        'setunderline',
+        'setbold',
+        'setitalic',
+        'textwidth',
+        'jimage',
+        'ontop',
+        'jlist',
+        'jread',
+        'addjavascript',
+        'exportfdf',
+        'extractimage',
+        'fieldnames',
+        'fieldposition',
+        'fieldtype',
+        'fieldvalue',
+        'gettext',
+        'importfdf',
+        'javascript',
+        'pagecount',
+        'pagerotation',
+        'pagesize',
+        'setfieldvalue',
+        'setpagerange',
+        'jtable',
+        'getabswidth',
+        'getalignment',
+        'getbordercolor',
+        'getborderwidth',
+        'getcolumncount',
+        'getpadding',
+        'getrowcount',
+        'getspacing',
+        'setalignment',
+        'setbordercolor',
+        'setborderwidth',
+        'setpadding',
+        'setspacing',
+        'jtext',
+        'element',
+        'foreachspool',
+        'unspool',
+        'err',
+        'in',
+        'out',
+        'pid',
+        'wait',
+        'testexitcode',
+        'maxworkers',
+        'tasks',
+        'workers',
+        'startone',
+        'addtask',
+        'waitforcompletion',
+        'isidle',
+        'scanworkers',
+        'scantasks',
+        'z',
+        'addfile',
+        'adddir',
+        'adddirpath',
+        'foreachfile',
+        'foreachfilename',
+        'eachfilename',
+        'filenames',
+        'getfile',
+        'meta',
+        'criteria',
+        'map',
+        'valid',
+        'lazyvalue',
+        'dns_response',
+        'qdcount',
+        'qdarray',
+        'answer',
+        'bitformat',
+        'consume_rdata',
+        'consume_string',
+        'consume_label',
+        'consume_domain',
+        'consume_message',
+        'errors',
+        'warnings',
+        'addwarning',
+        'adderror',
+        'renderbytes',
+        'renderstring',
+        'components',
+        'addcomponent',
+        'addcomponents',
+        'body',
+        'renderdocumentbytes',
+        'contenttype',
+        'mime_boundary',
+        'mime_contenttype',
+        'mime_hdrs',
+        'addtextpart',
+        'addhtmlpart',
+        'addattachment',
+        'addpart',
+        'recipients',
+        'pop_capa',
+        'pop_debug',
+        'pop_err',
+        'pop_get',
+        'pop_ids',
+        'pop_index',
+        'pop_log',
+        'pop_mode',
+        'pop_net',
+        'pop_res',
+        'pop_server',
+        'pop_timeout',
+        'pop_token',
+        'pop_cmd',
+        'user',
+        'pass',
+        'apop',
+        'auth',
+        'quit',
+        'rset',
+        'list',
+        'uidl',
+        'retr',
+        'dele',
+        'noop',
+        'capa',
+        'stls',
+        'authorize',
+        'retrieve',
+        'headers',
+        'uniqueid',
+        'capabilities',
+        'cancel',
+        'results',
+        'lasterror',
+        'parse_body',
+        'parse_boundary',
+        'parse_charset',
+        'parse_content_disposition',
+        'parse_content_transfer_encoding',
+        'parse_content_type',
+        'parse_hdrs',
+        'parse_mode',
+        'parse_msg',
+        'parse_parts',
+        'parse_rawhdrs',
+        'rawheaders',
+        'content_type',
+        'content_transfer_encoding',
+        'content_disposition',
+        'boundary',
+        'charset',
+        'cc',
+        'subject',
+        'bcc',
+        'date',
+        'pause',
+        'continue',
+        'touch',
+        'refresh',
+        'queue',
+        'status',
+        'queue_status',
+        'active_tick',
+        'getprefs',
+        'initialize',
+        'queue_maintenance',
+        'queue_messages',
+        'content',
+        'rectype',
+        'requestid',
+        'cachedappprefix',
+        'cachedroot',
+        'cookiesary',
+        'fcgireq',
+        'fileuploadsary',
+        'headersmap',
+        'httpauthorization',
+        'postparamsary',
+        'queryparamsary',
+        'documentroot',
+        'appprefix',
+        'httpconnection',
+        'httpcookie',
+        'httphost',
+        'httpuseragent',
+        'httpcachecontrol',
+        'httpreferer',
+        'httpreferrer',
+        'contentlength',
+        'pathtranslated',
+        'remoteaddr',
+        'remoteport',
+        'requestmethod',
+        'requesturi',
+        'scriptfilename',
+        'scriptname',
+        'scripturi',
+        'scripturl',
+        'serveraddr',
+        'serveradmin',
+        'servername',
+        'serverport',
+        'serverprotocol',
+        'serversignature',
+        'serversoftware',
+        'pathinfo',
+        'gatewayinterface',
+        'httpaccept',
+        'httpacceptencoding',
+        'httpacceptlanguage',
+        'ishttps',
+        'cookies',
+        'cookie',
+        'rawheader',
+        'queryparam',
+        'postparam',
+        'param',
+        'queryparams',
+        'querystring',
+        'postparams',
+        'poststring',
+        'params',
+        'fileuploads',
+        'isxhr',
+        'reqid',
+        'statusmsg',
+        'requestparams',
+        'stdin',
+        'mimes',
+        'writeheaderline',
+        'writeheaderbytes',
+        'writebodybytes',
+        'cap',
+        'n',
+        'proxying',
+        'stop',
+        'printsimplemsg',
+        'handleevalexpired',
+        'handlenormalconnection',
+        'handledevconnection',
+        'splittoprivatedev',
+        'getmode',
+        'curl',
+        'novaluelists',
+        'makeurl',
+        'choosecolumntype',
+        'getdatabasetablepart',
+        'getlcapitype',
+        'buildquery',
+        'getsortfieldspart',
+        'endjs',
+        'title',
+        'addjs',
+        'addjstext',
+        'addendjs',
+        'addendjstext',
+        'addcss',
+        'addfavicon',
+        'attrs',
+        'dtdid',
+        'lang',
+        'xhtml',
+        'style',
+        'gethtmlattr',
+        'hashtmlattr',
+        'onmouseover',
+        'onkeydown',
+        'dir',
+        'onclick',
+        'onkeypress',
+        'onmouseout',
+        'onkeyup',
+        'onmousemove',
+        'onmouseup',
+        'ondblclick',
+        'onmousedown',
+        'sethtmlattr',
+        'class',
+        'gethtmlattrstring',
+        'tag',
+        'code',
+        'msg',
+        'scripttype',
+        'defer',
+        'httpequiv',
+        'scheme',
+        'href',
+        'hreflang',
+        'linktype',
+        'rel',
+        'rev',
+        'media',
+        'declare',
+        'classid',
+        'codebase',
+        'objecttype',
+        'codetype',
+        'archive',
+        'standby',
+        'usemap',
+        'tabindex',
+        'styletype',
+        'method',
+        'enctype',
+        'accept_charset',
+        'onsubmit',
+        'onreset',
+        'accesskey',
+        'inputtype',
+        'maxlength',
+        'for',
+        'selected',
+        'label',
+        'multiple',
+        'buff',
+        'wroteheaders',
+        'pullrequest',
+        'pullrawpost',
+        'shouldclose',
+        'pullurlpost',
+        'pullmimepost',
+        'pullhttpheader',
+        'pulloneheaderline',
+        'parseoneheaderline',
+        'addoneheaderline',
+        'safeexport8bits',
+        'writeheader',
+        'fail',
+        'connhandler',
+        'port',
+        'connectionhandler',
+        'acceptconnections',
+        'gotconnection',
+        'failnoconnectionhandler',
+        'splitconnection',
+        'scriptextensions',
+        'sendfile',
+        'probemimetype',
+        'appname',
+        'inits',
+        'installs',
+        'rootmap',
+        'install',
+        'getappsource',
+        'preflight',
+        'splituppath',
+        'handleresource',
+        'handledefinitionhead',
+        'handledefinitionbody',
+        'handledefinitionresource',
+        'execinstalls',
+        'execinits',
+        'payload',
+        'fullpath',
+        'resourcename',
+        'issourcefile',
+        'resourceinvokable',
+        'srcpath',
+        'resources',
+        'eligiblepath',
+        'eligiblepaths',
+        'expiresminutes',
+        'moddatestr',
+        'zips',
+        'addzip',
+        'getzipfilebytes',
+        'resourcedata',
+        'zip',
+        'zipfile',
+        'zipname',
+        'zipfilename',
+        'rawinvokable',
+        'route',
+        'setdestination',
+        'getprowcount',
+        'encodepassword',
+        'checkuser',
+        'needinitialization',
+        'adduser',
+        'getuserid',
+        'getuser',
+        'getuserbykey',
+        'removeuser',
+        'listusers',
+        'listusersbygroup',
+        'countusersbygroup',
+        'addgroup',
+        'updategroup',
+        'getgroupid',
+        'getgroup',
+        'removegroup',
+        'listgroups',
+        'listgroupsbyuser',
+        'addusertogroup',
+        'removeuserfromgroup',
+        'removeuserfromallgroups',
+        'md5hex',
+        'usercolumns',
+        'groupcolumns',
+        'expireminutes',
+        'lasttouched',
+        'hasexpired',
+        'idealinmemory',
+        'maxinmemory',
+        'nextprune',
+        'nextprunedelta',
+        'sessionsdump',
+        'startup',
+        'validatesessionstable',
+        'createtable',
+        'fetchdata',
+        'savedata',
+        'kill',
+        'expire',
+        'prune',
+        'entry',
+        'host',
+        'tb',
+        'setdefaultstorage',
+        'getdefaultstorage',
+        'onconvert',
+        'send',
+        'nodelist',
+        'delim',
+        'subnode',
+        'subnodes',
+        'addsubnode',
+        'removesubnode',
+        'nodeforpath',
+        'representnoderesult',
+        'mime',
+        'extensions',
+        'representnode',
+        'jsonfornode',
+        'defaultcontentrepresentation',
+        'supportscontentrepresentation',
+        'htmlcontent',
+        'appmessage',
+        'appstatus',
+        'atends',
+        'chunked',
+        'cookiesarray',
+        'didinclude',
+        'errstack',
+        'headersarray',
+        'includestack',
+        'outputencoding',
+        'sessionsmap',
+        'htmlizestacktrace',
+        'includes',
+        'respond',
+        'sendresponse',
+        'sendchunk',
+        'makecookieyumyum',
+        'getinclude',
+        'include',
+        'includeonce',
+        'includelibrary',
+        'includelibraryonce',
+        'includebytes',
+        'addatend',
+        'setcookie',
+        'addheader',
+        'replaceheader',
+        'setheaders',
+        'rawcontent',
+        'redirectto',
+        'htmlizestacktracelink',
+        'doatbegins',
+        'handlelassoappcontent',
+        'handlelassoappresponse',
+        'domainbody',
+        'establisherrorstate',
+        'tryfinderrorfile',
+        'doatends',
+        'dosessions',
+        'makenonrelative',
+        'pushinclude',
+        'popinclude',
+        'findinclude',
+        'checkdebugging',
+        'splitdebuggingthread',
+        'matchtriggers',
+        'rules',
+        'shouldabort',
+        'gettrigger',
+        'trigger',
+        'rule',
+        'foo',
+        'jsonlabel',
+        'jsonhtml',
+        'jsonisleaf',
+        'acceptpost',
+        'csscontent',
+        'jscontent'
+    ),
+    'Lasso 8 Member Tags': (
+        'accept',
+        'add',
+        'addattachment',
+        'addattribute',
+        'addbarcode',
+        'addchapter',
+        'addcheckbox',
+        'addchild',
+        'addcombobox',
+        'addcomment',
+        'addcontent',
+        'addhiddenfield',
+        'addhtmlpart',
+        'addimage',
+        'addjavascript',
+        'addlist',
+        'addnamespace',
+        'addnextsibling',
+        'addpage',
+        'addparagraph',
+        'addparenttype',
+        'addpart',
+        'addpasswordfield',
+        'addphrase',
+        'addprevsibling',
+        'addradiobutton',
+        'addradiogroup',
+        'addresetbutton',
+        'addsection',
+        'addselectlist',
+        'addsibling',
+        'addsubmitbutton',
+        'addtable',
+        'addtext',
+        'addtextarea',
+        'addtextfield',
+        'addtextpart',
+        'alarms',
+        'annotate',
+        'answer',
+        'append',
+        'appendreplacement',
+        'appendtail',
+        'arc',
+        'asasync',
+        'astype',
+        'atbegin',
+        'atbottom',
+        'atend',
+        'atfarleft',
+        'atfarright',
+        'attop',
+        'attributecount',
+        'attributes',
+        'authenticate',
+        'authorize',
+        'backward',
+        'baseuri',
+        'bcc',
+        'beanproperties',
+        'beginswith',
+        'bind',
+        'bitand',
+        'bitclear',
+        'bitflip',
+        'bitformat',
+        'bitnot',
+        'bitor',
+        'bitset',
+        'bitshiftleft',
+        'bitshiftright',
+        'bittest',
+        'bitxor',
+        'blur',
+        'body',
+        'boundary',
+        'bytes',
+        'call',
+        'cancel',
+        'capabilities',
+        'cc',
+        'chardigitvalue',
+        'charname',
+        'charset',
+        'chartype',
+        'children',
+        'circle',
+        'close',
+        'closepath',
+        'closewrite',
+        'code',
+        'colorspace',
+        'command',
+        'comments',
+        'compare',
+        'comparecodepointorder',
+        'compile',
+        'composite',
+        'connect',
+        'contains',
+        'content_disposition',
+        'content_transfer_encoding',
+        'content_type',
+        'contents',
+        'contrast',
+        'convert',
+        'crop',
+        'curveto',
+        'data',
+        'date',
+        'day',
+        'daylights',
+        'dayofweek',
+        'dayofyear',
+        'decrement',
+        'delete',
+        'depth',
+        'describe',
+        'description',
+        'deserialize',
+        'detach',
+        'detachreference',
+        'difference',
+        'digit',
+        'document',
+        'down',
+        'drawtext',
+        'dst',
+        'dump',
+        'endswith',
+        'enhance',
+        'equals',
+        'errors',
+        'eval',
+        'events',
+        'execute',
+        'export16bits',
+        'export32bits',
+        'export64bits',
+        'export8bits',
+        'exportfdf',
+        'exportstring',
+        'extract',
+        'extractone',
+        'fieldnames',
+        'fieldtype',
+        'fieldvalue',
+        'file',
+        'find',
+        'findindex',
+        'findnamespace',
+        'findnamespacebyhref',
+        'findpattern',
+        'findposition',
+        'first',
+        'firstchild',
+        'fliph',
+        'flipv',
+        'flush',
+        'foldcase',
+        'foreach',
+        'format',
+        'forward',
+        'freebusies',
+        'freezetype',
+        'freezevalue',
+        'from',
+        'fulltype',
+        'generatechecksum',
+        'get',
+        'getabswidth',
+        'getalignment',
+        'getattribute',
+        'getattributenamespace',
+        'getbarheight',
+        'getbarmultiplier',
+        'getbarwidth',
+        'getbaseline',
+        'getbordercolor',
+        'getborderwidth',
+        'getcode',
+        'getcolor',
+        'getcolumncount',
+        'getencoding',
+        'getface',
+        'getfont',
+        'getformat',
+        'getfullfontname',
+        'getheaders',
+        'getmargins',
+        'getmethod',
+        'getnumericvalue',
+        'getpadding',
+        'getpagenumber',
+        'getparams',
+        'getproperty',
+        'getpsfontname',
+        'getrange',
+        'getrowcount',
+        'getsize',
+        'getspacing',
+        'getsupportedencodings',
+        'gettextalignment',
+        'gettextsize',
+        'gettype',
+        'gmt',
+        'groupcount',
+        'hasattribute',
+        'haschildren',
+        'hasvalue',
+        'header',
+        'headers',
+        'height',
+        'histogram',
+        'hosttonet16',
+        'hosttonet32',
+        'hour',
+        'id',
+        'ignorecase',
+        'import16bits',
+        'import32bits',
+        'import64bits',
+        'import8bits',
+        'importfdf',
+        'importstring',
+        'increment',
+        'input',
+        'insert',
+        'insertatcurrent',
+        'insertfirst',
+        'insertfrom',
+        'insertlast',
+        'insertpage',
+        'integer',
+        'intersection',
+        'invoke',
+        'isa',
+        'isalnum',
+        'isalpha',
+        'isbase',
+        'iscntrl',
+        'isdigit',
+        'isemptyelement',
+        'islower',
+        'isopen',
+        'isprint',
+        'isspace',
+        'istitle',
+        'istruetype',
+        'isualphabetic',
+        'isulowercase',
+        'isupper',
+        'isuuppercase',
+        'isuwhitespace',
+        'iswhitespace',
+        'iterator',
+        'javascript',
+        'join',
+        'journals',
+        'key',
+        'keys',
+        'last',
+        'lastchild',
+        'lasterror',
+        'left',
+        'length',
+        'line',
+        'listen',
+        'localaddress',
+        'localname',
+        'lock',
+        'lookupnamespace',
+        'lowercase',
+        'marker',
+        'matches',
+        'matchesstart',
+        'matchposition',
+        'matchstring',
+        'merge',
+        'millisecond',
+        'minute',
+        'mode',
+        'modulate',
+        'month',
+        'moveto',
+        'movetoattributenamespace',
+        'movetoelement',
+        'movetofirstattribute',
+        'movetonextattribute',
+        'name',
+        'namespaces',
+        'namespaceuri',
+        'nettohost16',
+        'nettohost32',
+        'newchild',
+        'next',
+        'nextsibling',
+        'nodetype',
+        'open',
+        'output',
+        'padleading',
+        'padtrailing',
+        'pagecount',
+        'pagesize',
+        'paraminfo',
+        'params',
+        'parent',
+        'path',
+        'pixel',
+        'position',
+        'prefix',
+        'previoussibling',
+        'properties',
+        'rawheaders',
+        'read',
+        'readattributevalue',
+        'readerror',
+        'readfrom',
+        'readline',
+        'readlock',
+        'readstring',
+        'readunlock',
+        'recipients',
+        'rect',
+        'refcount',
+        'referrals',
+        'remoteaddress',
+        'remove',
+        'removeall',
+        'removeattribute',
+        'removechild',
+        'removecurrent',
+        'removefirst',
+        'removelast',
+        'removeleading',
+        'removenamespace',
+        'removetrailing',
+        'render',
+        'replace',
+        'replaceall',
+        'replacefirst',
+        'replacepattern',
+        'replacewith',
+        'reserve',
+        'reset',
+        'resolutionh',
+        'resolutionv',
+        'response',
+        'results',
+        'retrieve',
+        'returntype',
+        'reverse',
+        'reverseiterator',
+        'right',
+        'rotate',
+        'run',
+        'save',
+        'scale',
+        'search',
+        'second',
+        'send',
+        'serialize',
+        'set',
+        'setalignment',
+        'setbarheight',
+        'setbarmultiplier',
+        'setbarwidth',
+        'setbaseline',
+        'setblocking',
+        'setbordercolor',
+        'setborderwidth',
+        'setbytes',
+        'setcode',
+        'setcolor',
+        'setcolorspace',
+        'setdatatype',
+        'setencoding',
+        'setface',
+        'setfieldvalue',
+        'setfont',
+        'setformat',
+        'setgeneratechecksum',
+        'setheight',
+        'setlassodata',
+        'setlinewidth',
+        'setmarker',
+        'setmode',
+        'setname',
+        'setpadding',
+        'setpagenumber',
+        'setpagerange',
+        'setposition',
+        'setproperty',
+        'setrange',
+        'setshowchecksum',
+        'setsize',
+        'setspacing',
+        'settemplate',
+        'settemplatestr',
+        'settextalignment',
+        'settextdata',
+        'settextsize',
+        'settype',
+        'setunderline',
+        'setwidth',
+        'setxmldata',
+        'sharpen',
+        'showchecksum',
+        'showcode39startstop',
+        'showeanguardbars',
+        'signal',
+        'signalall',
+        'size',
+        'smooth',
+        'sort',
+        'sortwith',
+        'split',
+        'standards',
+        'steal',
+        'subject',
+        'substring',
+        'subtract',
+        'swapbytes',
+        'textwidth',
+        'time',
+        'timezones',
+        'titlecase',
+        'to',
+        'todos',
+        'tolower',
+        'totitle',
+        'toupper',
+        'transform',
+        'trim',
+        'type',
+        'unescape',
+        'union',
+        'uniqueid',
+        'unlock',
+        'unserialize',
+        'up',
+        'uppercase',
+        'value',
+        'values',
+        'valuetype',
+        'wait',
+        'waskeyword',
+        'week',
+        'width',
+        'write',
+        'writelock',
+        'writeto',
+        'writeunlock',
+        'xmllang',
+        'xmlschematype',
+        'year'
+    )
+}
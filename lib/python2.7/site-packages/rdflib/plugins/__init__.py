@@ -0,0 +1,7 @@
+"""
+Default plugins for rdflib.
+
+This is a namespace package and contains the default plugins for
+rdflib.
+
+"""
@@ -0,0 +1,4 @@
+"""
+Collection of external modules that are used by pyRdfa and are added for an easier 
+distribution
+"""
@@ -0,0 +1,3 @@
+"""
+Parsers and serializers for SPARQL Result formats
+"""
@@ -0,0 +1,3 @@
+"""
+This package contains modules for additional RDFLib stores
+"""
@@ -0,0 +1,3 @@
+"""
+Various commandline tools for working with RDFLib
+"""
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+version_info = ('1', '1', '1dev1')
+
+__version__ = '{0}.{1}.{2}'.format(*version_info)
@@ -0,0 +1,210 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = u'TEXT TOOL_VALUE UNKNOWN_TAG ORG_VALUE PERSON_VALUE DATE LINE CHKSUM PKG_CPY_TEXT UN_KNOWN FILE_LICS_COMMENT FILE_CONTRIB DOC_COMMENT PKG_FILE_NAME PKG_LICS_FFILE LICS_CRS_REF SOURCE PKG_LICS_CONC LICS_TEXT ART_PRJ_URI FILE_DEP PKG_LICS_DECL REVIEW_COMMENT REVIEW_DATE FILE_LICS_INFO DOC_VERSION FILE_COMMENT PKG_VERSION PKG_DOWN PKG_SUPPL BINARY CREATOR FILE_NAME FILE_LICS_CONC LICS_NAME FILE_CR_TEXT FILE_CHKSUM PKG_DESC PKG_SUM CREATOR_COMMENT PKG_NAME PKG_CHKSUM DOC_LICENSE LICS_ID NONE PKG_VERF_CODE ART_PRJ_NAME LIC_LIST_VER FILE_NOTICE ARCHIVE PKG_LICS_COMMENT LICS_COMMENT CREATED FILE_TYPE ART_PRJ_HOME OTHER PKG_SRC_INFO REVIEWER NO_ASSERT PKG_ORIG PKG_HOMEstart : start attrib start : attrib attrib : spdx_version\n                  | data_lics\n                  | doc_comment\n                  | creator\n                  | created\n                  | creator_comment\n                  | locs_list_ver\n                  | reviewer\n                  | review_date\n                  | review_comment\n                  | package_name\n                  | package_version\n                  | pkg_down_location\n                  | pkg_home\n                  | pkg_summary\n                  | pkg_src_info\n                  | pkg_file_name\n                  | pkg_supplier\n                  | pkg_orig\n                  | pkg_chksum\n                  | pkg_verif\n                  | pkg_desc\n                  | pkg_lic_decl\n                  | pkg_lic_conc\n                  | pkg_lic_ff\n                  | pkg_lic_comment\n                  | pkg_cr_text\n                  | file_name\n                  | file_type\n                  | file_chksum\n                  | file_conc\n                  | file_lics_info\n                  | file_cr_text\n                  | file_lics_comment\n                  | file_notice\n                  | file_comment\n                  | file_contrib\n                  | file_dep\n                  | file_artifact\n                  | extr_lic_id\n                  | extr_lic_text\n                  | extr_lic_name\n                  | lic_xref\n                  | lic_comment\n                  | unknown_tag\n        lic_xref : LICS_CRS_REF LINElic_xref : LICS_CRS_REF errorlic_comment : LICS_COMMENT TEXTlic_comment : LICS_COMMENT errorextr_lic_name : LICS_NAME extr_lic_name_valueextr_lic_name : LICS_NAME errorextr_lic_name_value : LINEextr_lic_name_value : NO_ASSERTextr_lic_text : LICS_TEXT TEXTextr_lic_text : LICS_TEXT errorextr_lic_id : LICS_ID LINEextr_lic_id : LICS_ID errorunknown_tag : UNKNOWN_TAGfile_artifact : prj_name_art file_art_rest\n                         | prj_name_art\n        file_artifact : prj_name_art errorfile_art_rest : prj_home_art prj_uri_art\n                         | prj_uri_art prj_home_art\n                         | prj_home_art\n                         | prj_uri_art\n        prj_uri_art : ART_PRJ_URI UN_KNOWNprj_uri_art : ART_PRJ_URI LINEprj_uri_art : ART_PRJ_URI errorprj_home_art : ART_PRJ_HOME LINEprj_home_art : ART_PRJ_HOME UN_KNOWNprj_home_art : ART_PRJ_HOME errorprj_name_art : ART_PRJ_NAME LINEprj_name_art : ART_PRJ_NAME errorfile_dep : FILE_DEP LINEfile_dep : FILE_DEP errorfile_contrib : FILE_CONTRIB LINEfile_contrib : FILE_CONTRIB errorfile_notice : FILE_NOTICE TEXTfile_notice : FILE_NOTICE errorfile_cr_text : FILE_CR_TEXT file_cr_valuefile_cr_text : FILE_CR_TEXT errorfile_cr_value : TEXTfile_cr_value : NONEfile_cr_value : NO_ASSERTfile_lics_comment : FILE_LICS_COMMENT TEXTfile_lics_comment : FILE_LICS_COMMENT errorfile_lics_info : FILE_LICS_INFO file_lic_info_valuefile_lics_info : FILE_LICS_INFO errorfile_lic_info_value : NONEfile_lic_info_value : NO_ASSERTfile_lic_info_value : LINEconc_license : NO_ASSERTconc_license : NONEconc_license : LINEfile_name : FILE_NAME LINEfile_name : FILE_NAME errorfile_comment : FILE_COMMENT TEXTfile_comment : FILE_COMMENT errorfile_type : FILE_TYPE file_type_valuefile_type : FILE_TYPE errorfile_chksum : FILE_CHKSUM CHKSUMfile_chksum : FILE_CHKSUM errorfile_conc : FILE_LICS_CONC conc_licensefile_conc : FILE_LICS_CONC errorfile_type_value : OTHER\n                           | SOURCE\n                           | ARCHIVE\n                           | BINARY\n        pkg_desc : PKG_DESC TEXTpkg_desc : PKG_DESC errorpkg_summary : PKG_SUM TEXTpkg_summary : PKG_SUM errorpkg_cr_text : PKG_CPY_TEXT pkg_cr_text_valuepkg_cr_text : PKG_CPY_TEXT errorpkg_cr_text_value : TEXTpkg_cr_text_value : NONEpkg_cr_text_value : NO_ASSERTpkg_lic_comment : PKG_LICS_COMMENT TEXTpkg_lic_comment : PKG_LICS_COMMENT errorpkg_lic_decl : PKG_LICS_DECL conc_licensepkg_lic_decl : PKG_LICS_DECL errorpkg_lic_ff : PKG_LICS_FFILE pkg_lic_ff_valuepkg_lic_ff_value : NONEpkg_lic_ff_value : NO_ASSERTpkg_lic_ff_value : LINEpkg_lic_ff : PKG_LICS_FFILE errorpkg_lic_conc : PKG_LICS_CONC conc_licensepkg_lic_conc : PKG_LICS_CONC errorpkg_src_info : PKG_SRC_INFO TEXTpkg_src_info : PKG_SRC_INFO errorpkg_chksum : PKG_CHKSUM CHKSUMpkg_chksum : PKG_CHKSUM errorpkg_verif : PKG_VERF_CODE LINEpkg_verif : PKG_VERF_CODE errorpkg_home : PKG_HOME pkg_home_valuepkg_home : PKG_HOME errorpkg_home_value : LINEpkg_home_value : NONEpkg_home_value : NO_ASSERTpkg_down_location : PKG_DOWN pkg_down_valuepkg_down_location : PKG_DOWN errorpkg_down_value : LINE pkg_down_value : NONEpkg_down_value : NO_ASSERTpkg_orig : PKG_ORIG pkg_supplier_valuespkg_orig : PKG_ORIG errorpkg_supplier : PKG_SUPPL pkg_supplier_valuespkg_supplier : PKG_SUPPL errorpkg_supplier_values : NO_ASSERTpkg_supplier_values : entitypkg_file_name : PKG_FILE_NAME LINEpkg_file_name : PKG_FILE_NAME errorpackage_version : PKG_VERSION LINEpackage_version : PKG_VERSION errorpackage_name : PKG_NAME LINEpackage_name : PKG_NAME errorreviewer : REVIEWER entityreviewer : REVIEWER errorreview_date : REVIEW_DATE DATEreview_date : REVIEW_DATE errorreview_comment : REVIEW_COMMENT TEXTreview_comment : REVIEW_COMMENT errorlocs_list_ver : LIC_LIST_VER LINElocs_list_ver : LIC_LIST_VER errordoc_comment : DOC_COMMENT TEXTdoc_comment : DOC_COMMENT errordata_lics : DOC_LICENSE LINEdata_lics : DOC_LICENSE errorspdx_version : DOC_VERSION LINEspdx_version : DOC_VERSION errorcreator_comment : CREATOR_COMMENT TEXTcreator_comment : CREATOR_COMMENT errorcreator : CREATOR entitycreator : CREATOR errorcreated : CREATED DATEcreated : CREATED errorentity : TOOL_VALUE\n        entity : ORG_VALUE\n        entity : PERSON_VALUE\n        '
+    
+_lr_action_items = {u'LICS_CRS_REF':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[50,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,50,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'DOC_COMMENT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[2,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,2,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_TYPE':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[52,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,52,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'TEXT':([2,12,16,21,34,35,39,44,54,60,62,82,84,91,],[94,103,110,112,132,135,143,149,165,172,174,201,209,215,]),u'CHKSUM':([27,30,],[116,121,]),u'DATE':([33,73,],[128,188,]),u'REVIEWER':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[25,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,25,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'LINE':([9,14,29,31,32,36,40,42,46,47,50,57,58,63,79,80,81,83,89,92,93,179,182,],[101,109,118,122,124,141,144,146,150,156,157,168,109,176,109,194,199,207,213,217,219,223,226,]),u'PKG_VERF_CODE':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[63,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,63,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'ART_PRJ_URI':([66,146,147,178,222,223,224,],[182,-74,-75,182,-72,-71,-73,]),u'LICS_NAME':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[32,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,32,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_CHKSUM':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[30,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,30,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'ARCHIVE':([52,],[164,]),u'LICS_COMMENT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[91,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,91,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_SUPPL':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[71,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,71,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'CREATOR':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[8,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,8,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'LIC_LIST_VER':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[9,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,9,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'CREATOR_COMMENT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[12,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,12,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_FILE_NAME':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[31,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,31,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'SOURCE':([52,],[161,]),u'BINARY':([52,],[159,]),u'FILE_CONTRIB':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[57,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,57,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'LICS_TEXT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[54,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,54,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'TOOL_VALUE':([8,25,71,75,],[98,98,98,98,]),u'PKG_CPY_TEXT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[34,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,34,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_LICS_CONC':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[58,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,58,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'ORG_VALUE':([8,25,71,75,],[100,100,100,100,]),u'PKG_ORIG':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[75,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,75,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'ART_PRJ_HOME':([66,146,147,183,225,226,227,],[179,-74,-75,179,-68,-69,-70,]),u'DOC_LICENSE':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[40,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,40,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_LICS_CONC':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[79,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,79,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_LICS_DECL':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[14,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,14,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'REVIEW_DATE':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[33,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,33,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'CREATED':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[73,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,73,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_COMMENT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[16,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,16,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_NAME':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[80,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,80,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_NOTICE':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[35,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,35,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_LICS_FFILE':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[36,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,36,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'NO_ASSERT':([14,32,34,36,47,58,71,75,79,81,83,84,],[107,126,131,138,154,107,187,187,107,197,205,210,]),u'UN_KNOWN':([179,182,],[222,225,]),u'OTHER':([52,],[162,]),u'PKG_LICS_COMMENT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[60,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,60,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_DOWN':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[47,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,47,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PERSON_VALUE':([8,25,71,75,],[99,99,99,99,]),u'PKG_HOME':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[81,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,81,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_DESC':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[82,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,82,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_LICS_INFO':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[83,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,83,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_CR_TEXT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[84,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,84,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_SUM':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[39,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,39,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'NONE':([14,34,36,47,58,79,81,83,84,],[105,130,137,153,105,105,196,203,208,]),u'REVIEW_COMMENT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[62,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,62,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_SRC_INFO':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[21,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,21,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'UNKNOWN_TAG':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[88,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,88,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'LICS_ID':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[89,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,89,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_CHKSUM':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[27,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,27,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_DEP':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[29,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,29,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'FILE_LICS_COMMENT':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[44,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,44,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'DOC_VERSION':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[46,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,46,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'error':([2,8,9,12,14,16,21,25,27,29,30,31,32,33,34,35,36,39,40,42,44,46,47,50,52,54,57,58,60,62,63,66,71,73,75,79,80,81,82,83,84,89,91,92,93,146,147,179,182,],[95,96,102,104,108,111,113,114,117,119,120,123,127,129,133,136,139,142,145,147,148,151,155,158,163,166,169,171,173,175,177,180,186,189,191,193,195,198,202,206,211,214,216,218,220,-74,-75,224,227,]),u'PKG_VERSION':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[92,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,92,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'PKG_NAME':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[93,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,93,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),'$end':([1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,0,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),u'ART_PRJ_NAME':([0,1,3,4,5,6,7,10,11,13,15,17,18,19,20,22,23,24,26,28,37,38,41,43,45,48,49,51,53,55,56,59,61,64,65,66,67,68,69,70,72,74,76,77,78,85,86,87,88,90,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,],[42,-13,-31,-19,-36,-10,-46,-5,-47,-28,-22,-39,-9,-8,-41,-6,-12,-14,-27,-35,-21,-43,-7,-45,-42,-2,-11,-26,-40,-20,42,-37,-17,-15,-16,-62,-4,-30,-25,-34,-38,-23,-33,-18,-24,-29,-44,-3,-60,-32,-167,-168,-176,-175,-179,-181,-180,-165,-166,-173,-174,-95,-122,-94,-123,-96,-99,-100,-131,-132,-160,-159,-103,-104,-76,-77,-134,-133,-153,-154,-54,-52,-55,-53,-161,-162,-118,-119,-117,-116,-115,-80,-81,-125,-126,-128,-124,-127,-114,-113,-169,-170,-74,-75,-88,-87,-171,-172,-142,-145,-146,-143,-144,-48,-49,-110,-101,-108,-107,-102,-109,-56,-57,-1,-78,-79,-105,-106,-120,-121,-163,-164,-135,-136,-66,-63,-61,-67,-152,-149,-150,-151,-177,-178,-147,-148,-129,-130,-97,-98,-140,-141,-138,-139,-137,-111,-112,-91,-89,-92,-90,-93,-85,-84,-86,-83,-82,-58,-59,-50,-51,-155,-156,-157,-158,-64,-72,-71,-73,-68,-69,-70,-65,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {u'review_date':([0,56,],[49,49,]),u'data_lics':([0,56,],[67,67,]),u'package_name':([0,56,],[1,1,]),u'creator':([0,56,],[22,22,]),u'review_comment':([0,56,],[23,23,]),u'pkg_lic_conc':([0,56,],[51,51,]),u'package_version':([0,56,],[24,24,]),u'pkg_file_name':([0,56,],[4,4,]),u'entity':([8,25,71,75,],[97,115,184,184,]),u'file_dep':([0,56,],[53,53,]),u'file_lics_comment':([0,56,],[5,5,]),u'pkg_lic_ff':([0,56,],[26,26,]),u'reviewer':([0,56,],[6,6,]),u'pkg_lic_decl':([0,56,],[69,69,]),u'pkg_cr_text_value':([34,],[134,]),u'file_lics_info':([0,56,],[70,70,]),u'file_cr_text':([0,56,],[28,28,]),u'file_lic_info_value':([83,],[204,]),u'pkg_supplier':([0,56,],[55,55,]),u'file_type':([0,56,],[3,3,]),u'file_comment':([0,56,],[72,72,]),u'doc_comment':([0,56,],[10,10,]),u'unknown_tag':([0,56,],[11,11,]),u'file_cr_value':([84,],[212,]),u'file_type_value':([52,],[160,]),u'start':([0,],[56,]),u'pkg_lic_comment':([0,56,],[13,13,]),u'extr_lic_name_value':([32,],[125,]),u'file_name':([0,56,],[68,68,]),u'file_conc':([0,56,],[76,76,]),u'pkg_src_info':([0,56,],[77,77,]),u'file_notice':([0,56,],[59,59,]),u'pkg_desc':([0,56,],[78,78,]),u'prj_name_art':([0,56,],[66,66,]),u'pkg_chksum':([0,56,],[15,15,]),u'conc_license':([14,58,79,],[106,170,192,]),u'file_contrib':([0,56,],[17,17,]),u'pkg_supplier_values':([71,75,],[185,190,]),u'file_art_rest':([66,],[181,]),u'pkg_orig':([0,56,],[37,37,]),u'locs_list_ver':([0,56,],[18,18,]),u'file_artifact':([0,56,],[20,20,]),u'prj_uri_art':([66,178,],[183,221,]),u'extr_lic_text':([0,56,],[38,38,]),u'pkg_summary':([0,56,],[61,61,]),u'pkg_down_value':([47,],[152,]),u'pkg_cr_text':([0,56,],[85,85,]),u'created':([0,56,],[41,41,]),u'spdx_version':([0,56,],[87,87,]),u'pkg_home_value':([81,],[200,]),u'pkg_lic_ff_value':([36,],[140,]),u'extr_lic_name':([0,56,],[86,86,]),u'lic_xref':([0,56,],[43,43,]),u'creator_comment':([0,56,],[19,19,]),u'file_chksum':([0,56,],[90,90,]),u'pkg_down_location':([0,56,],[64,64,]),u'extr_lic_id':([0,56,],[45,45,]),u'pkg_verif':([0,56,],[74,74,]),u'prj_home_art':([66,183,],[178,228,]),u'attrib':([0,56,],[48,167,]),u'pkg_home':([0,56,],[65,65,]),u'lic_comment':([0,56,],[7,7,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  (u'start -> start attrib',u'start',2,'p_start_1','tagvalue.py',100),
+  (u'start -> attrib',u'start',1,'p_start_2','tagvalue.py',104),
+  (u'attrib -> spdx_version',u'attrib',1,'p_attrib','tagvalue.py',108),
+  (u'attrib -> data_lics',u'attrib',1,'p_attrib','tagvalue.py',109),
+  (u'attrib -> doc_comment',u'attrib',1,'p_attrib','tagvalue.py',110),
+  (u'attrib -> creator',u'attrib',1,'p_attrib','tagvalue.py',111),
+  (u'attrib -> created',u'attrib',1,'p_attrib','tagvalue.py',112),
+  (u'attrib -> creator_comment',u'attrib',1,'p_attrib','tagvalue.py',113),
+  (u'attrib -> locs_list_ver',u'attrib',1,'p_attrib','tagvalue.py',114),
+  (u'attrib -> reviewer',u'attrib',1,'p_attrib','tagvalue.py',115),
+  (u'attrib -> review_date',u'attrib',1,'p_attrib','tagvalue.py',116),
+  (u'attrib -> review_comment',u'attrib',1,'p_attrib','tagvalue.py',117),
+  (u'attrib -> package_name',u'attrib',1,'p_attrib','tagvalue.py',118),
+  (u'attrib -> package_version',u'attrib',1,'p_attrib','tagvalue.py',119),
+  (u'attrib -> pkg_down_location',u'attrib',1,'p_attrib','tagvalue.py',120),
+  (u'attrib -> pkg_home',u'attrib',1,'p_attrib','tagvalue.py',121),
+  (u'attrib -> pkg_summary',u'attrib',1,'p_attrib','tagvalue.py',122),
+  (u'attrib -> pkg_src_info',u'attrib',1,'p_attrib','tagvalue.py',123),
+  (u'attrib -> pkg_file_name',u'attrib',1,'p_attrib','tagvalue.py',124),
+  (u'attrib -> pkg_supplier',u'attrib',1,'p_attrib','tagvalue.py',125),
+  (u'attrib -> pkg_orig',u'attrib',1,'p_attrib','tagvalue.py',126),
+  (u'attrib -> pkg_chksum',u'attrib',1,'p_attrib','tagvalue.py',127),
+  (u'attrib -> pkg_verif',u'attrib',1,'p_attrib','tagvalue.py',128),
+  (u'attrib -> pkg_desc',u'attrib',1,'p_attrib','tagvalue.py',129),
+  (u'attrib -> pkg_lic_decl',u'attrib',1,'p_attrib','tagvalue.py',130),
+  (u'attrib -> pkg_lic_conc',u'attrib',1,'p_attrib','tagvalue.py',131),
+  (u'attrib -> pkg_lic_ff',u'attrib',1,'p_attrib','tagvalue.py',132),
+  (u'attrib -> pkg_lic_comment',u'attrib',1,'p_attrib','tagvalue.py',133),
+  (u'attrib -> pkg_cr_text',u'attrib',1,'p_attrib','tagvalue.py',134),
+  (u'attrib -> file_name',u'attrib',1,'p_attrib','tagvalue.py',135),
+  (u'attrib -> file_type',u'attrib',1,'p_attrib','tagvalue.py',136),
+  (u'attrib -> file_chksum',u'attrib',1,'p_attrib','tagvalue.py',137),
+  (u'attrib -> file_conc',u'attrib',1,'p_attrib','tagvalue.py',138),
+  (u'attrib -> file_lics_info',u'attrib',1,'p_attrib','tagvalue.py',139),
+  (u'attrib -> file_cr_text',u'attrib',1,'p_attrib','tagvalue.py',140),
+  (u'attrib -> file_lics_comment',u'attrib',1,'p_attrib','tagvalue.py',141),
+  (u'attrib -> file_notice',u'attrib',1,'p_attrib','tagvalue.py',142),
+  (u'attrib -> file_comment',u'attrib',1,'p_attrib','tagvalue.py',143),
+  (u'attrib -> file_contrib',u'attrib',1,'p_attrib','tagvalue.py',144),
+  (u'attrib -> file_dep',u'attrib',1,'p_attrib','tagvalue.py',145),
+  (u'attrib -> file_artifact',u'attrib',1,'p_attrib','tagvalue.py',146),
+  (u'attrib -> extr_lic_id',u'attrib',1,'p_attrib','tagvalue.py',147),
+  (u'attrib -> extr_lic_text',u'attrib',1,'p_attrib','tagvalue.py',148),
+  (u'attrib -> extr_lic_name',u'attrib',1,'p_attrib','tagvalue.py',149),
+  (u'attrib -> lic_xref',u'attrib',1,'p_attrib','tagvalue.py',150),
+  (u'attrib -> lic_comment',u'attrib',1,'p_attrib','tagvalue.py',151),
+  (u'attrib -> unknown_tag',u'attrib',1,'p_attrib','tagvalue.py',152),
+  (u'lic_xref -> LICS_CRS_REF LINE',u'lic_xref',2,'p_lic_xref_1','tagvalue.py',170),
+  (u'lic_xref -> LICS_CRS_REF error',u'lic_xref',2,'p_lic_xref_2','tagvalue.py',181),
+  (u'lic_comment -> LICS_COMMENT TEXT',u'lic_comment',2,'p_lic_comment_1','tagvalue.py',187),
+  (u'lic_comment -> LICS_COMMENT error',u'lic_comment',2,'p_lic_comment_2','tagvalue.py',200),
+  (u'extr_lic_name -> LICS_NAME extr_lic_name_value',u'extr_lic_name',2,'p_extr_lic_name_1','tagvalue.py',206),
+  (u'extr_lic_name -> LICS_NAME error',u'extr_lic_name',2,'p_extr_lic_name_2','tagvalue.py',215),
+  (u'extr_lic_name_value -> LINE',u'extr_lic_name_value',1,'p_extr_lic_name_value_1','tagvalue.py',221),
+  (u'extr_lic_name_value -> NO_ASSERT',u'extr_lic_name_value',1,'p_extr_lic_name_value_2','tagvalue.py',228),
+  (u'extr_lic_text -> LICS_TEXT TEXT',u'extr_lic_text',2,'p_extr_lic_text_1','tagvalue.py',232),
+  (u'extr_lic_text -> LICS_TEXT error',u'extr_lic_text',2,'p_extr_lic_text_2','tagvalue.py',245),
+  (u'extr_lic_id -> LICS_ID LINE',u'extr_lic_id',2,'p_extr_lic_id_1','tagvalue.py',251),
+  (u'extr_lic_id -> LICS_ID error',u'extr_lic_id',2,'p_extr_lic_id_2','tagvalue.py',264),
+  (u'unknown_tag -> UNKNOWN_TAG',u'unknown_tag',1,'p_uknown_tag','tagvalue.py',270),
+  (u'file_artifact -> prj_name_art file_art_rest',u'file_artifact',2,'p_file_artifact_1','tagvalue.py',276),
+  (u'file_artifact -> prj_name_art',u'file_artifact',1,'p_file_artifact_1','tagvalue.py',277),
+  (u'file_artifact -> prj_name_art error',u'file_artifact',2,'p_file_artificat_2','tagvalue.py',282),
+  (u'file_art_rest -> prj_home_art prj_uri_art',u'file_art_rest',2,'p_file_art_rest','tagvalue.py',288),
+  (u'file_art_rest -> prj_uri_art prj_home_art',u'file_art_rest',2,'p_file_art_rest','tagvalue.py',289),
+  (u'file_art_rest -> prj_home_art',u'file_art_rest',1,'p_file_art_rest','tagvalue.py',290),
+  (u'file_art_rest -> prj_uri_art',u'file_art_rest',1,'p_file_art_rest','tagvalue.py',291),
+  (u'prj_uri_art -> ART_PRJ_URI UN_KNOWN',u'prj_uri_art',2,'p_prj_uri_art_1','tagvalue.py',296),
+  (u'prj_uri_art -> ART_PRJ_URI LINE',u'prj_uri_art',2,'p_prj_uri_art_2','tagvalue.py',304),
+  (u'prj_uri_art -> ART_PRJ_URI error',u'prj_uri_art',2,'p_prj_uri_art_3','tagvalue.py',315),
+  (u'prj_home_art -> ART_PRJ_HOME LINE',u'prj_home_art',2,'p_prj_home_art_1','tagvalue.py',321),
+  (u'prj_home_art -> ART_PRJ_HOME UN_KNOWN',u'prj_home_art',2,'p_prj_home_art_2','tagvalue.py',328),
+  (u'prj_home_art -> ART_PRJ_HOME error',u'prj_home_art',2,'p_prj_home_art_3','tagvalue.py',336),
+  (u'prj_name_art -> ART_PRJ_NAME LINE',u'prj_name_art',2,'p_prj_name_art_1','tagvalue.py',342),
+  (u'prj_name_art -> ART_PRJ_NAME error',u'prj_name_art',2,'p_prj_name_art_2','tagvalue.py',353),
+  (u'file_dep -> FILE_DEP LINE',u'file_dep',2,'p_file_dep_1','tagvalue.py',359),
+  (u'file_dep -> FILE_DEP error',u'file_dep',2,'p_file_dep_2','tagvalue.py',370),
+  (u'file_contrib -> FILE_CONTRIB LINE',u'file_contrib',2,'p_file_contrib_1','tagvalue.py',376),
+  (u'file_contrib -> FILE_CONTRIB error',u'file_contrib',2,'p_file_contrib_2','tagvalue.py',387),
+  (u'file_notice -> FILE_NOTICE TEXT',u'file_notice',2,'p_file_notice_1','tagvalue.py',393),
+  (u'file_notice -> FILE_NOTICE error',u'file_notice',2,'p_file_notice_2','tagvalue.py',406),
+  (u'file_cr_text -> FILE_CR_TEXT file_cr_value',u'file_cr_text',2,'p_file_cr_text_1','tagvalue.py',412),
+  (u'file_cr_text -> FILE_CR_TEXT error',u'file_cr_text',2,'p_file_cr_text_2','tagvalue.py',421),
+  (u'file_cr_value -> TEXT',u'file_cr_value',1,'p_file_cr_value_1','tagvalue.py',427),
+  (u'file_cr_value -> NONE',u'file_cr_value',1,'p_file_cr_value_2','tagvalue.py',434),
+  (u'file_cr_value -> NO_ASSERT',u'file_cr_value',1,'p_file_cr_value_3','tagvalue.py',438),
+  (u'file_lics_comment -> FILE_LICS_COMMENT TEXT',u'file_lics_comment',2,'p_file_lics_comment_1','tagvalue.py',442),
+  (u'file_lics_comment -> FILE_LICS_COMMENT error',u'file_lics_comment',2,'p_file_lics_comment_2','tagvalue.py',455),
+  (u'file_lics_info -> FILE_LICS_INFO file_lic_info_value',u'file_lics_info',2,'p_file_lics_info_1','tagvalue.py',461),
+  (u'file_lics_info -> FILE_LICS_INFO error',u'file_lics_info',2,'p_file_lics_info_2','tagvalue.py',472),
+  (u'file_lic_info_value -> NONE',u'file_lic_info_value',1,'p_file_lic_info_value_1','tagvalue.py',478),
+  (u'file_lic_info_value -> NO_ASSERT',u'file_lic_info_value',1,'p_file_lic_info_value_2','tagvalue.py',482),
+  (u'file_lic_info_value -> LINE',u'file_lic_info_value',1,'p_file_lic_info_value_3','tagvalue.py',487),
+  (u'conc_license -> NO_ASSERT',u'conc_license',1,'p_conc_license_1','tagvalue.py',495),
+  (u'conc_license -> NONE',u'conc_license',1,'p_conc_license_2','tagvalue.py',499),
+  (u'conc_license -> LINE',u'conc_license',1,'p_conc_license_3','tagvalue.py',503),
+  (u'file_name -> FILE_NAME LINE',u'file_name',2,'p_file_name_1','tagvalue.py',515),
+  (u'file_name -> FILE_NAME error',u'file_name',2,'p_file_name_2','tagvalue.py',526),
+  (u'file_comment -> FILE_COMMENT TEXT',u'file_comment',2,'p_file_comment_1','tagvalue.py',532),
+  (u'file_comment -> FILE_COMMENT error',u'file_comment',2,'p_file_comment_2','tagvalue.py',545),
+  (u'file_type -> FILE_TYPE file_type_value',u'file_type',2,'p_file_type_1','tagvalue.py',551),
+  (u'file_type -> FILE_TYPE error',u'file_type',2,'p_file_type_2','tagvalue.py',560),
+  (u'file_chksum -> FILE_CHKSUM CHKSUM',u'file_chksum',2,'p_file_chksum_1','tagvalue.py',566),
+  (u'file_chksum -> FILE_CHKSUM error',u'file_chksum',2,'p_file_chksum_2','tagvalue.py',579),
+  (u'file_conc -> FILE_LICS_CONC conc_license',u'file_conc',2,'p_file_conc_1','tagvalue.py',585),
+  (u'file_conc -> FILE_LICS_CONC error',u'file_conc',2,'p_file_conc_2','tagvalue.py',598),
+  (u'file_type_value -> OTHER',u'file_type_value',1,'p_file_type_value','tagvalue.py',604),
+  (u'file_type_value -> SOURCE',u'file_type_value',1,'p_file_type_value','tagvalue.py',605),
+  (u'file_type_value -> ARCHIVE',u'file_type_value',1,'p_file_type_value','tagvalue.py',606),
+  (u'file_type_value -> BINARY',u'file_type_value',1,'p_file_type_value','tagvalue.py',607),
+  (u'pkg_desc -> PKG_DESC TEXT',u'pkg_desc',2,'p_pkg_desc_1','tagvalue.py',615),
+  (u'pkg_desc -> PKG_DESC error',u'pkg_desc',2,'p_pkg_desc_2','tagvalue.py',628),
+  (u'pkg_summary -> PKG_SUM TEXT',u'pkg_summary',2,'p_pkg_summary_1','tagvalue.py',634),
+  (u'pkg_summary -> PKG_SUM error',u'pkg_summary',2,'p_pkg_summary_2','tagvalue.py',647),
+  (u'pkg_cr_text -> PKG_CPY_TEXT pkg_cr_text_value',u'pkg_cr_text',2,'p_pkg_cr_text_1','tagvalue.py',653),
+  (u'pkg_cr_text -> PKG_CPY_TEXT error',u'pkg_cr_text',2,'p_pkg_cr_text_2','tagvalue.py',662),
+  (u'pkg_cr_text_value -> TEXT',u'pkg_cr_text_value',1,'p_pkg_cr_text_value_1','tagvalue.py',668),
+  (u'pkg_cr_text_value -> NONE',u'pkg_cr_text_value',1,'p_pkg_cr_text_value_2','tagvalue.py',675),
+  (u'pkg_cr_text_value -> NO_ASSERT',u'pkg_cr_text_value',1,'p_pkg_cr_text_value_3','tagvalue.py',679),
+  (u'pkg_lic_comment -> PKG_LICS_COMMENT TEXT',u'pkg_lic_comment',2,'p_pkg_lic_comment_1','tagvalue.py',683),
+  (u'pkg_lic_comment -> PKG_LICS_COMMENT error',u'pkg_lic_comment',2,'p_pkg_lic_comment_2','tagvalue.py',696),
+  (u'pkg_lic_decl -> PKG_LICS_DECL conc_license',u'pkg_lic_decl',2,'p_pkg_lic_decl_1','tagvalue.py',702),
+  (u'pkg_lic_decl -> PKG_LICS_DECL error',u'pkg_lic_decl',2,'p_pkg_lic_decl_2','tagvalue.py',715),
+  (u'pkg_lic_ff -> PKG_LICS_FFILE pkg_lic_ff_value',u'pkg_lic_ff',2,'p_pkg_lic_ff_1','tagvalue.py',721),
+  (u'pkg_lic_ff_value -> NONE',u'pkg_lic_ff_value',1,'p_pkg_lic_ff_value_1','tagvalue.py',732),
+  (u'pkg_lic_ff_value -> NO_ASSERT',u'pkg_lic_ff_value',1,'p_pkg_lic_ff_value_2','tagvalue.py',736),
+  (u'pkg_lic_ff_value -> LINE',u'pkg_lic_ff_value',1,'p_pkg_lic_ff_value_3','tagvalue.py',740),
+  (u'pkg_lic_ff -> PKG_LICS_FFILE error',u'pkg_lic_ff',2,'p_pkg_lic_ff_2','tagvalue.py',748),
+  (u'pkg_lic_conc -> PKG_LICS_CONC conc_license',u'pkg_lic_conc',2,'p_pkg_lic_conc_1','tagvalue.py',754),
+  (u'pkg_lic_conc -> PKG_LICS_CONC error',u'pkg_lic_conc',2,'p_pkg_lic_conc_2','tagvalue.py',767),
+  (u'pkg_src_info -> PKG_SRC_INFO TEXT',u'pkg_src_info',2,'p_pkg_src_info_1','tagvalue.py',773),
+  (u'pkg_src_info -> PKG_SRC_INFO error',u'pkg_src_info',2,'p_pkg_src_info_2','tagvalue.py',786),
+  (u'pkg_chksum -> PKG_CHKSUM CHKSUM',u'pkg_chksum',2,'p_pkg_chksum_1','tagvalue.py',792),
+  (u'pkg_chksum -> PKG_CHKSUM error',u'pkg_chksum',2,'p_pkg_chksum_2','tagvalue.py',805),
+  (u'pkg_verif -> PKG_VERF_CODE LINE',u'pkg_verif',2,'p_pkg_verif_1','tagvalue.py',811),
+  (u'pkg_verif -> PKG_VERF_CODE error',u'pkg_verif',2,'p_pkg_verif_2','tagvalue.py',828),
+  (u'pkg_home -> PKG_HOME pkg_home_value',u'pkg_home',2,'p_pkg_home_1','tagvalue.py',834),
+  (u'pkg_home -> PKG_HOME error',u'pkg_home',2,'p_pkg_home_2','tagvalue.py',843),
+  (u'pkg_home_value -> LINE',u'pkg_home_value',1,'p_pkg_home_value_1','tagvalue.py',849),
+  (u'pkg_home_value -> NONE',u'pkg_home_value',1,'p_pkg_home_value_2','tagvalue.py',856),
+  (u'pkg_home_value -> NO_ASSERT',u'pkg_home_value',1,'p_pkg_home_value_3','tagvalue.py',860),
+  (u'pkg_down_location -> PKG_DOWN pkg_down_value',u'pkg_down_location',2,'p_pkg_down_location_1','tagvalue.py',864),
+  (u'pkg_down_location -> PKG_DOWN error',u'pkg_down_location',2,'p_pkg_down_location_2','tagvalue.py',873),
+  (u'pkg_down_value -> LINE',u'pkg_down_value',1,'p_pkg_down_value_1','tagvalue.py',879),
+  (u'pkg_down_value -> NONE',u'pkg_down_value',1,'p_pkg_down_value_2','tagvalue.py',886),
+  (u'pkg_down_value -> NO_ASSERT',u'pkg_down_value',1,'p_pkg_down_value_3','tagvalue.py',890),
+  (u'pkg_orig -> PKG_ORIG pkg_supplier_values',u'pkg_orig',2,'p_pkg_orig_1','tagvalue.py',894),
+  (u'pkg_orig -> PKG_ORIG error',u'pkg_orig',2,'p_pkg_orig_2','tagvalue.py',907),
+  (u'pkg_supplier -> PKG_SUPPL pkg_supplier_values',u'pkg_supplier',2,'p_pkg_supplier_1','tagvalue.py',914),
+  (u'pkg_supplier -> PKG_SUPPL error',u'pkg_supplier',2,'p_pkg_supplier_2','tagvalue.py',927),
+  (u'pkg_supplier_values -> NO_ASSERT',u'pkg_supplier_values',1,'p_pkg_supplier_values_1','tagvalue.py',933),
+  (u'pkg_supplier_values -> entity',u'pkg_supplier_values',1,'p_pkg_supplier_values_2','tagvalue.py',937),
+  (u'pkg_file_name -> PKG_FILE_NAME LINE',u'pkg_file_name',2,'p_pkg_file_name','tagvalue.py',941),
+  (u'pkg_file_name -> PKG_FILE_NAME error',u'pkg_file_name',2,'p_pkg_file_name_1','tagvalue.py',954),
+  (u'package_version -> PKG_VERSION LINE',u'package_version',2,'p_package_version_1','tagvalue.py',960),
+  (u'package_version -> PKG_VERSION error',u'package_version',2,'p_package_version_2','tagvalue.py',973),
+  (u'package_name -> PKG_NAME LINE',u'package_name',2,'p_package_name','tagvalue.py',979),
+  (u'package_name -> PKG_NAME error',u'package_name',2,'p_package_name_1','tagvalue.py',990),
+  (u'reviewer -> REVIEWER entity',u'reviewer',2,'p_reviewer_1','tagvalue.py',996),
+  (u'reviewer -> REVIEWER error',u'reviewer',2,'p_reviewer_2','tagvalue.py',1000),
+  (u'review_date -> REVIEW_DATE DATE',u'review_date',2,'p_review_date_1','tagvalue.py',1006),
+  (u'review_date -> REVIEW_DATE error',u'review_date',2,'p_review_date_2','tagvalue.py',1019),
+  (u'review_comment -> REVIEW_COMMENT TEXT',u'review_comment',2,'p_review_comment_1','tagvalue.py',1025),
+  (u'review_comment -> REVIEW_COMMENT error',u'review_comment',2,'p_review_comment_2','tagvalue.py',1038),
+  (u'locs_list_ver -> LIC_LIST_VER LINE',u'locs_list_ver',2,'p_lics_list_ver_1','tagvalue.py',1044),
+  (u'locs_list_ver -> LIC_LIST_VER error',u'locs_list_ver',2,'p_lics_list_ver_2','tagvalue.py',1060),
+  (u'doc_comment -> DOC_COMMENT TEXT',u'doc_comment',2,'p_doc_comment_1','tagvalue.py',1066),
+  (u'doc_comment -> DOC_COMMENT error',u'doc_comment',2,'p_doc_comment_2','tagvalue.py',1077),
+  (u'data_lics -> DOC_LICENSE LINE',u'data_lics',2,'p_data_license_1','tagvalue.py',1083),
+  (u'data_lics -> DOC_LICENSE error',u'data_lics',2,'p_data_license_2','tagvalue.py',1098),
+  (u'spdx_version -> DOC_VERSION LINE',u'spdx_version',2,'p_spdx_version_1','tagvalue.py',1104),
+  (u'spdx_version -> DOC_VERSION error',u'spdx_version',2,'p_spdx_version_2','tagvalue.py',1123),
+  (u'creator_comment -> CREATOR_COMMENT TEXT',u'creator_comment',2,'p_creator_comment_1','tagvalue.py',1129),
+  (u'creator_comment -> CREATOR_COMMENT error',u'creator_comment',2,'p_creator_comment_2','tagvalue.py',1140),
+  (u'creator -> CREATOR entity',u'creator',2,'p_creator_1','tagvalue.py',1146),
+  (u'creator -> CREATOR error',u'creator',2,'p_creator_2','tagvalue.py',1150),
+  (u'created -> CREATED DATE',u'created',2,'p_created_1','tagvalue.py',1156),
+  (u'created -> CREATED error',u'created',2,'p_created_2','tagvalue.py',1167),
+  (u'entity -> TOOL_VALUE',u'entity',1,'p_entity_1','tagvalue.py',1173),
+  (u'entity -> ORG_VALUE',u'entity',1,'p_entity_2','tagvalue.py',1188),
+  (u'entity -> PERSON_VALUE',u'entity',1,'p_entity_3','tagvalue.py',1203),
+]
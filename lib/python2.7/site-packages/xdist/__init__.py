@@ -0,0 +1,3 @@
+from xdist._version import version as __version__
+
+__all__ = ['__version__']
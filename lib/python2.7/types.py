@@ -0,0 +1 @@
+/root/.pyenv/versions/2.7.18/lib/python2.7/types.py
\ No newline at end of file
@@ -187,12 +187,42 @@ def get_last_modified_date(location):
     return yyyymmdd
 
 
+@memoize
+def counts(location):
+    """
+    Return a tuple of (file count, size in bytes) for a single file or the
+    cumulative (file count, size in bytes) for a directory tree at `location`.
+
+    Both values are computed in a single walk of the tree such that getting
+    the file count and the size of the same directory does not list and stat
+    this tree twice.
+
+    Only regular files and directories have a count. The counts for a
+    directory are the recursive sums of the directory file and directory
+    descendants.
+
+    Any other file type such as a special file or link has a zero count and
+    size. Does not follow links.
+    """
+    if is_file(location):
+        return 1, os.path.getsize(location)
+
+    file_count = 0
+    size = 0
+    if is_dir(location):
+        for p in os.listdir(location):
+            child_count, child_size = counts(os.path.join(location, p))
+            file_count += child_count
+            size += child_size
+    return file_count, size
+
+
 counting_functions = {
-    'file_count': lambda _: 1,
-    'file_size': os.path.getsize,
+    'file_count': lambda location: counts(location)[0],
+    'file_size': lambda location: counts(location)[1],
 }
 
-@memoize
+
 def counter(location, counting_function):
     """
     Return a count for a single file or a cumulative count for a directory
@@ -200,27 +230,12 @@ def counter(location, counting_function):
 
     Get a callable from the counting_functions registry using the
     `counting_function` string. Call this callable with a `location` argument
-    to determine the count value for a single file. This allow memoization
-    with hashable arguments.
-
-    Only regular files and directories have a count. The count for a directory
-    is the recursive count sum of the directory file and directory
-    descendants.
-
-    Any other file type such as a special file or link has a zero size. Does
-    not follow links.
+    to determine the count value for a file or directory. The underlying
+    counts are memoized such that each tree is walked only once for all
+    counting functions.
     """
-    if not (is_file(location) or is_dir(location)):
-        return 0
-
-    count = 0
-    if is_file(location):
-        count_fun = counting_functions[counting_function]
-        return count_fun(location)
-    elif is_dir(location):
-        count += sum(counter(os.path.join(location, p), counting_function)
-                     for p in os.listdir(location))
-    return count
+    count_fun = counting_functions[counting_function]
+    return count_fun(location)
 
 
 def get_file_count(location):
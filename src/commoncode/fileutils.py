@@ -408,28 +408,45 @@ def walk(location, ignored=ignore_nothing):
 
     if filetype.is_file(location) :
         yield parent_directory(location), [], [file_name(location)]
+        return
+
+    if not filetype.is_dir(location):
+        return
 
-    elif filetype.is_dir(location):
+    # walk with an explicit stack of directories rather than with nested
+    # recursive generators: sub-directories are checked for ignores only once
+    # when listed in their parent.
+    stack = [location]
+    while stack:
+        top = stack.pop()
         dirs = []
         files = []
+        prefix = _join_prefix(top)
         # TODO: consider using scandir
-        for name in os.listdir(location):
-            loc = os.path.join(location, name)
-            if filetype.is_special(loc) or ignored(loc):
+        for name in os.listdir(top):
+            loc = prefix + name
+            # a single lstat is enough to tell files and directories from
+            # symlinks and special files which are always ignored
+            try:
+                mode = os.lstat(loc).st_mode
+            except OSError:
+                continue
+            if stat.S_ISDIR(mode):
+                names = dirs
+            elif stat.S_ISREG(mode):
+                names = files
+            else:
+                continue
+            if ignored(loc):
                 if TRACE:
                     ign = ignored(loc)
                     logger_debug('walk: ignored:', loc, ign)
                 continue
-            # special files and symlinks are always ignored
-            if filetype.is_dir(loc):
-                dirs.append(name)
-            elif filetype.is_file(loc):
-                files.append(name)
-        yield location, dirs, files
+            names.append(name)
+        yield top, dirs, files
 
-        for dr in dirs:
-            for tripple in walk(os.path.join(location, dr), ignored):
-                yield tripple
+        # push in reverse to walk sub-directories in their listed order
+        stack.extend(prefix + dr for dr in reversed(dirs))
 
 
 def file_iter(location, ignored=ignore_nothing):
@@ -476,12 +493,26 @@ def resource_iter(location, ignored=ignore_nothing, with_files=True, with_dirs=T
     if on_linux:
         location = path_to_bytes(location)
     for top, dirs, files in walk(location, ignored):
+        prefix = _join_prefix(top)
         if with_files:
             for f in files:
-                yield os.path.join(top, f)
+                yield prefix + f
         if with_dirs:
             for d in dirs:
-                yield os.path.join(top, d)
+                yield prefix + d
+
+
+def _join_prefix(location):
+    """
+    Return a prefix string for `location` such that `prefix + name` is the same
+    as `os.path.join(location, name)` for a plain `name` such as returned by
+    os.listdir. Used to avoid calling os.path.join in walk loops.
+    """
+    if location.endswith(os.sep) or (os.altsep and location.endswith(os.altsep)):
+        return location
+    return location + os.sep
+
+
 #
 # COPY
 #
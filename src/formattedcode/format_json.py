@@ -58,7 +58,7 @@ def _write_json(files_count, version, notice, scanned_files, options, output_fil
         ('scancode_version', version),
         ('scancode_options', options),
         ('files_count', files_count),
-        ('files', scanned_files),
+        ('files', []),
     ])
     kwargs = dict(iterable_as_array=True, encoding='utf-8')
     if pretty:
@@ -66,6 +66,40 @@ def _write_json(files_count, version, notice, scanned_files, options, output_fil
     else:
         kwargs['separators'] = (',', ':',)
 
+    # Stream the JSON output one scanned file at a time rather than building the
+    # whole JSON string in memory: the scanned files are lazily loaded from the
+    # scan cache. Each file is serialized in one shot with JSONEncoder.encode such
+    # that the fast C encoder is used: the header with an empty "files" list is
+    # serialized first and its closing "[]" and braces are replaced by the
+    # scanned files.
     # FIXME: Why do we wrap the output in unicode? Test output when we do not wrap the output in unicode
-    output_file.write(unicode(simplejson.dumps(scan, **kwargs)))
+    encoder = simplejson.JSONEncoder(**kwargs)
+    header = encoder.encode(scan)
+    if pretty:
+        closing = '[]\n}'
+        file_start = '\n' + 4 * ' '
+        files_end = '\n' + 2 * ' ' + ']\n}'
+    else:
+        closing = '[]}'
+        file_start = ''
+        files_end = ']}'
+    assert header.endswith(closing)
+    output_file.write(unicode(header[:-len(closing)]))
+
+    output_file.write('[')
+    separator = ''
+    for scanned_file in scanned_files:
+        scanned = encoder.encode(scanned_file)
+        if pretty:
+            # indent the scanned file at the "files" list nesting level. JSON
+            # strings never contain raw newlines so this is safe.
+            scanned = scanned.replace('\n', file_start)
+        output_file.write(unicode(separator + file_start + scanned))
+        separator = ','
+
+    if separator:
+        output_file.write(files_end)
+    else:
+        # no scanned files: keep the empty "files" list as-is
+        output_file.write(closing[1:])
     output_file.write('\n')
@@ -43,11 +43,21 @@ Note: this API is unstable and still evolving.
 class Resource(object):
     """
     Store scanned details for a single resource (file or a directory)
-    such as infos and path
+    such as infos and path. `scans_cache` is a scan cache instance shared
+    by all the resources of a scan.
     """
-
-    def __init__(self, scan_cache_class, abs_path, base_is_dir, len_base_path):
-        self.scan_cache_class = scan_cache_class()
+    # use slots: there is one Resource per scanned file or directory
+    __slots__ = (
+        'scans_cache',
+        'is_cached',
+        'abs_path',
+        'base_is_dir',
+        'rel_path',
+        'infos',
+    )
+
+    def __init__(self, scans_cache, abs_path, base_is_dir, len_base_path):
+        self.scans_cache = scans_cache
         self.is_cached = False
         self.abs_path = abs_path
         self.base_is_dir = base_is_dir
@@ -63,13 +73,13 @@ class Resource(object):
         Cache file info and set `is_cached` to True if already cached or false otherwise.
         """
         self.infos.update(infos)
-        self.is_cached = self.scan_cache_class.put_info(self.rel_path, self.infos)
+        self.is_cached = self.scans_cache.put_info(self.rel_path, self.infos)
 
     def get_info(self):
         """
         Retrieve info from cache.
         """
-        return self.scan_cache_class.get_info(self.rel_path)
+        return self.scans_cache.get_info(self.rel_path)
 
 
 def extract_archives(location, recurse=True):
@@ -220,20 +230,20 @@ def get_file_infos(location):
 
     infos['type'] = filetype.get_type(location, short=False)
     name = fileutils.file_name(location)
+    if on_linux:
+        # decode the name once: the base name and extension are split from it
+        name = path_to_unicode(name)
     if is_file:
-        base_name, extension = fileutils.splitext(location)
+        # a bare name has no path separator: force posix such that a name
+        # with a backslash is not mistaken for a Windows path
+        base_name, extension = fileutils.splitext(name, force_posix=True)
     else:
         base_name = name
         extension = ''
 
-    if on_linux:
-        infos['name'] = path_to_unicode(name)
-        infos['base_name'] = path_to_unicode(base_name)
-        infos['extension'] = path_to_unicode(extension)
-    else:
-        infos['name'] = name
-        infos['base_name'] = base_name
-        infos['extension'] = extension
+    infos['name'] = name
+    infos['base_name'] = base_name
+    infos['extension'] = extension
 
     infos['date'] = is_file and filetype.get_last_modified_date(location) or None
     infos['size'] = T.size
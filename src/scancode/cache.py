@@ -28,6 +28,7 @@ from __future__ import unicode_literals
 
 import codecs
 from collections import OrderedDict
+import errno
 from functools import partial
 import json
 from hashlib import sha1
@@ -110,7 +111,7 @@ def info_keys(path, seed=None):
     For example:
     >>> expected = 'fb87db2bb28e9501ac7fdc4812782118f4c94a0f'
     >>> assert expected == sha1('/w421/scancode-toolkit2').hexdigest()
-    >>> expected = ('f', 'b', '87db2bb28e9501ac7fdc4812782118f4c94a0f')
+    >>> expected = ('fb', '8', '7db2bb28e9501ac7fdc4812782118f4c94a0f')
     >>> assert expected == info_keys('/w421/scancode-toolkit2')
     """
     # ensure that we always pass bytes to the hash function
@@ -143,26 +144,29 @@ def keys_from_hash(hexdigest):
     """
     Return a cache keys triple for a hash hexdigest string.
 
-    NOTE: since we use the first character and next two characters as directories, we
-    create at most 16 dir at the first level and 16 dir at the second level for each
-    first level directory for a maximum total of 16*16 = 256 directories. For a
-    million files we would have about 4000 files per directory on average with this
-    scheme which should keep most file systems happy and avoid some performance
-    issues when there are too many files in a single directory.
+    NOTE: since we use the first two characters and the next character as
+    directories, we create at most 256 dir at the first level and 16 dir at the
+    second level for each first level directory for a maximum total of 256*16 =
+    4096 directories. For a million files we would have about 250 files per
+    directory on average with this scheme which should keep most file systems
+    happy and avoid some performance issues when there are too many files in a
+    single directory, while small scans do not create a directory per file. The
+    file name is the rest of the hexdigest.
 
     For example:
-    >>> expected = ('f', 'b', '87db2bb28e9501ac7fdc4812782118f4c94a0f')
+    >>> expected = ('fb', '8', '7db2bb28e9501ac7fdc4812782118f4c94a0f')
     >>> assert expected == keys_from_hash('fb87db2bb28e9501ac7fdc4812782118f4c94a0f')
     """
     if on_linux:
         hexdigest = bytes(hexdigest)
-    return hexdigest[0], hexdigest[1], hexdigest[2:]
+    return hexdigest[:2], hexdigest[2:3], hexdigest[3:]
 
 
 def paths_from_keys(base_path, keys):
     """
     Return a tuple of (parent dir path, filename) for a cache entry built from a cache
-    keys triple and a base_directory. Ensure that the parent directory exist.
+    keys triple and a base_directory. The parent directory may not exist yet: it is
+    only created when a cache entry is written.
     """
     if on_linux:
         keys = [path_to_bytes(k) for k in keys]
@@ -173,7 +177,6 @@ def paths_from_keys(base_path, keys):
 
     dir1, dir2, file_name = keys
     parent = os.path.join(base_path, dir1, dir2)
-    fileutils.create_dir(parent)
     return parent, file_name
 
 
@@ -235,8 +238,9 @@ class ScanFileCache(object):
         in file_info has already been scanned or False otherwise.
         """
         info_path = self.get_cached_info_path(path)
-        with codecs.open(info_path, 'wb', encoding='utf-8') as cached_infos:
-            json.dump(file_info, cached_infos, check_circular=False)
+        fileutils.create_dir(posixpath.dirname(info_path))
+        with open(info_path, 'wb') as cached_infos:
+            cached_infos.write(json.dumps(file_info, check_circular=False))
         scan_path = self.get_cached_scan_path(path, file_info)
         is_scan_cached = os.path.exists(scan_path)
         if TRACE:
@@ -249,9 +253,15 @@ class ScanFileCache(object):
         Return None on failure to find the info in the cache.
         """
         info_path = self.get_cached_info_path(path)
-        if os.path.exists(info_path):
-            with codecs.open(info_path, 'r', encoding='utf-8') as ci:
-                return json.load(ci, object_pairs_hook=OrderedDict)
+        try:
+            with open(info_path, 'rb') as ci:
+                cached_info = ci.read()
+        except IOError as e:
+            # open and catch rather than check if the file exists first
+            if e.errno == errno.ENOENT:
+                return
+            raise
+        return json.loads(cached_info, object_pairs_hook=OrderedDict)
 
     def get_cached_scan_path(self, path, file_info):
         """
@@ -267,8 +277,9 @@ class ScanFileCache(object):
         """
         scan_path = self.get_cached_scan_path(path, file_info)
         if not os.path.exists(scan_path):
-            with codecs.open(scan_path, 'wb', encoding='utf-8') as cached_scan:
-                json.dump(scan_result, cached_scan, check_circular=False)
+            fileutils.create_dir(posixpath.dirname(scan_path))
+            with open(scan_path, 'wb') as cached_scan:
+                cached_scan.write(json.dumps(scan_result, check_circular=False))
         if TRACE:
             logger_debug('put_scan:', 'scan_path:', scan_path, 'file_info:', file_info, 'scan_result:', scan_result, '\n')
 
@@ -278,9 +289,15 @@ class ScanFileCache(object):
         Return None on failure to find the scan results in the cache.
         """
         scan_path = self.get_cached_scan_path(path, file_info)
-        if os.path.exists(scan_path):
-            with codecs.open(scan_path, 'r', encoding='utf-8') as cached_scan:
-                return json.load(cached_scan, object_pairs_hook=OrderedDict)
+        try:
+            with open(scan_path, 'rb') as cached_scan:
+                scan_result = cached_scan.read()
+        except IOError as e:
+            # open and catch rather than check if the file exists first
+            if e.errno == errno.ENOENT:
+                return
+            raise
+        return json.loads(scan_result, object_pairs_hook=OrderedDict)
 
     def iterate(self, scan_names, root_dir=None, paths_subset=tuple()):
         """
@@ -302,6 +319,10 @@ class ScanFileCache(object):
             log_opener = partial(codecs.open, self.cache_files_log, 'rb', encoding='utf-8')
         EOL = b'\n' if on_linux else '\n'
 
+        if root_dir and on_linux:
+            # must be unicode
+            root_dir = path_to_unicode(root_dir)
+
         with log_opener() as cached_files:
             # iterate paths, one by line
             for file_log in cached_files:
@@ -317,9 +338,6 @@ class ScanFileCache(object):
                     unicode_path = path
 
                 if root_dir:
-                    # must be unicode
-                    if on_linux:
-                        root_dir = path_to_unicode(root_dir)
                     rooted_path = posixpath.join(root_dir, unicode_path)
                 else:
                     rooted_path = unicode_path
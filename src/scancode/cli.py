@@ -592,7 +592,11 @@ def scan(input_path,
 
         logged_resources = _resource_logger(logfile_fd, resources)
 
-        scanit = partial(_scanit, scanners=scanners, scans_cache_class=scans_cache_class,
+        # note: "flag and function" expressions return the function if flag is True
+        # note: the order of the scans matters to show things in logical order
+        scanner_functions = OrderedDict(
+            (scan_name, flag and function) for scan_name, (flag, function) in scanners.items())
+        scanit = partial(_scanit, scanners=scanner_functions,
                          diag=diag, timeout=timeout, processes=processes)
 
         max_file_name_len = compute_fn_max_len()
@@ -736,19 +740,16 @@ def _resource_logger(logfile_fd, resources):
         yield resource
 
 
-def _scanit(resource, scanners, scans_cache_class, diag, timeout=DEFAULT_TIMEOUT, processes=1):
+def _scanit(resource, scanners, diag, timeout=DEFAULT_TIMEOUT, processes=1):
     """
     Run scans and cache results on disk. Return a tuple of (success, scanned relative
     path) where sucess is True on success, False on error. Note that this is really
     only a wrapper function used as an execution unit for parallel processing.
+    `scanners` is an ordered mapping of (scan name -> scan function or a false
+    value if this scan is not requested).
     """
     success = True
-    scans_cache = scans_cache_class()
-
-    # note: "flag and function" expressions return the function if flag is True
-    # note: the order of the scans matters to show things in logical order
-    scanner_functions = map(lambda t : t[0] and t[1], scanners.values())
-    scanners = OrderedDict(zip(scanners.keys(), scanner_functions))
+    scans_cache = resource.scans_cache
 
     if processes:
         interrupter = interruptible
@@ -756,7 +757,7 @@ def _scanit(resource, scanners, scans_cache_class, diag, timeout=DEFAULT_TIMEOUT
         # fake, non inteerrupting used for debugging when processes=0
         interrupter = fake_interruptible
 
-    if any(scanner_functions):
+    if any(scanners.values()):
         # Skip other scans if already cached
         # FIXME: ENSURE we only do this for files not directories
         if not resource.is_cached:
@@ -769,7 +770,8 @@ def _scanit(resource, scanners, scans_cache_class, diag, timeout=DEFAULT_TIMEOUT
                 # "scan" key is used for these errors
                 scan_result = {'scan_errors': [scan_result]}
 
-            scans_cache.put_scan(resource.rel_path, resource.get_info(), scan_result)
+            # use the infos already in memory rather than re-reading them from the cache
+            scans_cache.put_scan(resource.rel_path, resource.infos, scan_result)
 
             # do not report success if some other errors happened
             if scan_result.get('scan_errors'):
@@ -781,7 +783,7 @@ def _scanit(resource, scanners, scans_cache_class, diag, timeout=DEFAULT_TIMEOUT
 def build_ignorer(ignores, unignores):
     """
     Return a callable suitable for path ignores with OS-specific encoding
-    preset.
+    preset. Special files are not checked: fileutils.walk always skips these.
     """
     ignores = ignores or {}
     unignores = unignores or {}
@@ -791,7 +793,7 @@ def build_ignorer(ignores, unignores):
     else:
         ignores = {path_to_unicode(k): v for k, v in ignores.items()}
         unignores = {path_to_unicode(k): v for k, v in unignores.items()}
-    return partial(ignore.is_ignored, ignores=ignores, unignores=unignores)
+    return partial(ignore.is_ignored, ignores=ignores, unignores=unignores, skip_special=False)
 
 
 def resource_paths(base_path, diag, scans_cache_class, pre_scan_plugins=None):
@@ -802,6 +804,10 @@ def resource_paths(base_path, diag, scans_cache_class, pre_scan_plugins=None):
     absolute path is a native OS path.
     base_path-relative path is a POSIX path.
 
+    File infos are collected here in the main process: pre-scan plugins
+    receive Resources with their infos and the memoized directory counts are
+    computed only once for the whole tree.
+
     The relative path is guaranted to be unicode and may be URL-encoded and may not
     be suitable to address an actual file.
     """
@@ -823,8 +829,10 @@ def resource_paths(base_path, diag, scans_cache_class, pre_scan_plugins=None):
     ignorer = build_ignorer(ignores, unignores={})
     resources = fileutils.resource_iter(base_path, ignored=ignorer)
 
+    # the cache is stateless: share a single instance with all resources
+    scans_cache = scans_cache_class()
     for abs_path in resources:
-        resource = Resource(scans_cache_class, abs_path, base_is_dir, len_base_path)
+        resource = Resource(scans_cache, abs_path, base_is_dir, len_base_path)
         # always fetch infos and cache.
         resource.put_info(scan_infos(abs_path, diag=diag))
         if pre_scan_plugins:
@@ -26,6 +26,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+from collections import defaultdict
+from itertools import chain
 from os import path
 
 from plugincode.post_scan import post_scan_impl
@@ -39,30 +41,37 @@ def process_mark_source(active_scans, results):
     Has no effect unless the --info scan is requested.
     """
 
-    # FIXME: this is forcing all the scan results to be loaded in memory
-    # and defeats lazy loading from cache
-    results = list(results)
+    results = iter(results)
+    first = next(results, None)
+    if first is None:
+        return
 
     # FIXME: we should test for active scans instead, but "info" may not
     # be present for now. check if the first item has a file info.
-    has_file_info = 'type' in results[0]
+    has_file_info = 'type' in first
 
     if not has_file_info:
-        # just yield results untouched
+        # just stream results untouched, without loading them in memory
+        yield first
         for scanned_file in results:
             yield scanned_file
         return
 
-    # FIXME: this is an nested loop, looping twice on results
+    # FIXME: this is forcing all the scan results to be loaded in memory
+    # and defeats lazy loading from cache
+    results = list(chain([first], results))
+
+    # count the source files direct children of each directory in one pass
+    source_files_counts = defaultdict(int)
+    for scanned_file in results:
+        if scanned_file['is_source']:
+            source_files_counts[path.dirname(scanned_file['path'])] += 1
+
     # TODO: this may not recusrively roll up the is_source flag, as we
     # may not iterate bottom up.
     for scanned_file in results:
         if scanned_file['type'] == 'directory' and scanned_file['files_count'] > 0:
-            source_files_count = 0
-            for scanned_file2 in results:
-                if path.dirname(scanned_file2['path']) == scanned_file['path']:
-                    if scanned_file2['is_source']:
-                        source_files_count += 1
+            source_files_count = source_files_counts[scanned_file['path']]
             mark_source(source_files_count, scanned_file)
         yield scanned_file
 
@@ -172,13 +172,14 @@ def get_relative_path(path, len_base_path, base_is_dir):
     base path of `len_base_path` length where the base is a directory if
     `base_is_dir` True or a file otherwise.
     """
-    path = path_to_unicode(path)
     if base_is_dir:
         rel_path = path[len_base_path:]
     else:
         rel_path = fileutils.file_name(path)
 
-    return rel_path.lstrip('/')
+    # decode only the relative path: `len_base_path` is a length in the same
+    # string type as `path`, e.g. in bytes for a bytes path
+    return path_to_unicode(rel_path).lstrip('/')
 
 
 def fixed_width_file_name(path, max_length=25):
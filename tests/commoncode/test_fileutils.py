@@ -27,6 +27,7 @@ from __future__ import absolute_import, print_function
 import os
 from os.path import join
 from os.path import sep
+import sys
 from unittest.case import skipIf
 
 from commoncode import filetype
@@ -359,6 +360,17 @@ class TestFileUtils(FileBasedTesting):
         ]
         assert expected == result
 
+    @skipIf(not on_linux, 'Deep paths exceed the maximum path length on macOS and Windows.')
+    def test_fileutils_walk_can_walk_a_tree_deeper_than_the_recursion_limit(self):
+        test_dir = self.get_temp_dir()
+        depth = sys.getrecursionlimit() + 10
+        path = test_dir
+        for _ in range(depth):
+            path = join(path, 'd')
+            os.mkdir(path)
+        result = sum(1 for _ in fileutils.walk(test_dir))
+        assert depth + 1 == result
+
     def test_file_iter(self):
         test_dir = self.get_test_loc('fileutils/walk')
         base = self.get_test_loc('fileutils')
@@ -41,7 +41,7 @@ class TestCache(FileBasedTesting):
         test_file = self.get_test_loc('cache/package/package.json')
         from scancode import api
         package = api.get_package_infos(test_file)
-        file_info = dict(sha1='def')
+        file_info = dict(sha1='589c22335a381f122d129225f5c0ba3056ed5811')
 
         test_dir = self.get_temp_dir()
         cache = ScanFileCache(test_dir)
@@ -49,3 +49,10 @@ class TestCache(FileBasedTesting):
         cache.put_scan(path='abc', file_info=file_info, scan_result=package)
         assert file_info == cache.get_info(path='abc')
         assert package == cache.get_scan(path='abc', file_info=file_info)
+
+    def test_get_info_and_get_scan_return_none_if_not_cached(self):
+        file_info = dict(sha1='589c22335a381f122d129225f5c0ba3056ed5811')
+        test_dir = self.get_temp_dir()
+        cache = ScanFileCache(test_dir)
+        assert None == cache.get_info(path='abc')
+        assert None == cache.get_scan(path='abc', file_info=file_info)
@@ -71,3 +71,11 @@ End
         assert 'file/that' == utils.get_relative_path(path='/this/file/that', len_base_path=5, base_is_dir=True)
         assert 'that' == utils.get_relative_path(path='/this/file/that', len_base_path=10, base_is_dir=True)
         assert 'this/file/that' == utils.get_relative_path(path='/foo//this/file/that', len_base_path=4, base_is_dir=True)
+
+    def test_get_relative_path_with_non_ascii_bytes_base_path(self):
+        base_path = '/d\xe9j\xe0'.encode('utf-8')
+        path = base_path + b'/file/that'
+        result = utils.get_relative_path(path=path, len_base_path=len(base_path), base_is_dir=True)
+        assert 'file/that' == result
+        result = utils.get_relative_path(path=path, len_base_path=len(base_path), base_is_dir=False)
+        assert 'that' == result